@@ -22,20 +22,17 @@ class TechnicalAnalyzer:
 
     @staticmethod
     def calculate_rsi(closes: List[float], period: int = 14) -> float:
-        """Calculate RSI"""
+        """Calculate RSI (Wilder) — one pass, no gains/losses temp lists"""
         if len(closes) < period + 1:
             return 50.0
 
-        deltas = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
-
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        avg_gain, avg_loss = TechnicalAnalyzer._rsi_seed(closes, period)
+        prev = closes[period]
+        for close in closes[period + 1:]:
+            d = close - prev
+            prev = close
+            avg_gain = (avg_gain * (period - 1) + (d if d > 0 else 0)) / period
+            avg_loss = (avg_loss * (period - 1) + (-d if d < 0 else 0)) / period
 
         if avg_loss == 0:
             return 100.0
@@ -43,6 +40,41 @@ class TechnicalAnalyzer:
         rs = avg_gain / avg_loss
         return 100 - (100 / (1 + rs))
 
+    @staticmethod
+    def calculate_rsi_series(closes: List[float], period: int = 14) -> List[Optional[float]]:
+        """
+        Full Wilder RSI series aligned to closes — series[i] == calculate_rsi(closes[:i+1])
+        প্রথম `period` index None। প্রতি prefix-এ calculate_rsi() call (O(n²)) এর বদলে একটাই O(n) sweep।
+        """
+        if len(closes) < period + 1:
+            return [None] * len(closes)
+
+        avg_gain, avg_loss = TechnicalAnalyzer._rsi_seed(closes, period)
+        result: List[Optional[float]] = [None] * period
+        result.append(100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+
+        prev = closes[period]
+        for close in closes[period + 1:]:
+            d = close - prev
+            prev = close
+            avg_gain = (avg_gain * (period - 1) + (d if d > 0 else 0)) / period
+            avg_loss = (avg_loss * (period - 1) + (-d if d < 0 else 0)) / period
+            result.append(100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+
+        return result
+
+    @staticmethod
+    def _rsi_seed(closes: List[float], period: int) -> Tuple[float, float]:
+        """Simple-average gain/loss over the first `period` deltas (Wilder seed)"""
+        gain = loss = 0.0
+        for i in range(1, period + 1):
+            d = closes[i] - closes[i - 1]
+            if d > 0:
+                gain += d
+            else:
+                loss -= d
+        return gain / period, loss / period
+
     @staticmethod
     def calculate_ema(values: List[float], period: int) -> float:
         """Calculate single EMA value"""
@@ -57,6 +89,29 @@ class TechnicalAnalyzer:
             ema = value * k + ema * (1 - k)
         return ema
 
+    @staticmethod
+    def calculate_emas(values: List[float], periods: Tuple[int, ...]) -> Tuple[float, ...]:
+        """
+        Several EMAs over the same values in one sweep — প্রতিটা calculate_ema(values, p)
+        এর সমান (same SMA seed + update), কিন্তু list একবারই traverse হয়
+        """
+        if not values:
+            return tuple(0.0 for _ in periods)
+
+        n = len(values)
+        ks = [2.0 / (p + 1) for p in periods]
+        emas = [sum(values[:p]) / p if n >= p else sum(values) / n for p in periods]
+        live = [j for j, p in enumerate(periods) if n >= p]
+
+        for i in range(min((periods[j] for j in live), default=n), n):
+            value = values[i]
+            for j in live:
+                if i >= periods[j]:
+                    k = ks[j]
+                    emas[j] = value * k + emas[j] * (1 - k)
+
+        return tuple(emas)
+
     @staticmethod
     def calculate_ema_series(values: List[float], period: int) -> List[float]:
         """
@@ -105,28 +160,43 @@ class TechnicalAnalyzer:
         if len(closes) < slow + signal:
             return {"macd": 0.0, "signal": 0.0, "histogram": 0.0}
 
-        # Full EMA series calculate করো
-        ema_fast_series = TechnicalAnalyzer.calculate_ema_series(closes, fast)
-        ema_slow_series = TechnicalAnalyzer.calculate_ema_series(closes, slow)
-
-        # MACD line = fast EMA - slow EMA (valid points only)
-        macd_line_series = []
-        for i in range(len(closes)):
-            fast_val = ema_fast_series[i] if i < len(ema_fast_series) else None
-            slow_val = ema_slow_series[i] if i < len(ema_slow_series) else None
-            if fast_val is not None and slow_val is not None:
-                macd_line_series.append(fast_val - slow_val)
+        # Fused single sweep — fast/slow/signal EMA তিনটাই scalar state-এ;
+        # আগে দুটো full EMA series + MACD list + signal series আলাদা pass-এ বানানো হত
+        k_fast = 2.0 / (fast + 1)
+        k_slow = 2.0 / (slow + 1)
+        k_sig = 2.0 / (signal + 1)
+        warmup = max(fast, slow) - 1
+        ema_fast = ema_slow = 0.0
+        current_macd = current_signal = 0.0
+        n_macd = 0
+        sig_seed = 0.0
+
+        for i, value in enumerate(closes):
+            # Seed = SMA of first `period` values, তারপর recursive EMA
+            if i == fast - 1:
+                ema_fast = sum(closes[:fast]) / fast
+            elif i >= fast:
+                ema_fast = value * k_fast + ema_fast * (1 - k_fast)
+            if i == slow - 1:
+                ema_slow = sum(closes[:slow]) / slow
+            elif i >= slow:
+                ema_slow = value * k_slow + ema_slow * (1 - k_slow)
+            if i < warmup:
+                continue
 
-        if len(macd_line_series) < signal:
-            current_macd = macd_line_series[-1] if macd_line_series else 0.0
+            # MACD line valid — signal line = EMA(MACD, signal)
+            current_macd = ema_fast - ema_slow
+            n_macd += 1
+            if n_macd < signal:
+                sig_seed += current_macd
+            elif n_macd == signal:
+                current_signal = (sig_seed + current_macd) / signal
+            else:
+                current_signal = current_macd * k_sig + current_signal * (1 - k_sig)
+
+        if n_macd < signal:
             return {"macd": current_macd, "signal": current_macd, "histogram": 0.0}
 
-        # Signal line = EMA of MACD line series
-        signal_line_series = TechnicalAnalyzer.calculate_ema_series(macd_line_series, signal)
-
-        # Current values
-        current_macd = macd_line_series[-1]
-        current_signal = signal_line_series[-1] if signal_line_series[-1] is not None else current_macd
         histogram = current_macd - current_signal
 
         return {
@@ -171,24 +241,53 @@ class TechnicalAnalyzer:
         if len(ohlcv) < period + 1:
             return 0.0
 
-        tr_values = []
-        for i in range(1, len(ohlcv)):
-            high = float(ohlcv[i][2])
-            low = float(ohlcv[i][3])
-            prev_close = float(ohlcv[i-1][4])
-
+        # Streaming Wilder — tr_values list ছাড়া; seed = প্রথম `period` TR-এর SMA
+        atr = 0.0
+        prev_close = float(ohlcv[0][4])
+        for i, candle in enumerate(ohlcv[1:]):
+            high = float(candle[2])
+            low = float(candle[3])
             tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            tr_values.append(tr)
-
-        if not tr_values:
-            return 0.0
+            prev_close = float(candle[4])
 
-        atr = sum(tr_values[:period]) / period
-        for i in range(period, len(tr_values)):
-            atr = (atr * (period - 1) + tr_values[i]) / period
+            if i < period:
+                atr += tr
+                if i == period - 1:
+                    atr /= period
+            else:
+                atr = (atr * (period - 1) + tr) / period
 
         return atr
 
+    @staticmethod
+    def calculate_atr_series(ohlcv: List[List[float]], period: int = 14) -> List[float]:
+        """
+        ATR series aligned to ohlcv — series[i] == calculate_atr(ohlcv[:i+1])
+        প্রথম `period` index 0.0 (calculate_atr-এর insufficient-data value)।
+        """
+        result = [0.0] * min(len(ohlcv), period)
+        if len(ohlcv) < period + 1:
+            return result
+
+        atr = 0.0
+        prev_close = float(ohlcv[0][4])
+        for i, candle in enumerate(ohlcv[1:]):
+            high = float(candle[2])
+            low = float(candle[3])
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            prev_close = float(candle[4])
+
+            if i < period:
+                atr += tr
+                if i == period - 1:
+                    atr /= period
+                    result.append(atr)
+            else:
+                atr = (atr * (period - 1) + tr) / period
+                result.append(atr)
+
+        return result
+
     @staticmethod
     def calculate_adx(ohlcv: List[List[float]], period: int = 14) -> float:
         """
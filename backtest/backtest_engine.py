@@ -133,6 +133,8 @@ class BacktestEngine:
         self.structure = StructureDetector()
         self._signals_blocked = 0
         self.use_live_filters = use_live_filters
+        # run() চলাকালীন full-frame indicator series (atr, ema50, rsi) — index = bar
+        self._series: Optional[Tuple[List, List, List]] = None
 
         # Live filter pipeline (lazy loaded when use_live_filters=True)
         self._filter_orchestrator = None
@@ -174,10 +176,14 @@ class BacktestEngine:
         end_date: Optional[str] = None
     ) -> BacktestResult:
 
-        if start_date:
-            df = df[df.index >= start_date]
-        if end_date:
-            df = df[df.index <= end_date]
+        if start_date or end_date:
+            # Sorted DatetimeIndex-এ binary search → positional slice;
+            # আগে দুটো full boolean mask + filtered copy হত
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            lo = df.index.searchsorted(pd.Timestamp(start_date), side="left") if start_date else 0
+            hi = df.index.searchsorted(pd.Timestamp(end_date), side="right") if end_date else len(df)
+            df = df.iloc[lo:hi]
 
         if len(df) < 60:
             logger.warning("Insufficient data for backtest")
@@ -189,14 +195,38 @@ class BacktestEngine:
             f"{df.index[0].date()} → {df.index[-1].date()}"
         )
 
-        trades = []
         equity_curve = [self.initial_capital]
         self.capital = self.initial_capital
         self.peak_capital = self.initial_capital
         self._signals_blocked = 0
         ohlcv_list = self._df_to_ohlcv(df)
-        last_signal_idx = -COOLDOWN_CANDLES
 
+        # ATR/EMA50/RSI পুরো frame-এ একবারই O(n) — আগে প্রতি bar-এ
+        # ohlcv_list[:i+1] prefix-এর উপর নতুন করে (O(n²) per run)
+        closes_all = [c[4] for c in ohlcv_list]
+        self._series = (
+            self.analyzer.calculate_atr_series(ohlcv_list),
+            self.analyzer.calculate_ema_series(closes_all, EMA_TREND_PERIOD),
+            self.analyzer.calculate_rsi_series(closes_all),
+        )
+        try:
+            trades = self._run_bars(symbol, ohlcv_list, equity_curve)
+        finally:
+            self._series = None
+
+        result = self._calculate_statistics(trades, equity_curve)
+        logger.info(
+            f"Done: {result.total_trades} trades | WR={result.win_rate:.1f}% | "
+            f"PF={result.profit_factor:.2f} | Return={result.total_pnl_percent:+.2f}% | "
+            f"Expectancy={result.expectancy:+.3f}%/trade | "
+            f"Blocked={self._signals_blocked}"
+        )
+        return result
+
+    def _run_bars(self, symbol: str, ohlcv_list: List, equity_curve: List[float]) -> List:
+        """Bar-by-bar simulation loop — equity_curve in-place append, trades return"""
+        trades = []
+        last_signal_idx = -COOLDOWN_CANDLES
         for i in range(MIN_STRUCTURE_LOOKBACK + 20, len(ohlcv_list) - 1):
             if i - last_signal_idx < COOLDOWN_CANDLES:
                 equity_curve.append(self.capital)
@@ -208,7 +238,9 @@ class BacktestEngine:
             else:
                 signal = self._generate_signal(symbol, ohlcv_list[:i + 1])
             if signal:
-                trade = self._execute_trade(signal, ohlcv_list[i + 1:])
+                # _execute_trade শুধু প্রথম MAX_HOLD_CANDLES row পড়ে — বাকি
+                # history-র পুরো tail copy (per signal O(n)) বাদ
+                trade = self._execute_trade(signal, ohlcv_list[i + 1:i + 1 + MAX_HOLD_CANDLES])
                 if trade:
                     trades.append(trade)
                     self.capital += trade["pnl_usd"]
@@ -230,14 +262,7 @@ class BacktestEngine:
 
             equity_curve.append(self.capital)
 
-        result = self._calculate_statistics(trades, equity_curve)
-        logger.info(
-            f"Done: {result.total_trades} trades | WR={result.win_rate:.1f}% | "
-            f"PF={result.profit_factor:.2f} | Return={result.total_pnl_percent:+.2f}% | "
-            f"Expectancy={result.expectancy:+.3f}%/trade | "
-            f"Blocked={self._signals_blocked}"
-        )
-        return result
+        return trades
 
     # ── Signal Generation (FIXED) ─────────────────────────────────────
 
@@ -259,16 +284,24 @@ class BacktestEngine:
 
         current    = ohlcv[-1]
         close      = float(current[4])
-        atr        = self.analyzer.calculate_atr(ohlcv)
+        n          = len(ohlcv)
+        series     = self._series
+        if series is not None and n <= len(series[0]):
+            # run()-এর precomputed series — ohlcv এখানে সবসময় frame-এর prefix
+            atr, ema50, rsi = series[0][n - 1], series[1][n - 1], series[2][n - 1]
+        else:
+            closes = [float(c[4]) for c in ohlcv]
+            atr    = self.analyzer.calculate_atr(ohlcv)
+            ema50  = self.analyzer.calculate_ema(closes, EMA_TREND_PERIOD) if n >= EMA_TREND_PERIOD else None
+            rsi    = self.analyzer.calculate_rsi(closes) if n >= 14 else None
         if atr <= 0:
             return None
 
-        closes     = [float(c[4]) for c in ohlcv]
-        volumes    = [float(c[5]) for c in ohlcv]
+        # Volume gate শুধু শেষ 21 candle দেখে
+        volumes    = [float(c[5]) for c in ohlcv[-21:]]
 
         # ── Gate 1: Regime filter (EMA50 trend) ──────────────────────
-        if len(closes) >= EMA_TREND_PERIOD:
-            ema50 = self.analyzer.calculate_ema(closes, EMA_TREND_PERIOD)
+        if n >= EMA_TREND_PERIOD:
             ema_trend = "BULL" if close > ema50 * 1.002 else (
                 "BEAR" if close < ema50 * 0.998 else "NEUTRAL"
             )
@@ -310,8 +343,9 @@ class BacktestEngine:
             return None
 
         # ── Gate 3: RSI momentum check ────────────────────────────────
-        if len(closes) >= 14:
-            rsi = self.analyzer.calculate_rsi(closes)
+        if n >= 14:
+            if rsi is None:
+                rsi = 50.0  # calculate_rsi-এর insufficient-data value (n == 14)
             # Don't buy overbought, don't short oversold
             if direction == "LONG" and rsi > 70:
                 self._signals_blocked += 1
@@ -737,14 +771,10 @@ class BacktestEngine:
         )
 
     def _df_to_ohlcv(self, df: pd.DataFrame) -> List:
-        return [
-            [
-                int(idx.timestamp() * 1000),
-                float(r["open"]), float(r["high"]),
-                float(r["low"]),  float(r["close"]), float(r["volume"])
-            ]
-            for idx, r in df.iterrows()
-        ]
+        # Column block → list একবারে; iterrows()-এর per-row Series build নেই
+        ts = df.index.values.astype("datetime64[ms]").astype(np.int64).tolist()
+        rows = df[["open", "high", "low", "close", "volume"]].to_numpy(dtype=np.float64).tolist()
+        return [[t, *r] for t, r in zip(ts, rows)]
 
     def _empty_result(self) -> BacktestResult:
         return BacktestResult(
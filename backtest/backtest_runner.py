@@ -12,18 +12,81 @@ ALSO FIXED:
   - Walk-forward minimum: 1000 candles (was 5760 — impossible to meet)
   - async ccxt close() added (Unclosed client session warning fix)
   - Trade count normalized by actual days (not candle count)
+
+HISTORY CACHE:
+  Klines backtest_cache/<SYMBOL>_<tf>.npy-তে binary (N, 6) float64 হিসেবে থাকে।
+  পরের run-এ শুধু last cached candle-এর পর থেকে top-up fetch — CSV text
+  parse/date inference নেই, পুরো history আবার download হয় না।
 """
 
 import asyncio
 import logging
+import os
+import time
+import numpy as np
 import pandas as pd
 from typing import Optional, List
 from datetime import datetime, timedelta
 
 import config
+from data.cache_manager import OHLCV_DTYPE
 
 logger = logging.getLogger(__name__)
 
+HISTORY_CACHE_DIR = "backtest_cache"
+
+
+def _history_path(symbol: str, timeframe: str) -> str:
+    return os.path.join(HISTORY_CACHE_DIR, f"{symbol.replace('/', '')}_{timeframe}.npy")
+
+
+def load_history(symbol: str, timeframe: str, mmap: bool = True) -> Optional[np.ndarray]:
+    """
+    Cached (N, 6) kline array, বা None (না থাকলে / corrupt হলে)।
+    mmap=True → read-only memory map: পুরো file RAM-এ copy হয় না, slice করা
+    window-এর page-গুলোই শুধু fault-in হয়; OS page cache run-গুলোর মধ্যে shared।
+    """
+    path = _history_path(symbol, timeframe)
+    if not os.path.exists(path):
+        return None
+    try:
+        arr = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    except (OSError, ValueError) as e:
+        logger.warning(f"History cache unreadable ({path}): {e}")
+        return None
+    if arr.ndim != 2 or arr.shape[1] != 6:
+        return None
+    return arr
+
+
+def save_history(symbol: str, timeframe: str, arr: np.ndarray):
+    """Atomic write — tmp file তারপর os.replace, আধা-লেখা cache কখনো পড়া হয় না"""
+    os.makedirs(HISTORY_CACHE_DIR, exist_ok=True)
+    path = _history_path(symbol, timeframe)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, np.ascontiguousarray(arr, dtype=OHLCV_DTYPE), allow_pickle=False)
+    os.replace(tmp, path)
+
+
+def _timeframe_ms(timeframe: str) -> int:
+    """"15m" → 900_000 ms"""
+    units = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+    return int(timeframe[:-1]) * units[timeframe[-1]]
+
+
+def closed_rows(arr: np.ndarray, timeframe: str, now_ms: int) -> np.ndarray:
+    """শুধু close time ≤ now rows — শেষের forming candle cache-এ যায় না (পরে correct হত না)"""
+    return arr[:int(np.searchsorted(arr[:, 0], now_ms - _timeframe_ms(timeframe), side="right"))]
+
+
+def history_window(arr: np.ndarray, start_ms: int, end_ms: Optional[int] = None) -> np.ndarray:
+    """[start_ms, end_ms) rows — sorted timestamp column-এ binary search, memmap হলে zero-copy view"""
+    ts = arr[:, 0]
+    lo = int(np.searchsorted(ts, start_ms))
+    hi = len(arr) if end_ms is None else int(np.searchsorted(ts, end_ms))
+    return arr[lo:hi]
+
 
 class BacktestRunner:
 
@@ -60,19 +123,15 @@ class BacktestRunner:
 
         # ── Step 2: Fetch historical data (PAGINATED) ────────────────
         logger.info(f"Fetching historical data for {symbol}...")
-        candles = []
+        candles = None
         try:
             # FIXED: use fetch_historical_data() for paginated fetch
             # This gets the actual days requested, not just 1000 candles
-            candles = await self.rest_client.fetch_historical_data(
-                symbol=symbol,
-                timeframe=timeframe,
-                days=days,
-            )
+            candles = await self._fetch_with_cache(symbol, timeframe, days)
 
-            if not candles or len(candles) < 60:
+            if len(candles) < 60:
                 msg = (
-                    f"Insufficient data: got {len(candles) if candles else 0} candles. "
+                    f"Insufficient data: got {len(candles)} candles. "
                     f"Need at least 60."
                 )
                 logger.error(msg)
@@ -88,16 +147,23 @@ class BacktestRunner:
 
         # ── Step 3: Convert to DataFrame ─────────────────────────────
         try:
+            # (N, 6) float64 array — column slice থেকে সরাসরি, per-row dtype inference নেই
             df = pd.DataFrame(
-                candles,
-                columns=["timestamp", "open", "high", "low", "close", "volume"]
+                {
+                    "open": candles[:, 1],
+                    "high": candles[:, 2],
+                    "low": candles[:, 3],
+                    "close": candles[:, 4],
+                    "volume": candles[:, 5],
+                },
+                # int64 epoch-ms array → DatetimeIndex সরাসরি (একটাই allocation)
+                index=pd.to_datetime(candles[:, 0].astype("int64"), unit="ms").rename("timestamp"),
             )
-            df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-            df.set_index("timestamp", inplace=True)
-            for col in ["open", "high", "low", "close", "volume"]:
-                df[col] = df[col].astype(float)
-            df = df[~df.index.duplicated(keep="last")]
-            df.sort_index(inplace=True)
+            # Paginated/cached history সাধারণত already strictly increasing —
+            # তখন dedupe mask + sort copy দুটোই skip
+            if not (df.index.is_monotonic_increasing and df.index.is_unique):
+                df = df[~df.index.duplicated(keep="last")]
+                df.sort_index(inplace=True)
 
             logger.info(
                 f"Data range: {df.index[0]} to {df.index[-1]} "
@@ -168,6 +234,46 @@ class BacktestRunner:
             "reports":       file_paths,
         }
 
+    async def _fetch_with_cache(self, symbol: str, timeframe: str, days: int) -> np.ndarray:
+        """
+        Local history cache + REST top-up → last `days`-এর (N, 6) array।
+        Cache যথেষ্ট পুরনো পর্যন্ত না গেলে full paginated fetch।
+        """
+        now_ms = int(time.time() * 1000)
+        start_ms = now_ms - days * 86_400_000
+        cached = load_history(symbol, timeframe)
+        n_cached = 0
+
+        if cached is not None and len(cached) and cached[0, 0] <= start_ms:
+            fresh = await self.rest_client.fetch_historical_data(
+                symbol=symbol, timeframe=timeframe, since=int(cached[-1, 0]) + 1,
+            )
+            fresh = fresh[fresh[:, 0] > cached[-1, 0]]
+            logger.info(f"History cache hit: {len(cached)} cached + {len(fresh)} new candles")
+            if not len(fresh):
+                # Nothing new — window সরাসরি memmap view থেকে
+                return history_window(cached, start_ms)
+            history = np.concatenate((cached, fresh))
+            n_cached = len(cached)
+            # Memmap ছেড়ে দাও — Windows-এ mapped file os.replace করা যায় না
+            cached = None
+        else:
+            cached = None
+            history = await self.rest_client.fetch_historical_data(
+                symbol=symbol, timeframe=timeframe, days=days,
+            )
+            fresh = history
+
+        # Cache-এ শুধু closed candles — forming bar (since > cached[-1]) পরের run-এ আবার fetch হয়
+        closed = closed_rows(history, timeframe, now_ms)
+        if len(closed) > n_cached:
+            try:
+                save_history(symbol, timeframe, closed)
+            except OSError as e:
+                logger.warning(f"History cache save failed: {e}")
+
+        return history_window(history, start_ms)
+
     async def _close_exchange(self):
         """Properly close ccxt exchange to avoid 'Unclosed client session'"""
         try:
@@ -7,6 +7,7 @@ Saves to backtest_reports/ folder.
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from datetime import datetime
 
@@ -14,6 +15,22 @@ logger = logging.getLogger(__name__)
 
 REPORT_DIR = "backtest_reports"
 
+# Static HTML scaffolding — built once at import, not per report
+_HTML_HEAD = b"""<!DOCTYPE html>
+<html>
+<head>
+<style>
+body { font-family: monospace; background: #0d1117; color: #c9d1d9; padding: 20px; }
+h1 { color: #58a6ff; }
+table { border-collapse: collapse; width: 100%; }
+td, th { border: 1px solid #30363d; padding: 8px 12px; text-align: left; }
+th { background: #161b22; color: #58a6ff; }
+.pos { color: #3fb950; }
+.neg { color: #f85149; }
+</style>
+"""
+_HTML_TAIL = b"</body>\n</html>"
+
 
 class ReportGenerator:
     """
@@ -41,58 +58,71 @@ class ReportGenerator:
         safe_symbol = symbol.replace("/", "")
         base_name = f"{REPORT_DIR}/{safe_symbol}_{timeframe}_{timestamp}"
 
-        files = {}
-        formats = ["txt", "csv", "json", "html"] if format == "all" else [format]
+        writers = {
+            "txt": (base_name + ".txt",
+                    lambda p: self._write_txt(result, symbol, timeframe, start_date, end_date, p)),
+            "csv": (base_name + "_trades.csv",
+                    lambda p: self._write_csv(result, p)),
+            "json": (base_name + ".json",
+                     lambda p: self._write_json(result, symbol, timeframe, start_date, end_date, p)),
+            "html": (base_name + ".html",
+                     lambda p: self._write_html(result, symbol, timeframe, start_date, end_date, p)),
+        }
+        formats = list(writers) if format == "all" else [format]
+        tasks = [(fmt, *writers[fmt]) for fmt in formats if fmt in writers]
 
-        for fmt in formats:
+        def _run(task) -> bool:
+            fmt, path, write = task
             try:
-                if fmt == "txt":
-                    path = base_name + ".txt"
-                    self._write_txt(result, symbol, timeframe, start_date, end_date, path)
-                    files["txt"] = path
-
-                elif fmt == "json":
-                    path = base_name + ".json"
-                    self._write_json(result, symbol, timeframe, start_date, end_date, path)
-                    files["json"] = path
-
-                elif fmt == "csv":
-                    path = base_name + "_trades.csv"
-                    self._write_csv(result, path)
-                    files["csv"] = path
-
-                elif fmt == "html":
-                    path = base_name + ".html"
-                    self._write_html(result, symbol, timeframe, start_date, end_date, path)
-                    files["html"] = path
-
+                write(path)
+                return True
             except Exception as e:
                 logger.warning(f"Report format {fmt} failed: {e}")
+                return False
+
+        if format == "all":
+            # Each writer owns its own file — overlap the disk writes
+            with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+                ok = list(pool.map(_run, tasks))
+        else:
+            ok = [_run(t) for t in tasks]
+
+        files = {fmt: path for (fmt, path, _), done in zip(tasks, ok) if done}
 
         logger.info(f"📁 Reports saved: {list(files.values())}")
         return files
 
     def _write_txt(self, result, symbol, timeframe, start, end, path):
-        with open(path, "w") as f:
-            f.write("=" * 60 + "\n")
-            f.write(f"ARUNABHA ALGO BOT — BACKTEST REPORT\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Symbol:    {symbol}\n")
-            f.write(f"Timeframe: {timeframe}\n")
-            f.write(f"Period:    {start} → {end}\n\n")
-            f.write("-" * 40 + "\n")
-            f.write("PERFORMANCE SUMMARY\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total Trades:    {result.total_trades}\n")
-            f.write(f"Win Rate:        {result.win_rate:.1f}%\n")
-            f.write(f"Total Return:    {result.total_pnl_percent:+.2f}%\n")
-            f.write(f"Profit Factor:   {result.profit_factor:.2f}\n")
-            f.write(f"Sharpe Ratio:    {result.sharpe_ratio:.2f}\n")
-            f.write(f"Max Drawdown:    {result.max_drawdown_percent:.2f}%\n")
-            f.write(f"Avg R:R:         {result.avg_rr:.2f}\n")
-            f.write(f"Best Trade:      {result.best_trade:+.2f}%\n")
-            f.write(f"Worst Trade:     {result.worst_trade:+.2f}%\n")
-            f.write("\n" + "=" * 60 + "\n")
+        parts = [
+            "=" * 60 + "\n",
+            "ARUNABHA ALGO BOT — BACKTEST REPORT\n",
+            "=" * 60 + "\n\n",
+            f"Symbol:    {symbol}\n",
+            f"Timeframe: {timeframe}\n",
+            f"Period:    {start} → {end}\n\n",
+            "-" * 40 + "\n",
+            "PERFORMANCE SUMMARY\n",
+            "-" * 40 + "\n",
+            f"Total Trades:    {result.total_trades}\n",
+            f"Win Rate:        {result.win_rate:.1f}%\n",
+            f"Total Return:    {result.total_pnl_percent:+.2f}%\n",
+            f"Profit Factor:   {result.profit_factor:.2f}\n",
+            f"Sharpe Ratio:    {result.sharpe_ratio:.2f}\n",
+            f"Max Drawdown:    {result.max_drawdown_percent:.2f}%\n",
+            f"Avg R:R:         {result.avg_rr:.2f}\n",
+            f"Best Trade:      {result.best_trade:+.2f}%\n",
+            f"Worst Trade:     {result.worst_trade:+.2f}%\n",
+            "\n" + "=" * 60 + "\n",
+        ]
+        # Encode once and hand the whole payload to a single write syscall
+        payload = "".join(parts).encode("utf-8")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     def _write_json(self, result, symbol, timeframe, start, end, path):
         data = {
@@ -145,19 +175,7 @@ class ReportGenerator:
                 f.write(",".join(str(row.get(k, "")) for k in keys) + "\n")
 
     def _write_html(self, result, symbol, timeframe, start, end, path):
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-<title>Backtest Report — {symbol}</title>
-<style>
-body {{ font-family: monospace; background: #0d1117; color: #c9d1d9; padding: 20px; }}
-h1 {{ color: #58a6ff; }}
-table {{ border-collapse: collapse; width: 100%; }}
-td, th {{ border: 1px solid #30363d; padding: 8px 12px; text-align: left; }}
-th {{ background: #161b22; color: #58a6ff; }}
-.pos {{ color: #3fb950; }}
-.neg {{ color: #f85149; }}
-</style>
+        body = f"""<title>Backtest Report — {symbol}</title>
 </head>
 <body>
 <h1>📊 ARUNABHA ALGO BOT — Backtest Report</h1>
@@ -175,7 +193,8 @@ th {{ background: #161b22; color: #58a6ff; }}
 <tr><td>Worst Trade</td><td class="neg">{result.worst_trade:+.2f}%</td></tr>
 </table>
 <p style="color:#8b949e; font-size:0.85em;">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-</body>
-</html>"""
-        with open(path, "w") as f:
-            f.write(html)
+"""
+        with open(path, "wb") as f:
+            f.write(_HTML_HEAD)
+            f.write(body.encode("utf-8"))
+            f.write(_HTML_TAIL)
@@ -73,24 +73,30 @@ class WalkForwardAnalyzer:
         total_candles = len(df)
 
         results = []
-        start_idx = 0
 
-        while start_idx + window_candles * 2 <= total_candles:
+        # Date labels formatted once for the whole frame; each window only
+        # indexes into this list instead of calling strftime per boundary
+        day_labels = df.index.strftime("%Y-%m-%d").tolist()
+
+        # Window starts precomputed — last start still leaves 2 windows of data
+        window_starts = range(0, total_candles - window_candles * 2 + 1, step_candles)
+
+        for start_idx in window_starts:
             end_idx = min(start_idx + window_candles * 3, total_candles)
-            window_df = df.iloc[start_idx:end_idx]
+            window_len = end_idx - start_idx
 
-            split_idx = int(len(window_df) * train_pct)
-            if split_idx < 50 or (len(window_df) - split_idx) < 50:
-                start_idx += step_candles
+            split_idx = int(window_len * train_pct)
+            if split_idx < 50 or (window_len - split_idx) < 50:
                 continue
 
-            train_df = window_df.iloc[:split_idx]
-            test_df  = window_df.iloc[split_idx:]
+            mid_idx = start_idx + split_idx
+            train_df = df.iloc[start_idx:mid_idx]
+            test_df  = df.iloc[mid_idx:end_idx]
 
-            train_start = train_df.index[0].strftime("%Y-%m-%d")
-            train_end   = train_df.index[-1].strftime("%Y-%m-%d")
-            test_start  = test_df.index[0].strftime("%Y-%m-%d")
-            test_end    = test_df.index[-1].strftime("%Y-%m-%d")
+            train_start = day_labels[start_idx]
+            train_end   = day_labels[mid_idx - 1]
+            test_start  = day_labels[mid_idx]
+            test_end    = day_labels[end_idx - 1]
 
             logger.debug(
                 f"Window {len(results)+1}: "
@@ -125,8 +131,6 @@ class WalkForwardAnalyzer:
             except Exception as e:
                 logger.warning(f"Walk-forward window {len(results)+1} failed: {e}")
 
-            start_idx += step_candles
-
         if not results:
             return self._insufficient_data_result()
 
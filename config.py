@@ -15,22 +15,55 @@ VERSION HISTORY:
 """
 
 import os
+import sys
 import logging
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from core.constants import GRADE_TABLE, SESSION_HOURS
+
 logger = logging.getLogger(__name__)
 
 # ==================== Environment ====================
 
-ENV = os.getenv("ENVIRONMENT", "development")
+# Env parsing goes through cached helpers so each variable is read and
+# converted once per process; reload_config() clears them and re-imports.
+
+@lru_cache(maxsize=None)
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    return os.getenv(name, default)
+
+
+@lru_cache(maxsize=None)
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value is not None else float(default)
+
+
+@lru_cache(maxsize=None)
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value is not None else int(default)
+
+
+def reload_config():
+    """Drop cached env values and re-execute this module (tests / env changes)"""
+    import importlib
+    _env.cache_clear()
+    _env_float.cache_clear()
+    _env_int.cache_clear()
+    return importlib.reload(sys.modules[__name__])
+
+
+ENV = _env("ENVIRONMENT", "development")
 DEBUG = ENV == "development"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL = _env("LOG_LEVEL", "INFO")
 
 # ==================== Telegram ====================
 
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
-TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
+TELEGRAM_BOT_TOKEN = _env("TELEGRAM_BOT_TOKEN", "")
+TELEGRAM_CHAT_ID = _env("TELEGRAM_CHAT_ID", "")
 
 # ✅ FIX: এখন import এর সময় raise করে না — main.py তে validate করা হবে
 if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
@@ -39,8 +72,11 @@ if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
 # ==================== Exchange ====================
 
 PRIMARY_EXCHANGE = "binance"
-BINANCE_API_KEY = os.getenv("BINANCE_API_KEY", "")
-BINANCE_SECRET = os.getenv("BINANCE_SECRET", "")
+BINANCE_API_KEY = _env("BINANCE_API_KEY", "")
+BINANCE_SECRET = _env("BINANCE_SECRET", "")
+
+# Parallel REST fan-out cap (cache seeding etc.) — Binance weight limit মাথায় রেখে
+MAX_CONCURRENT_REQUESTS = _env_int("MAX_CONCURRENT_REQUESTS", 8)
 
 # Indian profit calculation
 INDIAN_EXCHANGE = "CoinDCX"
@@ -50,24 +86,25 @@ GST_RATE = 18.0  # 18% GST on brokerage only
 
 # ==================== Trading Pairs ====================
 
-TRADING_PAIRS: List[str] = [
+TRADING_PAIRS: Tuple[str, ...] = tuple(sys.intern(pair) for pair in (
     "BTC/USDT",
     "ETH/USDT",
     "DOGE/USDT",
     "SOL/USDT",
     "RENDER/USDT"
-]
+))
 
-TIMEFRAMES: List[str] = ["5m", "15m", "1h", "4h"]
-PRIMARY_TF = "15m"
-SECONDARY_TFS = ["5m", "1h"]
-TERTIARY_TFS = ["4h"]
+# Timeframe strings aren't identifier-like, so the compiler doesn't intern them
+TIMEFRAMES: List[str] = [sys.intern(tf) for tf in ("5m", "15m", "1h", "4h")]
+PRIMARY_TF = sys.intern("15m")
+SECONDARY_TFS = [sys.intern("5m"), sys.intern("1h")]
+TERTIARY_TFS = [sys.intern("4h")]
 
 # ==================== Capital & Risk ====================
 
-ACCOUNT_SIZE = float(os.getenv("ACCOUNT_SIZE", "100000"))   # ₹1,00,000
-RISK_PER_TRADE = float(os.getenv("RISK_PER_TRADE", "1.0"))  # 1% = ₹1000
-MAX_LEVERAGE = int(os.getenv("MAX_LEVERAGE", "15"))
+ACCOUNT_SIZE = _env_float("ACCOUNT_SIZE", 100000)   # ₹1,00,000
+RISK_PER_TRADE = _env_float("RISK_PER_TRADE", 1.0)  # 1% = ₹1000
+MAX_LEVERAGE = _env_int("MAX_LEVERAGE", 15)
 
 MAX_POSITION_PCT = 30
 MIN_POSITION_SIZE = 10
@@ -150,14 +187,8 @@ MIN_TIER3_BONUS = 0
 
 # ==================== Signal Scoring ====================
 
-SIGNAL_GRADES = {
-    "A+": 90,
-    "A": 80,
-    "B+": 70,
-    "B": 60,
-    "C": 50,
-    "D": 0
-}
+# Derived from core.constants.GRADE_TABLE — one threshold table for both
+SIGNAL_GRADES = {grade: score for score, grade in GRADE_TABLE}
 
 MIN_SIGNAL_SCORE = 60
 STRONG_SIGNAL_SCORE = 75
@@ -166,34 +197,46 @@ ENTRY_CONFIRMATION_WAIT = True
 
 # ==================== Market Regime ====================
 
-MARKET_CONFIGS = {
-    "trending": {
-        "min_score": 65,
-        "min_filters": 3,
-        "min_rr": 2.0,
-        "max_signals": 5,
-        "position_size": 1.0,
-        "sl_mult": 1.5,
-        "tp_mult": 3.0
-    },
-    "choppy": {
-        "min_score": 60,
-        "min_filters": 2,
-        "min_rr": 1.5,
-        "max_signals": 3,
-        "position_size": 0.8,
-        "sl_mult": 1.2,
-        "tp_mult": 1.8
-    },
-    "high_vol": {
-        "min_score": 75,
-        "min_filters": 4,
-        "min_rr": 2.5,
-        "max_signals": 2,
-        "position_size": 0.5,
-        "sl_mult": 1.0,
-        "tp_mult": 2.5
-    }
+@dataclass(frozen=True, slots=True)
+class _MarketCfg:
+    """Per-regime trade parameters — attribute access instead of a nested dict"""
+    min_score: int
+    min_filters: int
+    min_rr: float
+    max_signals: int
+    position_size: float
+    sl_mult: float
+    tp_mult: float
+
+
+MARKET_CONFIGS: Dict[str, _MarketCfg] = {
+    "trending": _MarketCfg(
+        min_score=65,
+        min_filters=3,
+        min_rr=2.0,
+        max_signals=5,
+        position_size=1.0,
+        sl_mult=1.5,
+        tp_mult=3.0
+    ),
+    "choppy": _MarketCfg(
+        min_score=60,
+        min_filters=2,
+        min_rr=1.5,
+        max_signals=3,
+        position_size=0.8,
+        sl_mult=1.2,
+        tp_mult=1.8
+    ),
+    "high_vol": _MarketCfg(
+        min_score=75,
+        min_filters=4,
+        min_rr=2.5,
+        max_signals=2,
+        position_size=0.5,
+        sl_mult=1.0,
+        tp_mult=2.5
+    )
 }
 
 # ==================== BTC Regime ====================
@@ -238,12 +281,8 @@ CONFIDENCE = {
 
 # ==================== Sessions (IST) ====================
 
-SESSIONS = {
-    "asia": (7, 11),
-    "london": (13, 17),
-    "ny": (18, 22),
-    "overlap": (22, 24)
-}
+# Re-exported from core.constants — the copy here had drifted (NY was 18–22)
+SESSIONS = {name: hours for name, hours in SESSION_HOURS.items() if name != "dead"}
 
 BEST_TIMES = [
     (13, 15, "London Open"),
@@ -260,6 +299,22 @@ AVOID_TIMES = [
     (0, 1, "Early Morning")   # ✅ FIXED
 ]
 
+
+def _hour_mask(windows) -> int:
+    """24-bit mask with bit h set when IST hour h falls in any window (wraps past midnight)"""
+    mask = 0
+    for start, end, _ in windows:
+        for h in range(start, start + (end - start) % 24):
+            mask |= 1 << (h % 24)
+    return mask
+
+
+AVOID_HOURS_MASK = _hour_mask(AVOID_TIMES)
+
+
+def is_avoid_hour(hour: int) -> bool:
+    return bool((AVOID_HOURS_MASK >> hour) & 1)
+
 # ==================== Fear & Greed ====================
 
 FEAR_GREED_API_URL = "https://api.alternative.me/fng/?limit=1"
@@ -275,17 +330,17 @@ WS_PING_INTERVAL = 20
 # ==================== Cache ====================
 
 CACHE_SIZE = 100
-REDIS_URL = os.getenv("REDIS_URL", None)
+REDIS_URL = _env("REDIS_URL", None)
 USE_REDIS = REDIS_URL is not None
 
 # ==================== Webhook ====================
 
-WEBHOOK_PORT = int(os.getenv("PORT", "8080"))
-WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "default-secret-change-this")
+WEBHOOK_PORT = _env_int("PORT", 8080)
+WEBHOOK_SECRET = _env("WEBHOOK_SECRET", "default-secret-change-this")
 
 # ==================== Paper Trading ====================
 
-PAPER_TRADING = os.getenv("PAPER_TRADING", "false").lower() == "true"
+PAPER_TRADING = _env("PAPER_TRADING", "false").lower() == "true"
 
 # ==================== Adaptive Thresholds ====================
 
@@ -323,42 +378,87 @@ LOG_BACKUP_COUNT = 5
 # Moved from engine.py hardcoded values → config (hot-reloadable)
 
 SESSION_SIZE_MULTIPLIERS = {
-    "london_open":  float(os.getenv("SIZE_MULT_LONDON", "1.2")),   # 13-15 IST
-    "ny_open":      float(os.getenv("SIZE_MULT_NY", "1.2")),       # 18-20 IST
-    "asia":         float(os.getenv("SIZE_MULT_ASIA", "0.7")),     # 07-11 IST
-    "high_vol":     float(os.getenv("SIZE_MULT_HIGH_VOL", "0.8")), # MarketType.HIGH_VOL
+    "london_open":  _env_float("SIZE_MULT_LONDON", 1.2),   # 13-15 IST
+    "ny_open":      _env_float("SIZE_MULT_NY", 1.2),       # 18-20 IST
+    "asia":         _env_float("SIZE_MULT_ASIA", 0.7),     # 07-11 IST
+    "high_vol":     _env_float("SIZE_MULT_HIGH_VOL", 0.8), # MarketType.HIGH_VOL
     "default":      1.0,
 }
 
 
+# Declarative startup checks: (group, setting, predicate, error message).
+# Walked by one loop in list order, so the most commonly missing settings
+# (Telegram creds) come first and fail fast. Values are read from globals()
+# at check time.
+_VALIDATION_RULES = (
+    ("telegram", "TELEGRAM_BOT_TOKEN",
+     lambda v: bool(v) and v != "your_bot_token_here",
+     "Invalid TELEGRAM_BOT_TOKEN — .env file check করো"),
+    ("telegram", "TELEGRAM_CHAT_ID",
+     lambda v: bool(v) and v != "your_chat_id_here",
+     "Invalid TELEGRAM_CHAT_ID — .env file check করো"),
+    ("exchange", "BINANCE_API_KEY",
+     lambda v: ENV != "production" or (bool(v) and v != "your_binance_api_key"),
+     "BINANCE_API_KEY required in production"),
+    ("exchange", "BINANCE_SECRET",
+     lambda v: ENV != "production" or (bool(v) and v != "your_binance_secret"),
+     "BINANCE_SECRET required in production"),
+    ("risk", "ACCOUNT_SIZE",
+     lambda v: v > 0,
+     "ACCOUNT_SIZE must be positive"),
+    ("risk", "RISK_PER_TRADE",
+     lambda v: 0 < v <= 5,
+     "RISK_PER_TRADE must be between 0 and 5"),
+    ("risk", "MAX_LEVERAGE",
+     lambda v: 0 < v <= 20,
+     "MAX_LEVERAGE must be between 1 and 20"),
+    ("filters", "MIN_TIER2_SCORE",
+     lambda v: 0 <= v <= 100,
+     "MIN_TIER2_SCORE must be between 0 and 100"),
+    ("filters", "MIN_SIGNAL_SCORE",
+     lambda v: 0 <= v <= 100,
+     "MIN_SIGNAL_SCORE must be between 0 and 100"),
+)
+
+
+def _run_rules(group: Optional[str] = None):
+    """Raise ValueError on the first failing rule (optionally one group only)"""
+    settings = globals()
+    for rule_group, name, check, message in _VALIDATION_RULES:
+        if group is not None and rule_group != group:
+            continue
+        if not check(settings[name]):
+            raise ValueError(message)
+
+
+# Set once validate_all() succeeds — repeat calls (worker + web startup,
+# reloads) become no-ops
+_VALIDATED = False
+
+
 @dataclass
 class ConfigValidator:
     """Validate configuration on startup"""
 
     @classmethod
     def validate_all(cls):
-        """Run all validations"""
-        cls.validate_telegram()
-        cls.validate_exchange()
-        cls.validate_risk()
-        cls.validate_filters()
+        """
+        Run all validations — once per process.
+        Set ARUNABHA_SKIP_VALIDATION=1 to skip entirely (short-lived workers
+        whose parent already validated the same environment).
+        """
+        global _VALIDATED
+        if _VALIDATED:
+            return
+        if os.getenv("ARUNABHA_SKIP_VALIDATION"):
+            logger.info("⏭️ Config validation skipped (ARUNABHA_SKIP_VALIDATION)")
+            _VALIDATED = True
+            return
+
+        _run_rules()
+        _VALIDATED = True
         logger.info("✅ All configurations valid")
 
-    @classmethod
-    def validate_telegram(cls):
-        if not TELEGRAM_BOT_TOKEN or TELEGRAM_BOT_TOKEN == "your_bot_token_here":
-            raise ValueError("Invalid TELEGRAM_BOT_TOKEN — .env file check করো")
-        if not TELEGRAM_CHAT_ID or TELEGRAM_CHAT_ID == "your_chat_id_here":
-            raise ValueError("Invalid TELEGRAM_CHAT_ID — .env file check করো")
-
-    @classmethod
-    def validate_exchange(cls):
-        if ENV == "production":
-            if not BINANCE_API_KEY or BINANCE_API_KEY == "your_binance_api_key":
-                raise ValueError("BINANCE_API_KEY required in production")
-            if not BINANCE_SECRET or BINANCE_SECRET == "your_binance_secret":
-                raise ValueError("BINANCE_SECRET required in production")
-
     @classmethod
     async def validate_api_permissions(cls, rest_client) -> Dict[str, Any]:
         """
@@ -412,45 +512,99 @@ class ConfigValidator:
 
         return result
 
+    @classmethod
+    def validate_telegram(cls):
+        _run_rules("telegram")
+
+    @classmethod
+    def validate_exchange(cls):
+        _run_rules("exchange")
+
     @classmethod
     def validate_risk(cls):
-        if ACCOUNT_SIZE <= 0:
-            raise ValueError("ACCOUNT_SIZE must be positive")
-        if RISK_PER_TRADE <= 0 or RISK_PER_TRADE > 5:
-            raise ValueError("RISK_PER_TRADE must be between 0 and 5")
-        if MAX_LEVERAGE <= 0 or MAX_LEVERAGE > 20:
-            raise ValueError("MAX_LEVERAGE must be between 1 and 20")
+        _run_rules("risk")
 
     @classmethod
     def validate_filters(cls):
-        if MIN_TIER2_SCORE < 0 or MIN_TIER2_SCORE > 100:
-            raise ValueError("MIN_TIER2_SCORE must be between 0 and 100")
-        if MIN_SIGNAL_SCORE < 0 or MIN_SIGNAL_SCORE > 100:
-            raise ValueError("MIN_SIGNAL_SCORE must be between 0 and 100")
+        _run_rules("filters")
+
+
+# ==================== Frozen Snapshot ====================
+# Hot-path thresholds frozen into a slotted object once env parsing is done.
+# CFG.x is a slot load instead of a module __dict__ lookup; the module-level
+# names above stay as-is for everything else (templates, startup logs, ...)
+
+@dataclass(frozen=True, slots=True)
+class _ConfigSnapshot:
+    account_size: float
+    risk_per_trade: float
+    max_leverage: int
+    max_position_pct: float
+    min_position_size: float
+    atr_sl_mult: float
+    atr_tp_mult: float
+    min_atr_pct: float
+    max_atr_pct: float
+    max_daily_drawdown_pct: float
+    max_consecutive_losses: int
+    break_even_at_r: float
+    partial_exit_at_r: float
+    cooldown_minutes: int
+    trailing_stop_atr_mult: float
+    min_tier2_score: int
+    min_signal_score: int
+    strong_signal_score: int
+    min_rr_ratio: float
+
+
+CFG = _ConfigSnapshot(
+    account_size=ACCOUNT_SIZE,
+    risk_per_trade=RISK_PER_TRADE,
+    max_leverage=MAX_LEVERAGE,
+    max_position_pct=MAX_POSITION_PCT,
+    min_position_size=MIN_POSITION_SIZE,
+    atr_sl_mult=ATR_SL_MULT,
+    atr_tp_mult=ATR_TP_MULT,
+    min_atr_pct=MIN_ATR_PCT,
+    max_atr_pct=MAX_ATR_PCT,
+    max_daily_drawdown_pct=MAX_DAILY_DRAWDOWN_PCT,
+    max_consecutive_losses=MAX_CONSECUTIVE_LOSSES,
+    break_even_at_r=BREAK_EVEN_AT_R,
+    partial_exit_at_r=PARTIAL_EXIT_AT_R,
+    cooldown_minutes=COOLDOWN_MINUTES,
+    trailing_stop_atr_mult=TRAILING_STOP_ATR_MULT,
+    min_tier2_score=MIN_TIER2_SCORE,
+    min_signal_score=MIN_SIGNAL_SCORE,
+    strong_signal_score=STRONG_SIGNAL_SCORE,
+    min_rr_ratio=MIN_RR_RATIO,
+)
 
 
 # ==================== Profit Calculation ====================
 
+# Rate fractions resolved once at import instead of dividing by 100 per trade
+_TDS_FRAC = TDS_RATE / 100
+_BROKERAGE_FRAC = BROKERAGE_RATE / 100
+_GST_FRAC = GST_RATE / 100
+_SIDE_SIGN = {"LONG": 1.0, "SHORT": -1.0}
+
+
 def calculate_indian_profit(entry: float, exit: float, qty: float, side: str) -> Dict[str, float]:
     """
     ✅ FIXED: Calculate profit after TDS/GST for Indian exchanges
     GST = brokerage এর উপর, gross profit এর উপর না
     """
-    if side == "LONG":
-        gross_pnl = (exit - entry) * qty
-    else:
-        gross_pnl = (entry - exit) * qty
+    gross_pnl = _SIDE_SIGN.get(side, -1.0) * (exit - entry) * qty
 
     if gross_pnl <= 0:
         return {"net_pnl": gross_pnl, "tds": 0, "gst": 0, "brokerage": 0, "gross": gross_pnl}
 
     # TDS on gross profit
-    tds = gross_pnl * (TDS_RATE / 100)
+    tds = gross_pnl * _TDS_FRAC
 
     # ✅ FIX: GST শুধু brokerage এর উপর
-    trade_value = entry * qty
-    brokerage = trade_value * (BROKERAGE_RATE / 100)
-    gst = brokerage * (GST_RATE / 100)
+    brokerage = entry * qty * _BROKERAGE_FRAC
+    gst = brokerage * _GST_FRAC
 
     net_pnl = gross_pnl - tds - brokerage - gst
 
@@ -463,6 +617,36 @@ def calculate_indian_profit(entry: float, exit: float, qty: float, side: str) ->
     }
 
 
+def calculate_indian_profit_batch(entry, exit, qty, is_long) -> Dict[str, Any]:
+    """
+    Vectorised calculate_indian_profit for PnL backfills / reconciliation.
+    Takes equal-length arrays (is_long = bool mask) and returns a dict of
+    arrays with the same keys and the same loss-side zeroing as the scalar version.
+    """
+    import numpy as np
+
+    entry = np.asarray(entry, dtype=np.float64)
+    exit = np.asarray(exit, dtype=np.float64)
+    qty = np.asarray(qty, dtype=np.float64)
+
+    gross_pnl = np.where(is_long, 1.0, -1.0) * (exit - entry) * qty
+    profitable = gross_pnl > 0
+
+    tds = np.where(profitable, gross_pnl * _TDS_FRAC, 0.0)
+    brokerage = np.where(profitable, entry * qty * _BROKERAGE_FRAC, 0.0)
+    gst = brokerage * _GST_FRAC
+    net_pnl = gross_pnl - tds - brokerage - gst
+
+    # Scalar version loss-এ gross_pnl unrounded ফেরায় — শুধু profitable rows round
+    return {
+        "gross": np.where(profitable, np.round(gross_pnl, 2), gross_pnl),
+        "tds": np.round(tds, 2),
+        "brokerage": np.round(brokerage, 2),
+        "gst": np.round(gst, 2),
+        "net_pnl": np.where(profitable, np.round(net_pnl, 2), net_pnl)
+    }
+
+
 # ✅ FIX: validate_all() এখন import এর সময় চলে না
 # main.py তে explicitly call করা হবে
 logger.info("⚙️ Configuration loaded (validation pending)")
@@ -8,8 +8,86 @@ FIXES:
   Fix: NY session এখন (17, 22) — scheduler ও 17:00 তে fire করবে
 """
 
+import sys
+import time
+from bisect import bisect_right
+from datetime import timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Tuple
+
+__all__ = [
+    "Timeframes", "MarketType", "TradeDirection", "SignalGrade",
+    "SessionType", "BTCRegime",
+    "GRADE_TABLE", "SESSION_HOURS", "PAIR_CATEGORIES", "MIN_CANDLES",
+    "IST_OFFSET_S", "IST_TZ",
+    "DEFAULT_VALUES", "ERROR_MESSAGES", "SIGNAL_THRESHOLDS",
+    "MS_IN_SECOND", "MS_IN_MINUTE", "MS_IN_HOUR", "MS_IN_DAY",
+]
+
+
+# ==================== Signal grade thresholds ====================
+# Single source of truth for grade cut-offs (descending). SignalGrade and
+# config.SIGNAL_GRADES are both derived from this table.
+
+GRADE_TABLE: Tuple[Tuple[int, str], ...] = (
+    (90, "A+"),
+    (80, "A"),
+    (70, "B+"),
+    (60, "B"),
+    (50, "C"),
+    (0,  "D"),
+)
+
+# ==================== Enum lookup maps ====================
+# Built once at import; enum properties index into these instead of
+# constructing a fresh dict literal on every access
+
+_MARKET_EMOJI: Dict[str, str] = {
+    "trending": "📈",
+    "choppy":   "〰️",
+    "high_vol": "⚡",
+    "unknown":  "❓",
+}
+
+_DIR_EMOJI: Dict[str, str] = {
+    "LONG":  "🟢",
+    "SHORT": "🔴",
+}
+
+_GRADE_EMOJI: Dict[str, str] = {
+    "A+": "🏆",
+    "A":  "🌟",
+    "B+": "⭐",
+    "B":  "✨",
+    "C":  "⚠️",
+    "D":  "❌",
+}
+
+_GRADE_MIN_SCORE: Dict[str, int] = {grade: score for score, grade in GRADE_TABLE}
+
+_SESSION_EMOJI: Dict[str, str] = {
+    "asia":    "🌏",
+    "london":  "🇬🇧",
+    "ny":      "🗽",
+    "overlap": "🔄",
+    "dead":    "💤",
+}
+
+_BTC_EMOJI: Dict[str, str] = {
+    "strong_bull": "🚀",
+    "bull":        "📈",
+    "choppy":      "〰️",
+    "bear":        "📉",
+    "strong_bear": "💥",
+    "unknown":     "❓",
+}
+
+_BTC_TREND: Dict[str, str] = {
+    "strong_bull": "UP",
+    "bull":        "UP",
+    "bear":        "DOWN",
+    "strong_bear": "DOWN",
+}
 
 
 class Timeframes(str, Enum):
@@ -40,10 +118,10 @@ class Timeframes(str, Enum):
 
     @classmethod
     def from_string(cls, tf_str: str) -> "Timeframes":
-        for tf in cls:
-            if tf.value == tf_str:
-                return tf
-        return cls.M15
+        return _TF_BY_STR.get(tf_str, cls.M15)
+
+
+_TF_BY_STR: Dict[str, Timeframes] = {tf.value: tf for tf in Timeframes}
 
 
 class MarketType(str, Enum):
@@ -55,12 +133,7 @@ class MarketType(str, Enum):
 
     @property
     def emoji(self) -> str:
-        return {
-            "trending": "📈",
-            "choppy": "〰️",
-            "high_vol": "⚡",
-            "unknown": "❓"
-        }[self.value]
+        return _MARKET_EMOJI[self.value]
 
     @classmethod
     def list(cls) -> List[str]:
@@ -74,7 +147,7 @@ class TradeDirection(str, Enum):
 
     @property
     def emoji(self) -> str:
-        return "🟢" if self == TradeDirection.LONG else "🔴"
+        return _DIR_EMOJI[self.value]
 
     @property
     def opposite(self) -> "TradeDirection":
@@ -92,29 +165,14 @@ class SignalGrade(str, Enum):
 
     @classmethod
     def from_score(cls, score: float) -> "SignalGrade":
-        if score >= 90:
-            return cls.APLUS
-        elif score >= 80:
-            return cls.A
-        elif score >= 70:
-            return cls.BPLUS
-        elif score >= 60:
-            return cls.B
-        elif score >= 50:
-            return cls.C
-        else:
+        # Table lookup instead of an if/elif cascade — see _GRADE_THRESHOLDS
+        if score != score:  # NaN fails every ">=" check in the old cascade → D
             return cls.D
+        return _GRADES_ASC[bisect_right(_GRADE_THRESHOLDS, score)]
 
     @property
     def emoji(self) -> str:
-        return {
-            "A+": "🏆",
-            "A":  "🌟",
-            "B+": "⭐",
-            "B":  "✨",
-            "C":  "⚠️",
-            "D":  "❌"
-        }[self.value]
+        return _GRADE_EMOJI[self.value]
 
     @property
     def can_trade(self) -> bool:
@@ -122,14 +180,22 @@ class SignalGrade(str, Enum):
 
     @property
     def min_score(self) -> int:
-        return {
-            "A+": 90,
-            "A":  80,
-            "B+": 70,
-            "B":  60,
-            "C":  50,
-            "D":  0
-        }[self.value]
+        return _GRADE_MIN_SCORE[self.value]
+
+
+# Ascending grade cut-offs: score >= _GRADE_THRESHOLDS[i] → _GRADES_ASC[i + 1]
+_GRADE_THRESHOLDS: Tuple[int, ...] = tuple(score for score, _ in reversed(GRADE_TABLE[:-1]))
+_GRADES_ASC: Tuple[SignalGrade, ...] = tuple(SignalGrade(grade) for _, grade in reversed(GRADE_TABLE))
+
+
+# Session hours in IST (start, end) — shared by SessionType.hours and the hour table
+SESSION_HOURS: Dict[str, Tuple[int, int]] = {
+    "asia":    (7,  11),
+    "london":  (13, 17),
+    "ny":      (17, 22),   # ✅ FIXED: was (18, 22)
+    "overlap": (22, 24),
+    "dead":    (0,   7),
+}
 
 
 class SessionType(str, Enum):
@@ -149,32 +215,18 @@ class SessionType(str, Enum):
     @property
     def hours(self) -> Tuple[int, int]:
         """Get session hours in IST (start, end)"""
-        return {
-            "asia":    (7,  11),
-            "london":  (13, 17),
-            "ny":      (17, 22),   # ✅ FIXED: was (18, 22)
-            "overlap": (22, 24),
-            "dead":    (0,   7),
-        }[self.value]
+        return SESSION_HOURS[self.value]
 
     @property
     def is_active(self) -> bool:
         """Check if session is currently active"""
-        from datetime import datetime
-        import pytz
-        hour = datetime.now(pytz.timezone('Asia/Kolkata')).hour
+        hour = _current_ist_hour()
         start, end = self.hours
         return start <= hour < end
 
     @property
     def emoji(self) -> str:
-        return {
-            "asia":    "🌏",
-            "london":  "🇬🇧",
-            "ny":      "🗽",
-            "overlap": "🔄",
-            "dead":    "💤"
-        }[self.value]
+        return _SESSION_EMOJI[self.value]
 
     @property
     def description(self) -> str:
@@ -184,14 +236,31 @@ class SessionType(str, Enum):
     @classmethod
     def current(cls) -> "SessionType":
         """Get current active session"""
-        from datetime import datetime
-        import pytz
-        hour = datetime.now(pytz.timezone('Asia/Kolkata')).hour
-        for session in cls:
-            start, end = session.hours
-            if start <= hour < end:
-                return session
-        return cls.DEAD
+        return _HOUR_TO_SESSION[_current_ist_hour()]
+
+
+def _build_hour_to_session() -> List[SessionType]:
+    """Resolve every IST hour to its session once (first match in enum order wins)"""
+    table = [SessionType.DEAD] * 24
+    for session in reversed(SessionType):
+        start, end = SESSION_HOURS[session.value]
+        table[start:end] = [session] * (end - start)
+    return table
+
+
+_HOUR_TO_SESSION: List[SessionType] = _build_hour_to_session()
+
+# IST is a fixed UTC+5:30 offset with no DST, so the current IST hour is
+# plain integer arithmetic on the epoch — no datetime/tz objects per call
+IST_OFFSET_S = 5 * 3600 + 30 * 60
+
+# Stdlib fixed-offset tzinfo (C) — pytz/tzdata লাগে না, Windows-এও চলে,
+# localize() trap নেই; datetime.now(IST_TZ) সরাসরি aware datetime দেয়
+IST_TZ = timezone(timedelta(seconds=IST_OFFSET_S), "IST")
+
+
+def _current_ist_hour() -> int:
+    return int((time.time() + IST_OFFSET_S) // 3600 % 24)
 
 
 class BTCRegime(str, Enum):
@@ -205,11 +274,7 @@ class BTCRegime(str, Enum):
 
     @property
     def trend_direction(self) -> str:
-        if self in [BTCRegime.STRONG_BULL, BTCRegime.BULL]:
-            return "UP"
-        elif self in [BTCRegime.STRONG_BEAR, BTCRegime.BEAR]:
-            return "DOWN"
-        return "SIDEWAYS"
+        return _BTC_TREND.get(self.value, "SIDEWAYS")
 
     @property
     def can_trade(self) -> bool:
@@ -217,62 +282,88 @@ class BTCRegime(str, Enum):
 
     @property
     def emoji(self) -> str:
-        return {
-            "strong_bull": "🚀",
-            "bull":        "📈",
-            "choppy":      "〰️",
-            "bear":        "📉",
-            "strong_bear": "💥",
-            "unknown":     "❓"
-        }[self.value]
+        return _BTC_EMOJI[self.value]
 
 
 # ==================== Trading pair categories ====================
 
-PAIR_CATEGORIES = {
-    "major": ["BTC/USDT", "ETH/USDT"],
-    "mid":   ["DOGE/USDT", "SOL/USDT"],
-    "alt":   ["RENDER/USDT", "ZRO/USDT", "MORPHO/USDT", "ETC/USDT"]
+# frozenset values → O(1) membership; symbols interned so hash/eq are cheap
+PAIR_CATEGORIES: Dict[str, FrozenSet[str]] = {
+    category: frozenset(sys.intern(pair) for pair in pairs)
+    for category, pairs in {
+        "major": ["BTC/USDT", "ETH/USDT"],
+        "mid":   ["DOGE/USDT", "SOL/USDT"],
+        "alt":   ["RENDER/USDT", "ZRO/USDT", "MORPHO/USDT", "ETC/USDT"]
+    }.items()
 }
 
+# ==================== Interned enum values ====================
+# Identifier-like literals ("trending", "LONG") are interned by the compiler
+# already; "15m", "A+", "B+" etc. are not. Interning every .value makes the
+# hot `x.value == "15m"` / dict-key comparisons pointer-equal.
+
+for _enum in (Timeframes, MarketType, TradeDirection, SignalGrade, SessionType, BTCRegime):
+    for _member in _enum:
+        object.__setattr__(_member, "_value_", sys.intern(_member._value_))
+del _enum, _member
+
 # ==================== Minimum data requirements ====================
 
 MIN_CANDLES = {
-    "5m":  50,
-    "15m": 50,
-    "1h":  30,
-    "4h":  20
+    sys.intern("5m"):  50,
+    sys.intern("15m"): 50,
+    sys.intern("1h"):  30,
+    sys.intern("4h"):  20
 }
 
-# ==================== Default fallback values ====================
-
-DEFAULT_VALUES = {
-    "fear_index":    50,
-    "funding_rate":  0.0,
-    "open_interest": 0.0,
-    "volume":        0.0
+# ==================== Lazily built lookup tables ====================
+# Rarely-read maps are only constructed on first access (PEP 562 module
+# __getattr__), then cached in the module namespace.
+
+def _default_values() -> Dict[str, float]:
+    return {
+        "fear_index":    50,
+        "funding_rate":  0.0,
+        "open_interest": 0.0,
+        "volume":        0.0
+    }
+
+
+def _error_messages() -> Dict[str, str]:
+    return {
+        "no_data":        "Insufficient data for analysis",
+        "btc_block":      "BTC regime blocking trade",
+        "structure_block":"Structure not confirmed",
+        "risk_block":     "Risk manager blocked trade",
+        "filter_block":   "Filters not passed",
+        "session_block":  "Not in active session"
+    }
+
+
+def _signal_thresholds() -> Dict[str, float]:
+    return {
+        "min_score":        60,
+        "strong_score":     75,
+        "min_rr":           1.5,
+        "min_volume_ratio": 0.7,
+        "max_spread":       0.1
+    }
+
+
+_LAZY = {
+    "DEFAULT_VALUES":    _default_values,
+    "ERROR_MESSAGES":    _error_messages,
+    "SIGNAL_THRESHOLDS": _signal_thresholds,
 }
 
-# ==================== Error messages ====================
-
-ERROR_MESSAGES = {
-    "no_data":        "Insufficient data for analysis",
-    "btc_block":      "BTC regime blocking trade",
-    "structure_block":"Structure not confirmed",
-    "risk_block":     "Risk manager blocked trade",
-    "filter_block":   "Filters not passed",
-    "session_block":  "Not in active session"
-}
 
-# ==================== Signal thresholds ====================
+def __getattr__(name: str):
+    factory = _LAZY.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = factory()
+    return value
 
-SIGNAL_THRESHOLDS = {
-    "min_score":        60,
-    "strong_score":     75,
-    "min_rr":           1.5,
-    "min_volume_ratio": 0.7,
-    "max_spread":       0.1
-}
 
 # ==================== Time in milliseconds ====================
 
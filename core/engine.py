@@ -19,14 +19,15 @@ Point 3  — Correlation filter integrated via StateManager
 import asyncio
 import logging
 import os
-from typing import Dict, List, Optional, Any, Tuple, Deque
+import time
+from typing import Dict, List, Optional, Any, Tuple, Deque, Set
 from datetime import datetime
 from collections import deque
 
 import config
 from core.constants import (
     MarketType, TradeDirection, SignalGrade, Timeframes,
-    BTCRegime, SessionType, ERROR_MESSAGES
+    BTCRegime, SessionType, ERROR_MESSAGES, IST_TZ
 )
 from core.state_manager import StateManager
 from data.websocket_manager import WebSocketManager
@@ -52,6 +53,22 @@ ADAPTIVE_WINDOW = 20          # last N signals
 ADAPTIVE_MIN_THRESHOLD = 50   # never go below this
 ADAPTIVE_MAX_THRESHOLD = 80   # never go above this
 
+# WS callback → analysis consumer queue (full হলে oldest drop)
+CANDLE_QUEUE_MAXSIZE = 128
+
+# Regime recompute throttle — একই candle close-এ duplicate trigger (WS reconnect replay ইত্যাদি) coalesce
+REGIME_MIN_INTERVAL_S = 60.0
+# Cache-এ incrementally maintained EMA periods — Tier2 EMA/MTF filter data packet থেকে পড়ে।
+# শুধু period < CACHE_MAXLEN: EMA200 (200-row window) filter-এ calculate_emas-এর
+# clamped (≈ window SMA) মানে — streamed EMA সেটা থেকে সরে যায়, তাই cache থেকে নয়
+LIVE_EMA_PERIODS = (9, 21)
+
+# Timeframe strings resolved once — hot path-এ enum attribute lookup নয়
+_TF_15M, _TF_1H, _TF_4H = Timeframes.M15.value, Timeframes.H1.value, Timeframes.H4.value
+
+# REST seed timeframes (5m শুধু WS feed থেকে আসে)
+_SEED_TFS = (_TF_15M, _TF_1H, _TF_4H)
+
 
 def _task_error_handler(task: asyncio.Task):
     """Point 16: Background task error callback"""
@@ -80,7 +97,7 @@ class ArunabhaEngine:
         self.state = StateManager()
 
         # Components
-        self.ws_manager = WebSocketManager(self._on_candle_close)
+        self.ws_manager = WebSocketManager(self._on_candle_close, self._on_stream_update)
         self.rest_client = RESTClient()
         self.cache = CacheManager()
 
@@ -98,11 +115,22 @@ class ArunabhaEngine:
         # Runtime state
         self.market_type = MarketType.UNKNOWN
         self.btc_regime: Optional[BTCRegimeResult] = None
-        self.btc_cache = {"15m": [], "1h": [], "4h": []}
-        self._btc_data_ready = False
+        # BTC candles শুধু CacheManager-এ ("BTC/USDT") — আলাদা btc_cache copy নেই
+        self._btc_ready_flag = False
+        self._btc_ready_event = asyncio.Event()
+        self._last_regime_at: float = 0.0
         self._btc_fetch_attempts = 0
+        self._btc_fetch_inflight: Optional[asyncio.Task] = None
+        self.rest_errors: int = 0
+
+        # WS reader কখনো analysis pipeline-এর জন্য block হবে না
+        self._candle_q: asyncio.Queue = asyncio.Queue(maxsize=CANDLE_QUEUE_MAXSIZE)
+        # Queue-তে থাকা symbols — একটা symbol একবারই queue হয় (consumer cache থেকে latest পড়ে)
+        self._candle_pending: Set[str] = set()
+        self._candles_dropped: int = 0
         self._last_btc_check = None
-        self._background_tasks: List[asyncio.Task] = []
+        # Set + discard-on-done — per-candle regime task গুলো list-এ চিরকাল জমত
+        self._background_tasks: Set[asyncio.Task] = set()
 
         # Paper trading state
         self.paper_trading = PAPER_TRADING
@@ -115,15 +143,41 @@ class ArunabhaEngine:
         self._signal_history: Deque[Dict] = deque(maxlen=ADAPTIVE_WINDOW)
         self._adaptive_threshold: float = config.MIN_TIER2_SCORE
 
-        # Last signal time per symbol
-        self.last_signal_time: Dict[str, datetime] = {}
+        # Last signal time per symbol — candle "tick time" (epoch s, candles[-1][0])
+        # সব cooldown check একই candle clock-এ; wall-clock ISO copy state_manager-এ persisted
+        self.last_signal_time: Dict[str, float] = {}
         self.daily_signals: int = self.state.state.get("daily_signals_count", 0)
+        # market_type বদলালে তবেই recompute — প্রতি candle-এ dict lookup নয়
+        self._daily_limit_cached: int = 0
+        self._cooldown_s: float = 0.0
+        self._recompute_limits()
+
+    @property
+    def _btc_data_ready(self) -> bool:
+        return self._btc_ready_flag
+
+    def _refresh_btc_ready(self):
+        """BTC ingress path-এ call হয় — regime detection-এর জন্য ≥50 × 15m candle"""
+        self._btc_ready_flag = len(self.cache.get_ohlcv_view("BTC/USDT", _TF_15M)) >= 50
+        if self._btc_ready_flag:
+            self._btc_ready_event.set()
+
+    def btc_ohlcv(self, tf: str) -> List[List[float]]:
+        return self.cache.get_ohlcv("BTC/USDT", tf)
+
+    def _recompute_limits(self):
+        """Resolve daily limit (current market type) + cooldown seconds — regime/reset/reload"""
+        self._daily_limit_cached = config.MAX_SIGNALS_PER_DAY.get(
+            self.market_type.value, config.MAX_SIGNALS_PER_DAY["default"]
+        )
+        self._cooldown_s = config.CFG.cooldown_minutes * 60
 
     def _create_task(self, coro, name: str = None) -> asyncio.Task:
         """ISSUE 13 FIX: add_done_callback properly registered"""
         task = asyncio.create_task(coro, name=name)
         task.add_done_callback(_task_error_handler)   # ← was missing before
-        self._background_tasks.append(task)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
         return task
 
     async def start(self):
@@ -148,6 +202,9 @@ class ArunabhaEngine:
             logger.warning("⚠️ BTC data not ready — will retry in background")
             self._create_task(self._background_btc_fetcher(), "btc_fetcher")
 
+        # Analysis consumer — WS callback শুধু queue-তে put করে
+        self._create_task(self._candle_consumer(), "candle_consumer")
+
         # Start WebSocket
         await self.ws_manager.start()
 
@@ -166,7 +223,7 @@ class ArunabhaEngine:
     async def stop(self):
         """Stop engine"""
         await self.ws_manager.stop()
-        for task in self._background_tasks:
+        for task in list(self._background_tasks):
             if not task.done():
                 task.cancel()
         try:
@@ -175,7 +232,7 @@ class ArunabhaEngine:
             pass
         logger.info("✅ Engine stopped")
 
-    async def _on_candle_close(self, symbol: str, tf: str, candles: List[List[float]]):
+    async def _on_candle_close(self, symbol: str, tf: str, candles: Any):
         """Called on every closed candle from WebSocket feed.
 
         ✅ FIX BUG-B: Dual cache sync
@@ -184,53 +241,94 @@ class ArunabhaEngine:
         আগে এই দুটো কখনো sync হতো না।
         _build_data_packet() self.cache পড়ে — তাই সবসময় stale seed data পেত।
 
-        Fix: প্রতিটি closed candle-এ self.cache.set_ohlcv() call করো।
+        Fix: প্রতিটি closed candle CacheManager-এ upsert করো।
         এতে WS live data সরাসরি CacheManager-এ চলে যাবে।
+        শুধু শেষ candle — পুরো list replace করলে REST-seeded history
+        (WS feed-এ যা নেই) মুছে যেত, আর প্রতি close-এ 200 row convert হত।
+
+        candles: WS feed ring buffer-এর (N, 6) float64 read-only view —
+        শুধু শেষ row এখানেই (await-এর আগে) copy হয়।
         """
-        if tf != "15m":
+        if tf != _TF_15M:
             return
 
         # ✅ FIX BUG-B: WS candle → CacheManager sync
         # Live candle data এখন analysis pipeline-এ পৌঁছাবে
-        self.cache.set_ohlcv(symbol, tf, candles)
+        self.cache.update_ohlcv(symbol, tf, candles[-1])
 
         # Update BTC cache
         if symbol == "BTC/USDT":
-            self.btc_cache["15m"] = candles
-            if not self._btc_data_ready and len(candles) >= 50:
-                self._btc_data_ready = True
-            self._create_task(self._update_regime(), "regime")
+            if not self._btc_ready_flag:
+                self._refresh_btc_ready()
+            now = time.monotonic()
+            if now - self._last_regime_at >= REGIME_MIN_INTERVAL_S:
+                self._last_regime_at = now
+                self._create_task(self._update_regime(), "regime")
+            return
+
+        # Analysis (REST fan-out, filters, Telegram) consumer task-এ — WS reader free
+        # শুধু symbol queue হয়; consumer cache থেকে latest candles পড়ে।
+        # Already pending হলে skip — duplicate entry মানে একই close-এ আবার full analysis
+        if symbol in self._candle_pending:
             return
+        if self._candle_q.full():
+            # Pending guard-এর কারণে oldest entry সবসময় অন্য symbol
+            self._candles_dropped += 1
+            dropped_symbol = self._candle_q.get_nowait()
+            self._candle_pending.discard(dropped_symbol)
+            logger.warning("⚠️ Candle queue full — dropped stale %s analysis", dropped_symbol)
+        self._candle_pending.add(symbol)
+        self._candle_q.put_nowait(symbol)
+
+    async def _candle_consumer(self):
+        """Drain queued candle closes serially through the analysis pipeline"""
+        while True:
+            symbol = await self._candle_q.get()
+            # Read-এর আগে clear — analysis চলাকালীন নতুন close আবার queue হতে পারে
+            self._candle_pending.discard(symbol)
+            try:
+                candles = self.cache.get_ohlcv(symbol, _TF_15M)
+                if candles:
+                    await self._analyze_symbol(symbol, candles)
+            except Exception as e:
+                logger.error(f"❌ Analysis failed {symbol}: {e}", exc_info=True)
 
-        await self._analyze_symbol(symbol, candles)
+    def _on_stream_update(self, symbol: str, kind: str, payload: Any):
+        """WS push (funding / depth) → CacheManager; _build_data_packet reads these"""
+        if kind == "funding":
+            self.cache.set_funding(symbol, payload)
+        elif kind == "orderbook":
+            self.cache.set_orderbook(symbol, payload)
+
+    async def _analyze_symbol(self, symbol: str, candles: List[List[float]],
+                              tick_ts: Optional[float] = None):
+        """
+        Full analysis pipeline for a symbol.
+        tick_ts: closed candle-এর timestamp (epoch s) — না দিলে candles[-1] থেকে।
+        """
+        if tick_ts is None:
+            tick_ts = candles[-1][0] / 1000.0
 
-    async def _analyze_symbol(self, symbol: str, candles: List[List[float]]):
-        """Full analysis pipeline for a symbol"""
         if not self._btc_data_ready:
-            logger.debug(f"BTC not ready — skipping {symbol}")
+            logger.debug("BTC not ready — skipping %s", symbol)
             return
 
         # Check daily limits
         if self.state.state.get("is_daily_locked"):
             return
 
-        max_signals = config.MAX_SIGNALS_PER_DAY.get(
-            self.market_type.value, config.MAX_SIGNALS_PER_DAY["default"]
-        )
-        if self.daily_signals >= max_signals:
+        if self.daily_signals >= self._daily_limit_cached:
             return
 
         # Cooldown check
         last = self.last_signal_time.get(symbol)
-        if last:
-            elapsed = (datetime.now() - last).total_seconds() / 60
-            if elapsed < config.COOLDOWN_MINUTES:
-                return
+        if last is not None and tick_ts - last < self._cooldown_s:
+            return
 
         # Risk check
         can_trade, reason = self.risk_manager.can_trade(symbol, self.market_type)
         if not can_trade:
-            logger.debug(f"Risk blocked {symbol}: {reason}")
+            logger.debug("Risk blocked %s: %s", symbol, reason)
             return
 
         # Build data packet
@@ -259,7 +357,7 @@ class ArunabhaEngine:
         )
 
         if not filter_result.get("passed"):
-            logger.debug(f"Filters failed {symbol}: {filter_result.get('reason')}")
+            logger.debug("Filters failed %s: %s", symbol, filter_result.get("reason"))
             return
 
         # Generate signal
@@ -267,9 +365,9 @@ class ArunabhaEngine:
         if not signal:
             return
 
-        await self._process_signal(signal)
+        await self._process_signal(signal, tick_ts)
 
-    async def _process_signal(self, signal: Dict):
+    async def _process_signal(self, signal: Dict, tick_ts: float):
         """Process signal — paper trading aware, session-aware sizing"""
         drawdown_pct = self.state.current_drawdown_pct
 
@@ -314,7 +412,7 @@ class ArunabhaEngine:
         # দিনে max signal limit bypass হতে পারত
         self.state.state["daily_signals_count"] = self.daily_signals
         self.state._save()
-        self.last_signal_time[symbol] = datetime.now()
+        self.last_signal_time[symbol] = tick_ts
 
         # Entry zone (calculate before sending)
         entry_zone = self.state.get_entry_zone(signal["entry"], direction)
@@ -323,7 +421,7 @@ class ArunabhaEngine:
         # ISSUE 12 FIX: Validate current price is still in entry zone
         # (price may have moved since signal was generated)
         try:
-            ohlcv_now = self.cache.get_ohlcv(symbol, "15m")
+            ohlcv_now = self.cache.get_ohlcv(symbol, _TF_15M)
             if ohlcv_now:
                 current_price = float(ohlcv_now[-1][4])
                 zone_ok, zone_msg = self.state.check_entry_zone_valid(signal, current_price)
@@ -363,9 +461,8 @@ class ArunabhaEngine:
         ISSUE 19 FIX: Session multipliers from config (not hardcoded)
         config.SESSION_SIZE_MULTIPLIERS can be hot-reloaded via /reload
         """
-        import pytz
         mults = config.SESSION_SIZE_MULTIPLIERS
-        now = datetime.now(pytz.timezone("Asia/Kolkata"))
+        now = datetime.now(IST_TZ)
         hour = now.hour
 
         if self.market_type == MarketType.HIGH_VOL:
@@ -463,11 +560,12 @@ class ArunabhaEngine:
         self.state.reset_daily()
         self.risk_manager.reset_daily()
         self.daily_signals = 0
+        self._recompute_limits()
         logger.info("📅 Daily counters reset")
 
     def get_status(self) -> Dict:
         state_status = self.state.get_full_status()
-        btc_candles = len(self.cache.get_ohlcv("BTC/USDT", Timeframes.M15.value))
+        btc_candles = len(self.cache.get_ohlcv_view("BTC/USDT", _TF_15M))
         ws_status = self.ws_manager.get_status()
         return {
             **state_status,
@@ -479,6 +577,10 @@ class ArunabhaEngine:
             "paper_trading": self.paper_trading,
             "paper_pnl": round(self._paper_pnl, 2) if self.paper_trading else None,
             "adaptive_threshold": round(self._adaptive_threshold, 1),
+            "daily_limit": self._daily_limit_cached,
+            "rest_errors": self.rest_errors,
+            "candle_queue": self._candle_q.qsize(),
+            "candles_dropped": self._candles_dropped,
             "ws_connected": ws_status.get("connected"),
             "ws_last_message_ago": ws_status.get("last_message_seconds_ago"),
             "ws_reconnects": ws_status.get("total_reconnects"),
@@ -487,35 +589,75 @@ class ArunabhaEngine:
 
     # ── Internal helpers ─────────────────────────────────────────────────────
 
-    async def _seed_cache(self):
-        for symbol in config.TRADING_PAIRS:
-            for tf in ["15m", "1h", "4h"]:
+    async def _fetch_pool(self, pairs, tfs, limit: int) -> Dict[Tuple[str, str], List]:
+        """
+        Bulk REST fan-out: (symbol, tf) job queue + K worker, K = MAX_CONCURRENT_REQUESTS।
+        মোট সময় sum-of-RTT থেকে ~max-of-RTT; worker count নিজেই rate limit bound।
+        Error বা empty result (fetch_ohlcv_rest error-এ [] ফেরায়) হলে rest_errors বাড়ে,
+        job-এর result শুধু missing থাকে।
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for symbol in pairs:
+            for tf in tfs:
+                queue.put_nowait((symbol, tf))
+        results: Dict[Tuple[str, str], List] = {}
+
+        async def worker():
+            while not queue.empty():
+                symbol, tf = queue.get_nowait()
                 try:
-                    candles = await self.rest_client.fetch_ohlcv_rest(symbol, tf, 200)
+                    candles = await self.rest_client.fetch_ohlcv_rest(symbol, tf, limit)
                     if candles:
-                        self.cache.set_ohlcv(symbol, tf, candles)
+                        results[(symbol, tf)] = candles
+                    else:
+                        # rest_client error log করে [] ফেরায় — exception আসে না
+                        self.rest_errors += 1
                 except Exception as e:
-                    logger.warning(f"Cache seed failed {symbol} {tf}: {e}")
+                    self.rest_errors += 1
+                    logger.warning(f"REST fetch failed {symbol} {tf}: {e}")
+
+        n_workers = min(config.MAX_CONCURRENT_REQUESTS, queue.qsize())
+        await asyncio.gather(*(worker() for _ in range(n_workers)))
+        return results
+
+    async def _seed_cache(self):
+        # BTC আগে — regime detection এর priority
+        others = [s for s in config.TRADING_PAIRS if s != "BTC/USDT"]
+        for pairs in (["BTC/USDT"], others):
+            for (symbol, tf), candles in (await self._fetch_pool(pairs, _SEED_TFS, 200)).items():
+                self.cache.set_ohlcv(symbol, tf, candles)
 
     async def _force_fetch_btc_data(self) -> bool:
-        symbol = "BTC/USDT"
+        """
+        Startup path আর _background_btc_fetcher দুজনেই এটা call করে।
+        একটাই in-flight fetch থাকবে — দ্বিতীয় caller সেই task-এর result await করে,
+        নতুন করে 3টা REST call (ও 429 risk) করে না।
+        """
+        task = self._btc_fetch_inflight
+        if task is None or task.done():
+            task = asyncio.create_task(self._fetch_btc_once(), name="btc_fetch")
+            self._btc_fetch_inflight = task
         try:
-            for tf in ["15m", "1h", "4h"]:
-                candles = await self.rest_client.fetch_ohlcv_rest(symbol, tf, 300)
-                if candles:
-                    self.btc_cache[tf] = candles
-                    self.cache.set_ohlcv(symbol, tf, candles)
-            self._btc_data_ready = True
-            return True
-        except Exception as e:
-            logger.error(f"BTC fetch failed: {e}")
-            return False
+            # shield: একজন caller cancel হলে shared fetch বাকিদের জন্য চলতে থাকে
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._btc_fetch_inflight is task:
+                self._btc_fetch_inflight = None
+
+    async def _fetch_btc_once(self) -> bool:
+        symbol = "BTC/USDT"
+        # 15m/1h/4h এক round-এ — আগে তিনটে serial await ছিল
+        results = await self._fetch_pool([symbol], _SEED_TFS, 300)
+        for (_, tf), candles in results.items():
+            self.cache.set_ohlcv(symbol, tf, candles)
+        self._refresh_btc_ready()
+        return self._btc_ready_flag
 
     async def _force_fetch_all_pairs(self):
         for symbol in config.TRADING_PAIRS:
             if symbol == "BTC/USDT":
                 continue
-            for tf in ["15m", "1h"]:
+            for tf in [_TF_15M, _TF_1H]:
                 try:
                     candles = await self.rest_client.fetch_ohlcv_rest(symbol, tf, 200)
                     if candles:
@@ -525,13 +667,19 @@ class ArunabhaEngine:
                     logger.warning(f"Fetch failed {symbol} {tf}: {e}")
 
     async def _background_btc_fetcher(self):
+        """
+        WS BTC 15m candle দিয়ে ready হলে event set হয় — তখন REST লাগে না।
+        Backoff window-এ event না এলে তবেই REST fetch।
+        """
         while not self._btc_data_ready:
-            self._btc_fetch_attempts += 1
-            ok = await self._force_fetch_btc_data()
-            if ok:
+            wait = min(30 * max(self._btc_fetch_attempts, 1), 300)
+            try:
+                await asyncio.wait_for(self._btc_ready_event.wait(), timeout=wait)
                 break
-            wait = min(30 * self._btc_fetch_attempts, 300)
-            await asyncio.sleep(wait)
+            except asyncio.TimeoutError:
+                self._btc_fetch_attempts += 1
+                if await self._force_fetch_btc_data():
+                    break
 
     async def _update_regime(self):
         """
@@ -540,12 +688,12 @@ class ArunabhaEngine:
         তাই detect() call করলেও কাজ করবে।
         কিন্তু explicitly correct methods call করছি।
         """
-        btc_15m = self.btc_cache.get("15m", [])
+        btc_15m = self.btc_ohlcv(_TF_15M)
         if len(btc_15m) < 50:
             return
 
-        btc_1h = self.btc_cache.get("1h", [])
-        btc_4h = self.btc_cache.get("4h", [])
+        btc_1h = self.btc_ohlcv(_TF_1H)
+        btc_4h = self.btc_ohlcv(_TF_4H)
 
         try:
             # detect_btc_regime() needs 15m + 1h + 4h
@@ -573,11 +721,13 @@ class ArunabhaEngine:
             logger.error(f"_update_regime error: {e}")
             # Keep last known regime on error
 
+        self._recompute_limits()
+
     async def _build_data_packet(self, symbol: str, candles: List) -> Optional[Dict]:
         """Build full data packet — includes btc_ohlcv for Tier3 correlation fix"""
         try:
-            ohlcv_1h = self.cache.get_ohlcv(symbol, "1h") or []
-            ohlcv_4h = self.cache.get_ohlcv(symbol, "4h") or []
+            ohlcv_1h = self.cache.get_ohlcv(symbol, _TF_1H) or []
+            ohlcv_4h = self.cache.get_ohlcv(symbol, _TF_4H) or []
 
             sd = StructureDetector()
             struct = sd.detect(candles)
@@ -586,22 +736,44 @@ class ArunabhaEngine:
             # Fetch sentiment data async
             try:
                 from data.sentiment_fetcher import fetch_all_sentiment
-                sentiment_data = await fetch_all_sentiment()
+                sentiment_coro = fetch_all_sentiment()
             except Exception:
-                sentiment_data = None
+                sentiment_coro = asyncio.sleep(0, result=None)
 
             # ✅ FIX OI/FUNDING: Real API calls দিয়ে live data আনো
             # আগে hardcoded 0 ছিল — Tier2 funding_rate ও open_interest filter
             # কোনো real signal পাচ্ছিল না, সবসময় "neutral" দেখাচ্ছিল
-            funding_rate = 0.0
-            open_interest_data = {}
-            try:
-                funding_rate = await self.rest_client.fetch_funding_rate(symbol)
-            except Exception as e:
-                logger.debug(f"Funding rate fetch skipped {symbol}: {e}")
+            # Funding + orderbook WS stream থেকে cache-এ আসে (zero RTT);
+            # REST শুধু cold start-এ, যতক্ষণ না প্রথম push আসে।
+            # Binance OI-এর কোনো WS stream নেই — তাই OI সবসময় REST।
+            # WS disconnected হলে cache stale — তখন REST
+            ws_live = self.ws_manager.is_connected()
+            cached_funding = self.cache.get_funding(symbol) if ws_live else None
+            cached_ob = self.cache.get_orderbook(symbol)
+            have_ob = ws_live and bool(cached_ob.get("bids")) and bool(cached_ob.get("asks"))
+
+            sentiment_data, funding_rate, oi_current, orderbook = await asyncio.gather(
+                sentiment_coro,
+                asyncio.sleep(0, result=cached_funding) if cached_funding is not None
+                else self.rest_client.fetch_funding_rate(symbol),
+                self.rest_client.fetch_open_interest(symbol),
+                asyncio.sleep(0, result=cached_ob) if have_ob
+                else self.rest_client.fetch_orderbook(symbol),
+                return_exceptions=True
+            )
+            if isinstance(sentiment_data, Exception):
+                sentiment_data = None
+            if isinstance(funding_rate, Exception):
+                logger.debug("Funding rate fetch skipped %s: %s", symbol, funding_rate)
+                funding_rate = 0.0
+            if isinstance(orderbook, Exception):
+                logger.debug("Orderbook fetch skipped %s: %s", symbol, orderbook)
+                orderbook = {}
 
-            try:
-                oi_current = await self.rest_client.fetch_open_interest(symbol)
+            open_interest_data = {}
+            if isinstance(oi_current, Exception):
+                logger.debug("OI fetch skipped %s: %s", symbol, oi_current)
+            else:
                 # OI change % calculate করতে cached previous value দরকার
                 oi_prev_key = f"oi_prev_{symbol}"
                 oi_prev = self.state.state.get(oi_prev_key, oi_current)
@@ -613,20 +785,23 @@ class ArunabhaEngine:
                     "previous": oi_prev,
                     "change_pct": round(oi_change_pct, 2),
                 }
-            except Exception as e:
-                logger.debug(f"OI fetch skipped {symbol}: {e}")
 
             return {
-                "ohlcv": {"15m": candles, "1h": ohlcv_1h, "4h": ohlcv_4h},
+                "ohlcv": {_TF_15M: candles, _TF_1H: ohlcv_1h, _TF_4H: ohlcv_4h},
+                # O(1) per new candle — filter-এ পুরো window থেকে EMA আবার নয়
+                "ema": {
+                    tf: {p: self.cache.get_ema(symbol, tf, p) for p in LIVE_EMA_PERIODS}
+                    for tf in _SEED_TFS
+                },
                 "btc_ohlcv": {          # ← FIXED: passed to Tier3 correlation
-                    "15m": self.btc_cache.get("15m", []),
-                    "1h": self.btc_cache.get("1h", []),
+                    _TF_15M: self.btc_ohlcv(_TF_15M),
+                    _TF_1H: self.btc_ohlcv(_TF_1H),
                 },
                 "direction": direction,
                 "structure": struct,
-                "funding_rate": funding_rate,        # ✅ Real API
+                "funding_rate": funding_rate,        # ✅ WS stream / REST fallback
                 "open_interest": open_interest_data, # ✅ Real API with change_pct
-                "orderbook": {},
+                "orderbook": orderbook,
                 "fear_index": 50,
                 "sentiment": sentiment_data,   # ← passed to Tier1/Tier2 sentiment
             }
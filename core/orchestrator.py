@@ -4,7 +4,7 @@ Coordinates Engine + Scheduler + Telegram for webhook and manual triggers
 """
 
 import logging
-from typing import Dict, Optional, Any
+from typing import Awaitable, Callable, Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
@@ -19,53 +19,62 @@ class Orchestrator:
         self.engine = engine
         self.scheduler = scheduler
         self.telegram = telegram
+        # webhook type → handler; if/elif chain-এর বদলে একটাই dict lookup
+        self._webhook_dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict]]] = {
+            "scan": self._wh_scan,
+            "force_signal": self._wh_force_signal,
+            "status": self._wh_status,
+            "reset_daily": self._wh_reset_daily,
+            "regime_update": self._wh_regime_update,
+        }
         logger.info("✅ Orchestrator initialized")
 
     async def process_webhook(self, data: Dict[str, Any]) -> Dict:
         """
         Handle incoming webhook data.
-        Supported types: 'scan', 'force_signal', 'status', 'reset'
+        Supported types: 'scan', 'force_signal', 'status', 'reset_daily', 'regime_update'
         """
         event_type = data.get("type", "unknown")
         logger.info(f"📡 Orchestrator processing webhook: {event_type}")
 
-        try:
-            if event_type == "scan":
-                symbol = data.get("symbol")
-                if symbol:
-                    await self.engine._force_fetch_all_pairs()
-                    return {"status": "scan_triggered", "symbol": symbol}
-                else:
-                    await self.engine._force_fetch_all_pairs()
-                    return {"status": "full_scan_triggered"}
-
-            elif event_type == "force_signal":
-                symbol = data.get("symbol", "BTC/USDT")
-                direction = data.get("direction")
-                logger.info(f"🔔 Force signal: {symbol} {direction}")
-                return {"status": "force_signal_acknowledged", "symbol": symbol}
-
-            elif event_type == "status":
-                status = self.engine.get_status()
-                return {"status": "ok", "engine": status}
-
-            elif event_type == "reset_daily":
-                self.engine.reset_daily()
-                logger.info("🔄 Daily reset triggered via webhook")
-                return {"status": "daily_reset_done"}
-
-            elif event_type == "regime_update":
-                await self.engine._update_regime()
-                return {"status": "regime_updated"}
-
-            else:
-                logger.warning(f"Unknown webhook type: {event_type}")
-                return {"status": "unknown_event", "type": event_type}
+        handler = self._webhook_dispatch.get(event_type)
+        if handler is None:
+            logger.warning(f"Unknown webhook type: {event_type}")
+            return {"status": "unknown_event", "type": event_type}
 
+        try:
+            return await handler(data)
         except Exception as e:
             logger.error(f"❌ Webhook processing error: {e}", exc_info=True)
             return {"status": "error", "message": str(e)}
 
+    # ==================== Webhook handlers ====================
+
+    async def _wh_scan(self, data: Dict[str, Any]) -> Dict:
+        symbol = data.get("symbol")
+        await self.engine._force_fetch_all_pairs()
+        if symbol:
+            return {"status": "scan_triggered", "symbol": symbol}
+        return {"status": "full_scan_triggered"}
+
+    async def _wh_force_signal(self, data: Dict[str, Any]) -> Dict:
+        symbol = data.get("symbol", "BTC/USDT")
+        direction = data.get("direction")
+        logger.info(f"🔔 Force signal: {symbol} {direction}")
+        return {"status": "force_signal_acknowledged", "symbol": symbol}
+
+    async def _wh_status(self, data: Dict[str, Any]) -> Dict:
+        return {"status": "ok", "engine": self.engine.get_status()}
+
+    async def _wh_reset_daily(self, data: Dict[str, Any]) -> Dict:
+        self.engine.reset_daily()
+        logger.info("🔄 Daily reset triggered via webhook")
+        return {"status": "daily_reset_done"}
+
+    async def _wh_regime_update(self, data: Dict[str, Any]) -> Dict:
+        await self.engine._update_regime()
+        return {"status": "regime_updated"}
+
     async def handle_command(self, command: str, args: Dict = None) -> str:
         """Handle Telegram bot commands"""
         args = args or {}
@@ -20,15 +20,19 @@ FIXES:
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Callable
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
-import pytz
 
 import config
-from core.constants import SessionType
+from core.constants import SessionType, SESSION_HOURS, IST_OFFSET_S, IST_TZ
 
 logger = logging.getLogger(__name__)
 
+# Fixed UTC+5:30 stdlib tzinfo — pytz বাদ
+_IST = IST_TZ
+
 
 class TradingScheduler:
     """
@@ -39,7 +43,31 @@ class TradingScheduler:
         self.engine = engine
         self.tasks: List[asyncio.Task] = []
         self.running = False
-        self.timezone = pytz.timezone('Asia/Kolkata')
+        self.timezone = _IST
+
+        # IST hour → session, একবারই build (first match in enum order; gap hours = None)
+        self._session_table: List[Optional[SessionType]] = [None] * 24
+        for session in reversed(SessionType):
+            start, end = SESSION_HOURS[session.value]
+            self._session_table[start:end] = [session] * (end - start)
+        # Session list sorted by start hour — _get_next_session bisect করে
+        # (name, start, "HH:00" start, "HH:00" end); আগে প্রতি call-এ list-of-dicts + sort
+        self._session_rows = tuple(
+            (s.value, start, f"{start:02d}:00", f"{end:02d}:00")
+            for s, (start, end) in sorted(
+                ((s, SESSION_HOURS[s.value]) for s in SessionType), key=lambda x: x[1][0]
+            )
+        )
+        self._session_starts = tuple(row[1] for row in self._session_rows)
+
+        # (epoch IST hour, session) — একই ঘণ্টার মধ্যে repeat call O(1)
+        self._session_cache: Tuple[Optional[int], Optional[SessionType]] = (None, None)
+
+        # (config.AVOID_HOURS_MASK, trading-hour mask) — /reload-এ avoid mask বদলালে rebuild
+        self._trading_mask: Tuple[Optional[int], int] = (None, 0)
+
+        # (epoch IST minute, clock-derived session info) — health/status poll একই minute-এ reuse
+        self._session_info_cache: Tuple[Optional[int], Dict] = (None, {})
 
         # Session callbacks
         self.session_callbacks: Dict[SessionType, List[Callable]] = {
@@ -79,6 +107,8 @@ class TradingScheduler:
         self.tasks.append(asyncio.create_task(self._periodic_htf_refresh()))
 
         for task_config in self.scheduled_tasks:
+            # "HH:MM" একবারই parse — _run_scheduled শুধু now.replace() করে
+            task_config["_hm"] = tuple(map(int, task_config["time"].split(":")))
             self.tasks.append(asyncio.create_task(
                 self._run_scheduled(task_config)
             ))
@@ -93,14 +123,21 @@ class TradingScheduler:
         logger.info("Scheduler stopped")
 
     async def _main_loop(self):
-        """Main scheduler loop — runs every minute"""
+        """
+        Main scheduler loop — পরের hour boundary পর্যন্ত sleep, তারপর hourly log।
+        আগে প্রতি মিনিটে wake করত (দিনে 1440 বার), কাজ হত শুধু minute == 0 তে।
+        """
         while self.running:
             try:
+                now = datetime.now(self.timezone)
+                await asyncio.sleep(3600 - (now.minute * 60 + now.second + now.microsecond / 1e6))
+
+                if not self.running:
+                    break
+
                 now = datetime.now(self.timezone)
                 current_session = self._get_current_session()
-                if now.minute == 0:
-                    logger.info(f"⏰ {now.strftime('%H:%M')} IST | Session: {current_session}")
-                await asyncio.sleep(60)
+                logger.info(f"⏰ {now.strftime('%H:%M')} IST | Session: {current_session}")
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -158,27 +195,27 @@ class TradingScheduler:
         এখন: সব datetime aware রাখা হয়েছে, astimezone() ব্যবহার করা হচ্ছে
         """
         target_time_str = task_config["time"]
-        target_hour, target_minute = map(int, target_time_str.split(":"))
+        target_hour, target_minute = task_config["_hm"]
 
-        while self.running:
-            try:
-                # ✅ FIX: সবসময় aware datetime ব্যবহার করো
-                now = datetime.now(self.timezone)
+        # ✅ FIX: সবসময় aware datetime ব্যবহার করো
+        now = datetime.now(self.timezone)
 
-                # আজকের target time (timezone-aware)
-                target = now.replace(
-                    hour=target_hour,
-                    minute=target_minute,
-                    second=0,
-                    microsecond=0
-                )
+        # আজকের target time (timezone-aware)
+        target = now.replace(
+            hour=target_hour,
+            minute=target_minute,
+            second=0,
+            microsecond=0
+        )
 
-                # Target পার হয়ে গেলে কালকের জন্য set করো
-                if now >= target:
-                    target = target + timedelta(days=1)
+        # Target পার হয়ে গেলে কালকের জন্য set করো
+        if now >= target:
+            target = target + timedelta(days=1)
 
+        while self.running:
+            try:
                 # ✅ FIX: দুটোই aware datetime, তাই comparison safe
-                wait_seconds = (target - now).total_seconds()
+                wait_seconds = max((target - datetime.now(self.timezone)).total_seconds(), 0.0)
 
                 logger.debug(
                     f"⏳ Task '{task_config['name']}' scheduled in "
@@ -190,6 +227,10 @@ class TradingScheduler:
                 if not self.running:
                     break
 
+                # পরের run ঠিক 1 দিন পর — scheduled target থেকে advance করা হয়,
+                # তাই একই minute-এ double execute অসম্ভব (আগের 61s guard লাগে না)
+                target = target + timedelta(days=1)
+
                 logger.info(f"📅 Running scheduled task: {task_config['name']}")
 
                 if "session" in task_config:
@@ -197,23 +238,23 @@ class TradingScheduler:
                 else:
                     await task_config["callback"]()
 
-                # 61 seconds wait করো যাতে একই minute এ double execute না হয়
-                await asyncio.sleep(61)
-
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"❌ Scheduled task '{task_config['name']}' error: {e}")
                 await asyncio.sleep(60)
 
-    def _get_current_session(self) -> Optional[SessionType]:
-        """Get current trading session based on IST hour"""
-        hour = datetime.now(self.timezone).hour
-        for session in SessionType:
-            start, end = session.hours
-            if start <= hour < end:
-                return session
-        return None
+    @staticmethod
+    def _ist_epoch_hour() -> int:
+        """Hours since epoch in IST — date+hour একসাথে; no tz localize per call"""
+        return int((time.time() + IST_OFFSET_S) // 3600)
+
+    def _get_current_session(self, epoch_hour: Optional[int] = None) -> Optional[SessionType]:
+        """Get current trading session based on IST hour (memoized per hour)"""
+        key = self._ist_epoch_hour() if epoch_hour is None else epoch_hour
+        if key != self._session_cache[0]:
+            self._session_cache = (key, self._session_table[key % 24])
+        return self._session_cache[1]
 
     # ✅ FIX BUG-1: Periodic HTF (1h/4h) BTC cache refresh
     async def _periodic_htf_refresh(self):
@@ -272,7 +313,8 @@ class TradingScheduler:
         try:
             if self.engine.telegram:
                 start_h, end_h = session.hours
-                await self.engine.telegram.send_message(
+                # Queued — একই tick-এর অন্য notification-এর সাথে batch হয়
+                await self.engine.telegram.send_message_queued(
                     f"🕐 <b>{session.value.upper()} session started</b>\n"
                     f"⏰ Active: {start_h:02d}:00 – {end_h:02d}:00 IST\n"
                     f"📊 Market: {self.engine.market_type.value}"
@@ -293,64 +335,67 @@ class TradingScheduler:
         self.session_callbacks[session].append(callback)
         logger.debug(f"Callback registered for {session.value} session")
 
-    def is_trading_time(self) -> bool:
+    def _trading_hours_mask(self) -> int:
+        """24-bit mask: bit h set iff hour h has a live (non-DEAD) session and is not an avoid hour"""
+        avoid = config.AVOID_HOURS_MASK
+        src, mask = self._trading_mask
+        if src != avoid:
+            mask = 0
+            for hour, session in enumerate(self._session_table):
+                if session is not None and session != SessionType.DEAD and not (avoid >> hour) & 1:
+                    mask |= 1 << hour
+            self._trading_mask = (avoid, mask)
+        return mask
+
+    def is_trading_time(self, epoch_hour: Optional[int] = None) -> bool:
         """Check if current time is suitable for trading"""
-        session = self._get_current_session()
-        if not session or session == SessionType.DEAD:
-            return False
-
-        hour = datetime.now(self.timezone).hour
-        for start, end, _ in config.AVOID_TIMES:
-            # ✅ Handle midnight crossing properly (e.g. 23:00–01:00)
-            if start > end:
-                if hour >= start or hour < end:
-                    return False
-            else:
-                if start <= hour < end:
-                    return False
-
-        return True
+        # ✅ Session + avoid windows (midnight-crossing সহ) একটাই mask-এ — shift-and-test
+        hour = (self._ist_epoch_hour() if epoch_hour is None else epoch_hour) % 24
+        return bool(self._trading_hours_mask() >> hour & 1)
 
     def get_session_info(self) -> Dict:
         """Get current session information"""
-        now = datetime.now(self.timezone)
-        session = self._get_current_session()
-
+        # একটাই clock read — সব sub-call একই "now" দেখে
+        epoch_min = int((time.time() + IST_OFFSET_S) // 60)
+        key, info = self._session_info_cache
+        if key != epoch_min:
+            # Clock-derived fields minute-এ একবারই compute
+            epoch_hour = epoch_min // 60
+            hour = epoch_hour % 24
+            session = self._get_current_session(epoch_hour)
+            info = {
+                "current_session": session.value if session else "none",
+                "hour_ist": hour,
+                "time_ist": f"{hour:02d}:{epoch_min % 60:02d}",
+                "is_trading_time": self.is_trading_time(epoch_hour),
+                "next_session": self._get_next_session(epoch_hour),
+            }
+            self._session_info_cache = (epoch_min, info)
+
+        # Live fields প্রতি call-এ fresh
         return {
-            "current_session": session.value if session else "none",
-            "hour_ist": now.hour,
-            "time_ist": now.strftime("%H:%M"),
-            "is_trading_time": self.is_trading_time(),
-            "next_session": self._get_next_session(),
+            **info,
             "scheduler_running": self.running,
-            "active_tasks": len([t for t in self.tasks if not t.done()])
+            "active_tasks": sum(not t.done() for t in self.tasks)
         }
 
-    def _get_next_session(self) -> Optional[Dict]:
+    def _get_next_session(self, epoch_hour: Optional[int] = None) -> Optional[Dict]:
         """Get next upcoming trading session"""
-        current_hour = datetime.now(self.timezone).hour
-
-        # Build session list sorted by start hour
-        sessions = sorted(
-            [{"name": s.value, "start": s.hours[0], "end": s.hours[1]} for s in SessionType],
-            key=lambda x: x["start"]
-        )
+        current_hour = (self._ist_epoch_hour() if epoch_hour is None else epoch_hour) % 24
+
+        # Find next session after current hour (bisect over precomputed starts)
+        i = bisect_right(self._session_starts, current_hour)
+        if i < len(self._session_rows):
+            name, start, start_ist, end_ist = self._session_rows[i]
+            hours_away = start - current_hour
+        else:
+            # Wrap around to tomorrow's first session
+            name, start, start_ist, end_ist = self._session_rows[0]
+            hours_away = (24 - current_hour) + start
 
-        # Find next session after current hour
-        for s in sessions:
-            if s["start"] > current_hour:
-                return {
-                    "name": s["name"],
-                    "start_ist": f"{s['start']:02d}:00",
-                    "end_ist": f"{s['end']:02d}:00",
-                    "hours_away": s["start"] - current_hour
-                }
-
-        # Wrap around to tomorrow's first session
-        first = sessions[0]
         return {
-            "name": first["name"],
-            "start_ist": f"{first['start']:02d}:00",
-            "end_ist": f"{first['end']:02d}:00",
-            "hours_away": (24 - current_hour) + first["start"]
+            "name": name,
+            "start_ist": start_ist,
+            "end_ist": end_ist,
+            "hours_away": hours_away
         }
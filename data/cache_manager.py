@@ -9,21 +9,163 @@ WINDOWS FIX (Issue 2):
   তখনও redis-py (sync) দিয়ে করা হবে, aioredis না
 
 ISSUE 6 (preserved): Redis reconnect with backoff
-ISSUE 14 (preserved): maxlen=200, LRU via deque
+ISSUE 14 (preserved): maxlen=200 per OHLCV key
+OHLCV: preallocated mirrored (2×200, 6) float64 ring buffer per key — get_ohlcv_array()
+       vectorized consumer-দের contiguous ndarray দেয়, get_ohlcv() list API অপরিবর্তিত,
+       get_ohlcv_view() সবসময় read-only zero-copy view
 """
 
 import logging
 import json
 import asyncio
-from typing import Dict, List, Optional, Any
-from collections import deque
-from datetime import datetime
+import time
+from sys import intern
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timedelta
+
+import numpy as np
 
 import config
 
+try:
+    import orjson
+
+    def _redis_dumps(value: Any) -> bytes:
+        # ndarray (OHLCV buffer) + naive datetime orjson সরাসরি serialize করে
+        return orjson.dumps(
+            value, default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
+
+    _redis_loads = orjson.loads
+except ImportError:
+    def _redis_dumps(value: Any) -> str:
+        return json.dumps(
+            value, default=lambda o: o.tolist() if isinstance(o, np.ndarray) else str(o)
+        )
+
+    _redis_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 CACHE_MAXLEN = 200
+OHLCV_COLS = 6  # timestamp, open, high, low, close, volume
+# float64 রাখা হয়েছে, float32 নয়: column 0 epoch-ms timestamp (~1.7e12) —
+# float32-এর 24-bit mantissa-য় সেটা ~2 মিনিট granularity-তে round হয়ে যায়,
+# আর indicator code rows-কে Python float (64-bit) হিসেবেই পড়ে
+OHLCV_DTYPE = np.float64
+
+# Shared read-only miss values — miss-এ নতুন dict/list allocate হয় না
+_EMPTY_BOOK: Dict[str, tuple] = {"bids": (), "asks": ()}
+_EMPTY_TICKER: Dict[str, Any] = {}
+
+
+class OHLCVBuffer:
+    """
+    Fixed-capacity circular candle store over a preallocated float64 array.
+    head = পরের write slot; append O(1), কোনো row shift/memmove নেই।
+    Mirrored layout: প্রতিটা row slot s আর s + CACHE_MAXLEN দুই জায়গায় লেখা হয় —
+    তাই যেকোনো ≤ CACHE_MAXLEN window data-তে contiguous, ordered() wrap-এও
+    concatenate copy ছাড়াই view দেয়।
+    """
+
+    __slots__ = ("data", "head", "n", "last_update", "_ema")
+
+    def __init__(self):
+        self.data = np.empty((2 * CACHE_MAXLEN, OHLCV_COLS), dtype=OHLCV_DTYPE)
+        self.head = 0
+        self.n = 0
+        self.last_update: Optional[float] = None  # time.monotonic()
+        # period → (base row timestamp, EMA through that row) — live (last) row বাদে
+        self._ema: Dict[int, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return self.n
+
+    def set(self, candles):
+        # Slice first — REST 300-row BTC fetch-এর বাড়তি 100 row convert হয় না
+        arr = np.asarray(candles[-CACHE_MAXLEN:], dtype=OHLCV_DTYPE)
+        if arr.ndim != 2 or not len(arr):
+            self.head = self.n = 0
+            return
+        arr = arr[:, :OHLCV_COLS]
+        self.n = len(arr)
+        self.data[:self.n] = arr
+        self.data[CACHE_MAXLEN:CACHE_MAXLEN + self.n] = arr
+        self.head = self.n % CACHE_MAXLEN
+
+    def upsert(self, candle: List[float]):
+        """Same open-time → replace last row, নতুন হলে append"""
+        last = (self.head - 1) % CACHE_MAXLEN
+        if self.n and int(candle[0]) == int(self.data[last, 0]):
+            self.data[last] = self.data[last + CACHE_MAXLEN] = candle[:OHLCV_COLS]
+            return
+        self.data[self.head] = self.data[self.head + CACHE_MAXLEN] = candle[:OHLCV_COLS]
+        self.head = (self.head + 1) % CACHE_MAXLEN
+        if self.n < CACHE_MAXLEN:
+            self.n += 1
+
+    def last_close(self) -> Optional[float]:
+        """Newest close — একটাই FP64 read, list copy নেই"""
+        return float(self.data[(self.head - 1) % CACHE_MAXLEN, 4]) if self.n else None
+
+    def ema(self, period: int) -> Optional[float]:
+        """
+        Incremental EMA of close — state শেষ closed row (n-2) পর্যন্ত রাখা হয়, live
+        last row প্রতি call-এ উপরে বসে। নতুন candle এলে শুধু নতুন row-গুলো apply
+        (সাধারণত 1টা) — O(1), পুরো window আবার নয়। State-এর base row buffer-এ
+        না পেলে (set()/window slide) একবার SMA seed থেকে rebuild।
+        """
+        n = self.n
+        if n < 2:
+            return None
+        data = self.data
+        first = self.head - n
+        last = n - 1
+        k = 2.0 / (period + 1)
+
+        start = None
+        state = self._ema.get(period)
+        if state is not None:
+            base_ts, base = state
+            j = last - 1
+            while j >= 0 and data[(first + j) % CACHE_MAXLEN, 0] > base_ts:
+                j -= 1
+            if j >= 0 and data[(first + j) % CACHE_MAXLEN, 0] == base_ts:
+                start = j + 1
+        if start is None:
+            # Seed = SMA of the first `period` closed rows (কম থাকলে যা আছে)
+            start = min(period, last)
+            base = float(self.ordered(copy=False)[:start, 4].mean())
+
+        for i in range(start, last):
+            base = float(data[(first + i) % CACHE_MAXLEN, 4]) * k + base * (1 - k)
+
+        self._ema[period] = (float(data[(first + last - 1) % CACHE_MAXLEN, 0]), base)
+        return float(data[(first + last) % CACHE_MAXLEN, 4]) * k + base * (1 - k)
+
+    def ordered(self, limit: Optional[int] = None, copy: bool = True) -> np.ndarray:
+        """
+        Oldest→newest rows (last `limit`)।
+        copy=False → সবসময় zero-copy read-only view (mirror-এর জন্য wrap-এও) —
+        পরের upsert-এ বদলে যেতে পারে, তাই শুধু await ছাড়া synchronous read-এর জন্য।
+        Mutate বা await পার করে রাখতে হলে copy=True।
+        """
+        k = min(limit, self.n) if limit else self.n
+        start = (self.head - k) % CACHE_MAXLEN
+        view = self.data[start:start + k]
+        if copy:
+            return view.copy()
+        view.flags.writeable = False
+        return view
+
+
+@dataclass(slots=True)
+class _Slot:
+    """Single latest value (orderbook/ticker/funding) + তার update time — এক record"""
+    value: Any
+    last_update: float  # time.monotonic()
 
 
 class CacheManager:
@@ -34,8 +176,11 @@ class CacheManager:
     """
 
     def __init__(self):
-        self._caches: Dict[str, deque] = {}
-        self._last_update: Dict[str, datetime] = {}
+        # Per-key record-এ timestamp থাকে — আলাদা _last_update dict নেই
+        self._ohlcv: Dict[str, OHLCVBuffer] = {}
+        self._singletons: Dict[str, _Slot] = {}
+        # (dtype, symbol, tf) → interned key — per-tick f-string format/hash নেই
+        self._key_cache: Dict[tuple, str] = {}
         self._hits = 0
         self._misses = 0
 
@@ -46,19 +191,27 @@ class CacheManager:
             and bool(getattr(config, "REDIS_URL", ""))
         )
         self._redis_connecting = False
+        # Reconnect task references — fire-and-forget task GC/exception loss এড়াতে
+        self._bg_tasks: set = set()
 
         # USE_REDIS=true হলেই try করো
         if self._redis_enabled:
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
-                    asyncio.create_task(self._connect_redis())
+                    self._spawn(self._connect_redis())
                 else:
                     loop.run_until_complete(self._connect_redis())
             except RuntimeError:
                 # No event loop yet — will connect lazily
                 pass
 
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
     async def _connect_redis(self):
         """
         Redis connect — aioredis নয়, redis-py async wrapper।
@@ -106,80 +259,124 @@ class CacheManager:
     # ── Key helpers ──────────────────────────────────────────────────
 
     def _get_key(self, symbol: str, tf: str, dtype: str = "ohlcv") -> str:
-        return f"{dtype}:{symbol}:{tf}"
-
-    def _ensure_cache(self, key: str):
-        if key not in self._caches:
-            self._caches[key] = deque(maxlen=CACHE_MAXLEN)
+        t = (dtype, symbol, tf)
+        key = self._key_cache.get(t)
+        if key is None:
+            # Interned — একই object সব dict-এ, lookup identity compare-এ শেষ
+            key = self._key_cache[t] = intern(f"{dtype}:{symbol}:{tf}")
+        return key
 
     # ── OHLCV ────────────────────────────────────────────────────────
 
     def set_ohlcv(self, symbol: str, tf: str, candles: List[List[float]]):
         key = self._get_key(symbol, tf)
-        self._ensure_cache(key)
-        self._caches[key].clear()
-        for c in candles[-CACHE_MAXLEN:]:
-            self._caches[key].append(c)
-        self._last_update[key] = datetime.now()
-        logger.debug(f"Cache SET {symbol} {tf}: {len(self._caches[key])} candles")
+        buf = self._ohlcv.get(key)
+        if buf is None:
+            buf = self._ohlcv[key] = OHLCVBuffer()
+        buf.set(candles)
+        buf.last_update = time.monotonic()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache SET %s %s: %d candles (last close %s)",
+                         symbol, tf, buf.n, buf.last_close())
 
     def get_ohlcv(
         self, symbol: str, tf: str, limit: Optional[int] = None
     ) -> List[List[float]]:
-        key = self._get_key(symbol, tf)
-        if key not in self._caches or not self._caches[key]:
+        # tolist() নিজেই নতুন list বানায় — আগে intermediate ndarray copy লাগে না
+        arr = self._ohlcv_rows(symbol, tf, limit, False)
+        return arr.tolist() if len(arr) else []
+
+    def get_ohlcv_array(
+        self, symbol: str, tf: str, limit: Optional[int] = None
+    ) -> np.ndarray:
+        """(N, 6) float64 copy — numpy indicator path-এর জন্য, list→array re-parse লাগে না"""
+        return self._ohlcv_rows(symbol, tf, limit, True)
+
+    def get_ohlcv_view(
+        self, symbol: str, tf: str, limit: Optional[int] = None
+    ) -> np.ndarray:
+        """Read-only (N, 6) view — len/last-row-only reader-রা copy ছাড়াই পড়ে"""
+        return self._ohlcv_rows(symbol, tf, limit, False)
+
+    def _ohlcv_rows(
+        self, symbol: str, tf: str, limit: Optional[int], copy: bool
+    ) -> np.ndarray:
+        buf = self._ohlcv.get(self._get_key(symbol, tf))
+        if buf is None or not buf.n:
             self._misses += 1
-            return []
+            return np.empty((0, OHLCV_COLS), dtype=OHLCV_DTYPE)
         self._hits += 1
-        data = list(self._caches[key])
-        return data[-limit:] if limit else data
+        return buf.ordered(limit, copy)
+
+    def get_ema(self, symbol: str, tf: str, period: int) -> Optional[float]:
+        """
+        Incrementally maintained close EMA (OHLCVBuffer.ema) — data নেই হলে None।
+        period ≥ CACHE_MAXLEN হলেও None: তখন streamed EMA আর window-এর উপর
+        calculate_ema (seed-only SMA) মেলে না, caller window থেকেই হিসাব করবে।
+        """
+        if period >= CACHE_MAXLEN:
+            return None
+        buf = self._ohlcv.get(self._get_key(symbol, tf))
+        return buf.ema(period) if buf is not None else None
 
     def update_ohlcv(self, symbol: str, tf: str, candle: List[float]):
         key = self._get_key(symbol, tf)
-        self._ensure_cache(key)
-        if (self._caches[key] and
-                int(candle[0]) == int(self._caches[key][-1][0])):
-            self._caches[key][-1] = candle
+        buf = self._ohlcv.get(key)
+        if buf is None:
+            buf = self._ohlcv[key] = OHLCVBuffer()
+        buf.upsert(candle)
+        buf.last_update = time.monotonic()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache UPSERT %s %s: %d candles (last close %s)",
+                         symbol, tf, buf.n, buf.last_close())
+
+    # ── Orderbook / Ticker / Funding (single latest value per key) ─────
+    # Slotted _Slot record — value + last_update এক lookup-এ, tick-এ in-place update
+
+    def _put(self, key: str, value: Any):
+        slot = self._singletons.get(key)
+        if slot is None:
+            self._singletons[key] = _Slot(value, time.monotonic())
         else:
-            self._caches[key].append(candle)
-        self._last_update[key] = datetime.now()
+            slot.value = value
+            slot.last_update = time.monotonic()
 
-    # ── Orderbook ─────────────────────────────────────────────────────
+    def _peek(self, key: str, default: Any = None) -> Any:
+        slot = self._singletons.get(key)
+        return default if slot is None else slot.value
 
     def set_orderbook(self, symbol: str, orderbook: Dict):
-        key = self._get_key(symbol, "ob", "ob")
-        self._caches[key] = deque([orderbook], maxlen=1)
-        self._last_update[key] = datetime.now()
+        self._put(self._get_key(symbol, "ob", "ob"), orderbook)
 
     def get_orderbook(self, symbol: str) -> Dict:
-        key = self._get_key(symbol, "ob", "ob")
-        if key not in self._caches or not self._caches[key]:
-            return {"bids": [], "asks": []}
-        return self._caches[key][0]
-
-    # ── Ticker ────────────────────────────────────────────────────────
+        return self._peek(self._get_key(symbol, "ob", "ob"), _EMPTY_BOOK)
 
     def set_ticker(self, symbol: str, ticker: Dict):
-        key = self._get_key(symbol, "tick", "tick")
-        self._caches[key] = deque([ticker], maxlen=1)
-        self._last_update[key] = datetime.now()
+        self._put(self._get_key(symbol, "tick", "tick"), ticker)
 
     def get_ticker(self, symbol: str) -> Dict:
-        key = self._get_key(symbol, "tick", "tick")
-        if key not in self._caches or not self._caches[key]:
-            return {}
-        return self._caches[key][0]
+        return self._peek(self._get_key(symbol, "tick", "tick"), _EMPTY_TICKER)
+
+    def set_funding(self, symbol: str, rate: float):
+        self._put(self._get_key(symbol, "fund", "fund"), rate)
+
+    def get_funding(self, symbol: str) -> Optional[float]:
+        return self._peek(self._get_key(symbol, "fund", "fund"))
 
     # ── Staleness ─────────────────────────────────────────────────────
 
     def get_last_update(self, symbol: str, tf: str) -> Optional[datetime]:
-        return self._last_update.get(self._get_key(symbol, tf))
+        """Display path — monotonic stamp থেকে wall-clock datetime শুধু এখানেই বানানো হয়"""
+        buf = self._ohlcv.get(self._get_key(symbol, tf))
+        if buf is None or buf.last_update is None:
+            return None
+        return datetime.now() - timedelta(seconds=time.monotonic() - buf.last_update)
 
     def is_stale(self, symbol: str, tf: str, max_age_seconds: int = 60) -> bool:
-        last = self.get_last_update(symbol, tf)
-        if not last:
+        buf = self._ohlcv.get(self._get_key(symbol, tf))
+        if buf is None or buf.last_update is None:
             return True
-        return (datetime.now() - last).total_seconds() > max_age_seconds
+        return time.monotonic() - buf.last_update > max_age_seconds
 
     # ── Redis helpers (only if enabled) ──────────────────────────────
 
@@ -187,29 +384,29 @@ class CacheManager:
         if not self.redis or not self._redis_enabled:
             return
         try:
-            await self.redis.setex(key, expire, json.dumps(value, default=str))
+            await self.redis.setex(key, expire, _redis_dumps(value))
         except Exception as e:
             logger.debug(f"Redis set error: {e} — reconnecting")
-            asyncio.create_task(self._connect_redis())
+            self._spawn(self._connect_redis())
 
     async def redis_get(self, key: str) -> Optional[Any]:
         if not self.redis or not self._redis_enabled:
             return None
         try:
             data = await self.redis.get(key)
-            return json.loads(data) if data else None
+            return _redis_loads(data) if data else None
         except Exception as e:
             logger.debug(f"Redis get error: {e} — reconnecting")
-            asyncio.create_task(self._connect_redis())
+            self._spawn(self._connect_redis())
             return None
 
     # ── Stats ─────────────────────────────────────────────────────────
 
     def size(self) -> Dict:
-        total = sum(len(q) for q in self._caches.values())
+        total = sum(len(b) for b in self._ohlcv.values())
         rate = self._hits / max(self._hits + self._misses, 1) * 100
         return {
-            "total_keys": len(self._caches),
+            "total_keys": len(self._singletons) + len(self._ohlcv),
             "total_candles": total,
             "hits": self._hits,
             "misses": self._misses,
@@ -224,12 +421,13 @@ class CacheManager:
         tf: Optional[str] = None
     ):
         if symbol and tf:
-            self._caches.pop(self._get_key(symbol, tf), None)
+            self._ohlcv.pop(self._get_key(symbol, tf), None)
         elif symbol:
-            to_del = [k for k in self._caches if f":{symbol}:" in k]
-            for k in to_del:
-                del self._caches[k]
+            for store in (self._singletons, self._ohlcv):
+                to_del = [k for k in store if f":{symbol}:" in k]
+                for k in to_del:
+                    del store[k]
         else:
-            self._caches.clear()
-            self._last_update.clear()
+            self._singletons.clear()
+            self._ohlcv.clear()
             self._hits = self._misses = 0
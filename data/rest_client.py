@@ -4,16 +4,66 @@ Handles all REST API calls to exchanges with backup support
 """
 
 import asyncio
+import hashlib
+import hmac
 import logging
+import time
 import aiohttp
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 import ccxt.async_support as ccxt
 import config
+from data.cache_manager import OHLCV_DTYPE
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 logger = logging.getLogger(__name__)
 
+# Timeframe mapping (module-level — আগে প্রতি call-এ dict literal তৈরি হত)
+_TF_MAP: Dict[str, str] = {
+    "1m": "1m", "5m": "5m", "15m": "15m", "30m": "30m",
+    "1h": "1h", "4h": "4h", "1d": "1d"
+}
+
+# Historical pagination page size (Binance klines max 1500)
+HIST_PAGE_LIMIT = 1000
+
+
+@lru_cache(maxsize=64)
+def _raw_symbol(symbol: str) -> str:
+    """সিম্বল ফরম্যাট ঠিক করা (RENDER/USDT → RENDERUSDT) — একবারই"""
+    return symbol.replace("/", "").upper()
+
+
+@dataclass(frozen=True)
+class _RequestDraft:
+    """
+    Pre-built request: url + static headers + HMAC state (secret already keyed).
+    প্রতি call-এ শুধু timestamp বসিয়ে signature — key schedule/header build আবার হয় না।
+    """
+    url: str
+    headers: Dict[str, str]
+    mac: Optional[Any] = None
+
+    def signed_url(self, params: str = "") -> str:
+        query = f"{params}&timestamp={int(time.time() * 1000)}" if params \
+            else f"timestamp={int(time.time() * 1000)}"
+        mac = self.mac.copy()
+        mac.update(query.encode())
+        return f"{self.url}?{query}&signature={mac.hexdigest()}"
+
 
 class RESTClient:
     """
@@ -27,6 +77,41 @@ class RESTClient:
         
         # Binance REST API base URL
         self.binance_rest_url = "https://api.binance.com/api/v3"
+
+        # Persistent keep-alive session — আগে প্রতি call-এ নতুন ClientSession
+        # মানে নতুন TCP + TLS handshake; gather fan-out এখন pooled connection reuse করে
+        self._http: Optional[aiohttp.ClientSession] = None
+
+        # (endpoint, symbol) → draft; build_draft() memoizes
+        self._drafts: Dict[Tuple[str, str], _RequestDraft] = {}
+
+    def build_draft(self, endpoint: str, symbol: str = "", base: Optional[str] = None,
+                    signed: bool = False) -> _RequestDraft:
+        key = (endpoint, symbol)
+        draft = self._drafts.get(key)
+        if draft is None:
+            headers = {"X-MBX-APIKEY": config.BINANCE_API_KEY} if signed else {}
+            mac = hmac.new(config.BINANCE_SECRET.encode(), digestmod=hashlib.sha256) \
+                if signed else None
+            draft = _RequestDraft(f"{base or self.binance_rest_url}/{endpoint}", headers, mac)
+            self._drafts[key] = draft
+        return draft
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(
+                limit=config.MAX_CONCURRENT_REQUESTS * 2,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            )
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10),
+                json_serialize=_json_dumps,
+                headers={"Accept-Encoding": "gzip, deflate"},
+            )
+        return self._http
         
     async def connect(self):
         """Connect to exchange"""
@@ -53,6 +138,8 @@ class RESTClient:
     
     async def close(self):
         """Close exchange connection"""
+        if self._http and not self._http.closed:
+            await self._http.close()
         if self.exchange:
             await self.exchange.close()
             logger.info("🔌 REST client closed")
@@ -84,7 +171,7 @@ class RESTClient:
                 )
                 
                 if ohlcv:
-                    logger.debug(f"📊 CCXT: Fetched {len(ohlcv)} candles for {symbol} {timeframe}")
+                    logger.debug("📊 CCXT: Fetched %d candles for %s %s", len(ohlcv), symbol, timeframe)
                     return ohlcv
                 else:
                     logger.warning(f"⚠️ No data from CCXT for {symbol} {timeframe}, trying REST API")
@@ -103,56 +190,57 @@ class RESTClient:
                 logger.error(f"❌ CCXT fetch error {symbol}: {e}")
                 return await self.fetch_ohlcv_rest(symbol, timeframe, limit)
     
-    async def fetch_ohlcv_rest(self, symbol: str, timeframe: str = "15m", limit: int = 100) -> List[List[float]]:
+    async def fetch_ohlcv_rest(
+        self,
+        symbol: str,
+        timeframe: str = "15m",
+        limit: int = 100,
+        since: Optional[int] = None
+    ) -> List[List[float]]:
         """
         REST API দিয়ে সরাসরি Binance থেকে ডেটা আনা (WebSocket/CCXT ব্যাকআপ)
+        since (ms) দিলে সেই open-time থেকে forward page — historical pagination-এর জন্য
         """
         try:
             # Binance API URL
-            url = f"{self.binance_rest_url}/klines"
-            
-            # সিম্বল ফরম্যাট ঠিক করা (RENDER/USDT → RENDERUSDT)
-            symbol_raw = symbol.replace("/", "").upper()
-            
-            # Timeframe mapping
-            tf_map = {
-                "1m": "1m", "5m": "5m", "15m": "15m", "30m": "30m",
-                "1h": "1h", "4h": "4h", "1d": "1d"
-            }
-            interval = tf_map.get(timeframe, "15m")
+            url = self.build_draft("klines").url
+            symbol_raw = _raw_symbol(symbol)
+            interval = _TF_MAP.get(timeframe, "15m")
             
             params = {
                 "symbol": symbol_raw,
                 "interval": interval,
                 "limit": limit
             }
+            if since is not None:
+                params["startTime"] = int(since)
             
-            logger.info(f"📡 REST API fetch: {symbol} {timeframe}")
+            logger.debug("📡 REST API fetch: %s %s", symbol, timeframe)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
+            session = self._session()
+            async with session.get(url, params=params) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=_json_loads)
                         
-                        # Binance ফরম্যাট থেকে আমাদের ফরম্যাটে convert
-                        candles = []
-                        for item in data:
-                            candle = [
-                                item[0],  # timestamp
-                                float(item[1]),  # open
-                                float(item[2]),  # high
-                                float(item[3]),  # low
-                                float(item[4]),  # close
-                                float(item[5])   # volume
-                            ]
-                            candles.append(candle)
+                    # Binance ফরম্যাট থেকে আমাদের ফরম্যাটে convert
+                    candles = []
+                    for item in data:
+                        candle = [
+                            item[0],  # timestamp
+                            float(item[1]),  # open
+                            float(item[2]),  # high
+                            float(item[3]),  # low
+                            float(item[4]),  # close
+                            float(item[5])   # volume
+                        ]
+                        candles.append(candle)
                         
-                        logger.info(f"✅ REST API success: {len(candles)} candles for {symbol} {timeframe}")
-                        return candles
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"❌ REST API error {resp.status}: {error_text}")
-                        return []
+                    logger.debug("✅ REST API success: %d candles for %s %s", len(candles), symbol, timeframe)
+                    return candles
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"❌ REST API error {resp.status}: {error_text}")
+                    return []
                         
         except aiohttp.ClientError as e:
             logger.error(f"❌ REST API connection error: {e}")
@@ -191,24 +279,24 @@ class RESTClient:
         REST API দিয়ে orderbook আনা (ব্যাকআপ)
         """
         try:
-            url = f"{self.binance_rest_url}/depth"
-            symbol_raw = symbol.replace("/", "").upper()
+            url = self.build_draft("depth").url
+            symbol_raw = _raw_symbol(symbol)
             
             params = {
                 "symbol": symbol_raw,
                 "limit": limit
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return {
-                            "bids": data.get("bids", [])[:limit],
-                            "asks": data.get("asks", [])[:limit]
-                        }
-                    else:
-                        return {"bids": [], "asks": []}
+            session = self._session()
+            async with session.get(url, params=params) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=_json_loads)
+                    return {
+                        "bids": data.get("bids", [])[:limit],
+                        "asks": data.get("asks", [])[:limit]
+                    }
+                else:
+                    return {"bids": [], "asks": []}
                         
         except Exception as e:
             logger.error(f"❌ Orderbook REST error: {e}")
@@ -267,11 +355,11 @@ class RESTClient:
     async def fetch_fear_greed_index(self) -> int:
         """Fetch Fear & Greed Index"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(config.FEAR_GREED_API_URL) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return int(data["data"][0]["value"])
+            session = self._session()
+            async with session.get(config.FEAR_GREED_API_URL) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=_json_loads)
+                    return int(data["data"][0]["value"])
                         
         except Exception as e:
             logger.warning(f"⚠️ Fear & Greed fetch error: {e}")
@@ -304,32 +392,43 @@ class RESTClient:
         self,
         symbol: str,
         timeframe: str,
-        days: int = 30
-    ) -> List[List[float]]:
+        days: int = 30,
+        since: Optional[int] = None
+    ) -> np.ndarray:
         """
-        Fetch historical data for backtesting
+        Fetch historical data for backtesting → (N, 6) float64 array
+        [timestamp, open, high, low, close, volume]
+
+        ✅ FIX: আগে since কখনো request-এ যেত না — প্রতি page একই latest 1000
+        candle ফেরত দিত, full page হলে loop কখনো শেষ হত না। এখন startTime দিয়ে
+        forward paginate। প্রতি page সরাসরি ndarray chunk — শেষে একটাই concatenate,
+        DataFrame build-এ list-of-lists re-parse লাগে না।
+        since (ms) দিলে days-এর বদলে সেখান থেকে — local cache top-up-এর জন্য।
         """
-        all_candles = []
-        current_since = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
-        
-        while True:
+        chunks: List[np.ndarray] = []
+        now_ms = int(time.time() * 1000)
+        current_since = now_ms - days * 86_400_000 if since is None else int(since)
+
+        while current_since < now_ms:
             candles = await self.fetch_ohlcv_rest(
-                symbol, timeframe, limit=1000
+                symbol, timeframe, limit=HIST_PAGE_LIMIT, since=current_since
             )
-            
+
             if not candles:
                 break
-            
-            all_candles.extend(candles)
-            
-            if len(candles) < 1000:
+
+            chunks.append(np.asarray(candles, dtype=OHLCV_DTYPE))
+
+            if len(candles) < HIST_PAGE_LIMIT:
                 break
-            
+
             # Set next since to last candle timestamp + 1ms
-            current_since = candles[-1][0] + 1
-        
-        logger.info(f"📊 Fetched {len(all_candles)} candles for {symbol} {timeframe}")
-        return all_candles
+            current_since = int(candles[-1][0]) + 1
+
+        arr = np.concatenate(chunks) if chunks else np.empty((0, 6), dtype=OHLCV_DTYPE)
+        logger.info(f"📊 Fetched {len(arr)} candles for {symbol} {timeframe}")
+        return arr
+
     async def get_api_permissions(self) -> dict:
         """
         ISSUE 8 FIX: Fetch API key permissions from Binance.
@@ -337,30 +436,25 @@ class RESTClient:
         Returns dict of permission flags.
         """
         try:
-            import hashlib, hmac, time as t
             import aiohttp as ah
 
-            api_key = config.BINANCE_API_KEY
-            secret = config.BINANCE_SECRET
-
-            if not api_key or not secret:
+            if not config.BINANCE_API_KEY or not config.BINANCE_SECRET:
                 return {"enableReading": True, "note": "no_key"}
 
-            ts = int(t.time() * 1000)
-            params = f"timestamp={ts}"
-            sig = hmac.new(
-                secret.encode(), params.encode(), hashlib.sha256
-            ).hexdigest()
-            url = f"https://api.binance.com/sapi/v1/account/apiRestrictions?{params}&signature={sig}"
+            draft = self.build_draft(
+                "account/apiRestrictions",
+                base="https://api.binance.com/sapi/v1",
+                signed=True,
+            )
 
             async with ah.ClientSession() as session:
                 async with session.get(
-                    url,
-                    headers={"X-MBX-APIKEY": api_key},
+                    draft.signed_url(),
+                    headers=draft.headers,
                     timeout=ah.ClientTimeout(total=5)
                 ) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await resp.json(loads=_json_loads)
                         return {
                             "enableReading":     data.get("enableReading", True),
                             "enableFutures":     data.get("enableFutures", False),
@@ -14,6 +14,13 @@ import time
 from typing import Dict, Optional
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 CACHE_DURATION = 15 * 60   # 15 minutes
@@ -47,7 +54,7 @@ async def fetch_fear_greed() -> Dict:
         async with aiohttp.ClientSession() as session:
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=6)) as resp:
                 if resp.status == 200:
-                    jd = await resp.json()
+                    jd = await resp.json(loads=_json_loads)
                     entries = jd.get("data", [])
                     today = entries[0] if entries else {}
                     yesterday = entries[1] if len(entries) > 1 else {}
@@ -96,7 +103,7 @@ async def fetch_altcoin_season() -> Dict:
         async with aiohttp.ClientSession() as session:
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=6)) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=_json_loads)
                     btc_dom = data["data"]["market_cap_percentage"].get("btc", 50)
                     eth_dom = data["data"]["market_cap_percentage"].get("eth", 15)
                     alt_season_index = max(0, min(100, int(100 - btc_dom)))
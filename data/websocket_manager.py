@@ -2,9 +2,10 @@
 ARUNABHA ALGO BOT - WebSocket Manager v5.1
 ===========================================
 FIXES:
-ISSUE 3:  Memory leak — explicit session.close() on every exit path
-          aiohttp.ClientSession created fresh on each reconnect (not reused)
-          _current_session tracked and forcibly closed on heartbeat restart
+ISSUE 3:  Memory leak — explicit close on every exit path
+          একটাই aiohttp.ClientSession manager lifetime জুড়ে (connector/DNS/SSL reuse),
+          stop()-এ close; প্রতি connect-এর ws সবসময় finally-তে close,
+          heartbeat restart-এ current ws forcibly close
 ISSUE 17: 1h/4h cache synced from 15m data (candle aggregation)
           Every 4 closed 15m candles → update 1h candle in cache
           Every 16 → update 4h candle
@@ -18,38 +19,138 @@ Other fixes retained from v5.0:
 import asyncio
 import json
 import logging
+import random
 import time
-from typing import Dict, List, Optional, Callable
-from collections import deque
+from typing import Dict, List, Optional, Callable, Tuple, Union
 from datetime import datetime
 
 import aiohttp
+import numpy as np
+
 import config
+from data.cache_manager import OHLCV_DTYPE, OHLCVBuffer
+
+try:
+    import orjson
+    _json_loads = orjson.loads   # str/bytes দুটোই নেয়, stdlib json থেকে কয়েক গুণ দ্রুত
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 logger = logging.getLogger(__name__)
 
+# ============================================================
+# FRAME DECODING
+# ============================================================
+# Combined-stream frame → normalized event tuple (অথবা None = ignore):
+#   ("kline", stream, raw_symbol, tf, is_closed, candle)
+#   ("funding", raw_symbol, rate)
+#   ("orderbook", raw_symbol, {"bids": [...], "asks": [...]})
+# Malformed frame হলে _FRAME_ERRORS raise হয়।
+
+if msgspec is not None:
+
+    class _Kline(msgspec.Struct):
+        t: int
+        i: str
+        x: bool
+        o: str
+        h: str
+        l: str
+        c: str
+        v: str
+
+    class _KlineEvent(msgspec.Struct, tag_field="e", tag="kline"):
+        s: str
+        k: _Kline
+
+    class _MarkPriceEvent(msgspec.Struct, tag_field="e", tag="markPriceUpdate"):
+        s: str
+        r: str = ""
+
+    class _DepthEvent(msgspec.Struct, tag_field="e", tag="depthUpdate"):
+        s: str
+        b: list = []
+        a: list = []
+
+    class _Frame(msgspec.Struct):
+        data: Union[_KlineEvent, _MarkPriceEvent, _DepthEvent]
+        stream: str = ""
+
+    _frame_decoder = msgspec.json.Decoder(_Frame)
+    _FRAME_ERRORS = (ValueError, msgspec.DecodeError)
+
+    def _decode_frame(raw: Union[str, bytes], _float=float) -> Optional[tuple]:
+        """msgspec: JSON bytes → typed struct এক pass-এ, intermediate dict নেই"""
+        frame = _frame_decoder.decode(raw)
+        ev = frame.data
+        if type(ev) is _KlineEvent:
+            k = ev.k
+            return ("kline", frame.stream, ev.s, k.i, k.x,
+                    [k.t, _float(k.o), _float(k.h), _float(k.l), _float(k.c), _float(k.v)])
+        if type(ev) is _MarkPriceEvent:
+            return ("funding", ev.s, _float(ev.r or 0.0))
+        return ("orderbook", ev.s, {"bids": ev.b, "asks": ev.a})
+
+else:
+    # orjson.JSONDecodeError / json.JSONDecodeError দুটোই ValueError subclass
+    _FRAME_ERRORS = (ValueError, KeyError)
+
+    def _decode_frame(raw: Union[str, bytes], _float=float) -> Optional[tuple]:
+        # Combined-stream frame-এ data/e/s সবসময় থাকে — literal subscript, .get() + default
+        # dict নেই; incomplete frame হলে KeyError। _float default arg = global lookup নেই
+        frame = _json_loads(raw)
+        payload = frame["data"]
+        event = payload["e"]
+        if event == "kline":
+            k = payload["k"]
+            return ("kline", frame.get("stream", ""), payload["s"], k["i"], k["x"],
+                    [k["t"], _float(k["o"]), _float(k["h"]), _float(k["l"]), _float(k["c"]), _float(k["v"])])
+        if event == "markPriceUpdate":
+            return ("funding", payload["s"], _float(payload.get("r") or 0.0))
+        if event == "depthUpdate":
+            return ("orderbook", payload["s"], {"bids": payload["b"], "asks": payload["a"]})
+        return None
+
+
 BINANCE_WS_URL = "wss://fstream.binance.com/stream?streams="
 PING_INTERVAL = 20
 BASE_RECONNECT = 3
 MAX_RECONNECT_WAIT = 120
+# এর বেশি টিকে থাকা connection "stable" — তবেই backoff reset (connect-মাত্র নয়)
+STABLE_CONNECTION_S = 30
 DATA_DEAD_TIMEOUT = 30
 HEARTBEAT_CHECK_INTERVAL = 10
-CACHE_MAXLEN = 200
+# Receiver → consumer decoded-event queue; consumer একবারে এতগুলো drain করে।
+# Backlog এর বেশি হলে শুধু superseded-able events (funding/orderbook/open kline) drop —
+# closed kline কখনো নয়
+WS_EVENT_QUEUE_MAXSIZE = 10000
+WS_EVENT_BATCH_MAX = 128
 
 
 class BinanceWSFeed:
 
     def __init__(self, on_candle_close: Optional[Callable] = None):
         self.on_candle_close = on_candle_close
-        self._cache: Dict[str, deque] = {}
+        # Per-(symbol, tf) preallocated float64 ring buffer — deque-of-lists নয়
+        # (symbol, tf) tuple key — per-message f"{symbol}_{tf}" string format/alloc নেই
+        self._cache: Dict[Tuple[str, str], OHLCVBuffer] = {}
         self._message_count = 0
         self._btc_ready = False
         self._last_message_time: float = time.time()
         # ISSUE 17: 15m candle counters for 1h/4h aggregation
         self._candle_counts: Dict[str, int] = {}
 
-    def _get_key(self, symbol: str, tf: str) -> str:
-        return f"{symbol}_{tf}"
+    def _buffer(self, symbol: str, tf: str) -> OHLCVBuffer:
+        key = (symbol, tf)
+        buf = self._cache.get(key)
+        if buf is None:
+            buf = self._cache[key] = OHLCVBuffer()
+        return buf
 
     @property
     def seconds_since_last_message(self) -> float:
@@ -59,21 +160,21 @@ class BinanceWSFeed:
     def is_data_fresh(self) -> bool:
         return self.seconds_since_last_message < DATA_DEAD_TIMEOUT
 
-    def get_ohlcv(self, symbol: str, tf: str) -> List[List[float]]:
-        key = self._get_key(symbol, tf)
-        return list(self._cache.get(key, []))
+    def get_ohlcv(self, symbol: str, tf: str, limit: Optional[int] = None) -> np.ndarray:
+        """
+        (N, 6) read-only zero-copy view — list(deque) Python-level copy নেই।
+        পরের update_cache-এ বদলে যেতে পারে, তাই caller await-এর আগেই পড়ে নেবে।
+        """
+        buf = self._cache.get((symbol, tf))
+        if buf is None or not buf.n:
+            return np.empty((0, 6), dtype=OHLCV_DTYPE)
+        return buf.ordered(limit, copy=False)
 
     def update_cache(self, symbol: str, tf: str, candle: List[float], is_closed: bool = False):
-        key = self._get_key(symbol, tf)
-        if key not in self._cache:
-            self._cache[key] = deque(maxlen=CACHE_MAXLEN)
-
-        if self._cache[key] and int(candle[0]) == int(self._cache[key][-1][0]):
-            self._cache[key][-1] = candle
-        else:
-            self._cache[key].append(candle)
-            if symbol == "BTC/USDT" and tf == "15m":
-                self._btc_ready = True
+        # Same open-time → last row overwrite, নতুন হলে head-এ write — O(1)
+        self._buffer(symbol, tf).upsert(candle)
+        if symbol == "BTC/USDT" and tf == "15m":
+            self._btc_ready = True
 
         self._last_message_time = time.time()
 
@@ -93,84 +194,99 @@ class BinanceWSFeed:
 
         # ── 1h aggregation (every 4 × 15m) ──────────────────────────
         if count % 4 == 0:
-            candles_15m = list(self._cache.get(self._get_key(symbol, "15m"), []))
-            if len(candles_15m) >= 4:
-                last4 = candles_15m[-4:]
+            last4 = self.get_ohlcv(symbol, "15m", 4)
+            if len(last4) >= 4:
                 h1_candle = self._aggregate_candles(last4)
                 if h1_candle:
-                    key_1h = self._get_key(symbol, "1h")
-                    if key_1h not in self._cache:
-                        self._cache[key_1h] = deque(maxlen=CACHE_MAXLEN)
-                    if self._cache[key_1h] and int(h1_candle[0]) == int(self._cache[key_1h][-1][0]):
-                        self._cache[key_1h][-1] = h1_candle
-                    else:
-                        self._cache[key_1h].append(h1_candle)
-                    logger.debug(f"1h candle updated: {symbol} @ {h1_candle[4]:.4f}")
+                    self._buffer(symbol, "1h").upsert(h1_candle)
+                    logger.debug("1h candle updated: %s @ %.4f", symbol, h1_candle[4])
 
         # ── 4h aggregation (every 16 × 15m) ─────────────────────────
         if count % 16 == 0:
-            candles_15m = list(self._cache.get(self._get_key(symbol, "15m"), []))
-            if len(candles_15m) >= 16:
-                last16 = candles_15m[-16:]
+            last16 = self.get_ohlcv(symbol, "15m", 16)
+            if len(last16) >= 16:
                 h4_candle = self._aggregate_candles(last16)
                 if h4_candle:
-                    key_4h = self._get_key(symbol, "4h")
-                    if key_4h not in self._cache:
-                        self._cache[key_4h] = deque(maxlen=CACHE_MAXLEN)
-                    if self._cache[key_4h] and int(h4_candle[0]) == int(self._cache[key_4h][-1][0]):
-                        self._cache[key_4h][-1] = h4_candle
-                    else:
-                        self._cache[key_4h].append(h4_candle)
-                    logger.debug(f"4h candle updated: {symbol} @ {h4_candle[4]:.4f}")
+                    self._buffer(symbol, "4h").upsert(h4_candle)
+                    logger.debug("4h candle updated: %s @ %.4f", symbol, h4_candle[4])
 
-    def _aggregate_candles(self, candles: List[List]) -> Optional[List]:
-        """Merge N candles into one OHLCV candle"""
-        if not candles:
+    def _aggregate_candles(self, candles: np.ndarray) -> Optional[List]:
+        """Merge N candles (rows of an (N, 6) array) into one OHLCV candle — column reductions"""
+        if not len(candles):
             return None
         try:
-            timestamp = candles[0][0]
-            open_  = float(candles[0][1])
-            high   = max(float(c[2]) for c in candles)
-            low    = min(float(c[3]) for c in candles)
-            close  = float(candles[-1][4])
-            volume = sum(float(c[5]) for c in candles)
-            return [timestamp, open_, high, low, close, volume]
+            return [
+                float(candles[0, 0]),          # timestamp
+                float(candles[0, 1]),          # open
+                float(candles[:, 2].max()),    # high
+                float(candles[:, 3].min()),    # low
+                float(candles[-1, 4]),         # close
+                float(candles[:, 5].sum()),    # volume
+            ]
         except Exception as e:
             logger.warning(f"Candle aggregation failed: {e}")
             return None
 
     async def seed_from_rest(self, rest_client):
+        """
+        সব (symbol, tf) একসাথে — প্রতি tf-এ fetch_multiple_ohlcv, tf-গুলোও gather।
+        আগে symbols × tfs sequential RTT; concurrency rest_client-এর rate limiter bound করে।
+        """
         logger.info("🌱 Seeding WS cache from REST...")
-        for symbol in config.TRADING_PAIRS:
-            for tf in ["5m", "15m", "1h", "4h"]:
-                try:
-                    candles = await rest_client.fetch_ohlcv(symbol, tf, limit=200)
-                    if candles:
-                        key = self._get_key(symbol, tf)
-                        self._cache[key] = deque(candles, maxlen=CACHE_MAXLEN)
-                except Exception as e:
-                    logger.error(f"Seed failed {symbol} {tf}: {e}")
+        symbols = list(config.TRADING_PAIRS)
+        tfs = ("5m", "15m", "1h", "4h")
+        batches = await asyncio.gather(
+            *(rest_client.fetch_multiple_ohlcv(symbols, tf, limit=200) for tf in tfs)
+        )
+        for tf, results in zip(tfs, batches):
+            for symbol, candles in results.items():
+                if candles:
+                    self._buffer(symbol, tf).set(candles)
+                else:
+                    logger.error(f"Seed failed {symbol} {tf}")
         logger.info("🌱 Seeding done")
 
 
 class WebSocketManager:
     """
-    ISSUE 3 FIX: Explicit session close on every exit path.
-    _current_session tracked; forcibly closed by heartbeat restart.
+    ISSUE 3 FIX: Explicit close on every exit path.
+    Shared session closed in stop(); current ws tracked, forcibly closed by heartbeat restart.
     """
 
-    def __init__(self, on_candle_close: Optional[Callable] = None):
+    def __init__(
+        self,
+        on_candle_close: Optional[Callable] = None,
+        on_stream_update: Optional[Callable] = None,
+    ):
         self.feed = BinanceWSFeed(on_candle_close)
+        # Funding / orderbook push updates → (symbol, kind, payload)
+        self.on_stream_update = on_stream_update
         self._task: Optional[asyncio.Task] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._stop = asyncio.Event()
         self._connected = False
         self._retry = 0
+        # Decorrelated-jitter backoff state (last wait) + current connection-এর শুরু (monotonic)
+        self._backoff = float(BASE_RECONNECT)
+        self._connected_at: Optional[float] = None
         self._total_reconnects = 0
         self._message_count = 0
         self._telegram = None
-        # ISSUE 3 FIX: track current session for explicit close
-        self._current_session: Optional[aiohttp.ClientSession] = None
+        # Reconnect-জুড়ে shared session (lazy, running loop-এ) + current ws — explicit close-এর জন্য
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        # (TRADING_PAIRS snapshot, stream URL) — reconnect-এ আবার build নয়; /reload-এ pair বদলালে rebuild
+        self._streams_cache: Optional[Tuple[tuple, str, int]] = None
+        # Binance "s" field (BTCUSDT) → "BTC/USDT" — প্রতি message-এ str.replace নয়
+        self._symbol_map: Dict[str, str] = {}
+        # Kline stream name ("btcusdt@kline_15m") → (symbol, tf) — canonical strings,
+        # frame-এর s/i field থেকে symbol/tf derive করতে হয় না
+        self._stream_map: Dict[str, Tuple[str, str]] = {}
+        # Receiver শুধু decode + enqueue (tight I/O loop); cache/callback কাজ consumer task-এ
+        # Unbounded — soft cap (WS_EVENT_QUEUE_MAXSIZE) _enqueue-এ, যাতে closed kline সবসময় ঢোকে
+        self._events: asyncio.Queue = asyncio.Queue()
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._events_dropped = 0
 
     def set_telegram(self, telegram):
         self._telegram = telegram
@@ -178,6 +294,7 @@ class WebSocketManager:
     async def start(self):
         self._stop.clear()
         self._task = asyncio.create_task(self._run(), name="ws_main")
+        self._consumer_task = asyncio.create_task(self._consume(), name="ws_consumer")
         self._heartbeat_task = asyncio.create_task(
             self._heartbeat_monitor(), name="ws_heartbeat"
         )
@@ -185,89 +302,155 @@ class WebSocketManager:
 
     async def stop(self):
         self._stop.set()
-        await self._close_current_session()
-        for t in [self._task, self._heartbeat_task]:
+        await self._close_current_ws()
+        for t in [self._task, self._consumer_task, self._heartbeat_task]:
             if t:
                 t.cancel()
                 try:
                     await t
-                except Exception:
+                except (asyncio.CancelledError, Exception):
+                    # CancelledError BaseException — না ধরলে stop() এখানেই থেমে session খোলা থাকত
                     pass
+        await self._close_session()
         logger.info("🔌 WebSocket stopped")
 
-    async def _close_current_session(self):
-        """ISSUE 3 FIX: Explicitly close aiohttp session"""
-        if self._current_session and not self._current_session.closed:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Manager-এর একটাই session — reconnect-এ TCPConnector, DNS cache, SSL context
+        আবার বানাতে হয় না। Closed থাকলে (stop() পরে start()) নতুন।
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=300, limit=0)
+            )
+        return self._session
+
+    async def _close_current_ws(self):
+        """ISSUE 3 FIX: Explicitly close the live ws (session থাকে)"""
+        ws = self._ws
+        if ws is not None and not ws.closed:
+            try:
+                await ws.close()
+                logger.debug("WS closed explicitly")
+            except Exception as e:
+                logger.debug("WS close error: %s", e)
+        self._ws = None
+
+    async def _close_session(self):
+        """ISSUE 3 FIX: Explicitly close the shared aiohttp session"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
             try:
-                await self._current_session.close()
+                await session.close()
                 logger.debug("WS session closed explicitly")
             except Exception as e:
-                logger.debug(f"Session close error: {e}")
-            finally:
-                self._current_session = None
+                logger.debug("Session close error: %s", e)
 
     async def _run(self):
         while not self._stop.is_set():
+            self._connected_at = None
             try:
                 await self._connect()
+                reason = "connection closed"
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self._retry += 1
-                self._total_reconnects += 1
-                import random
-                wait = min(BASE_RECONNECT * (2 ** min(self._retry, 6)), MAX_RECONNECT_WAIT)
-                wait += random.uniform(0, 2)
-                logger.warning(f"⚠️ WS error (retry #{self._retry}): {e} — reconnect in {wait:.1f}s")
-                if self._telegram and self._total_reconnects % 5 == 0:
-                    try:
-                        await self._telegram.send_message(
-                            f"⚠️ WS reconnecting #{self._total_reconnects} — wait {wait:.0f}s"
-                        )
-                    except Exception:
-                        pass
-                await asyncio.sleep(wait)
+                reason = e
+            if self._stop.is_set():
+                break
 
-    async def _connect(self):
-        """ISSUE 3 FIX: Session created fresh, always closed in finally"""
-        streams = list(dict.fromkeys(
-            [f"{s.replace('/','').lower()}@kline_15m" for s in config.TRADING_PAIRS]
-            + ["btcusdt@kline_5m", "btcusdt@kline_1h", "btcusdt@kline_4h"]
-        ))
-        url = BINANCE_WS_URL + "/".join(streams)
-        logger.info(f"🔌 Connecting WS ({len(streams)} streams)...")
+            self._total_reconnects += 1
+            wait = self._next_backoff()
+            logger.warning(f"⚠️ WS error (retry #{self._retry}): {reason} — reconnect in {wait:.1f}s")
+            if self._telegram and self._total_reconnects % 5 == 0:
+                try:
+                    await self._telegram.send_message_queued(
+                        f"⚠️ WS reconnecting #{self._total_reconnects} — wait {wait:.0f}s"
+                    )
+                except Exception:
+                    pass
+            await asyncio.sleep(wait)
 
-        # ISSUE 3 FIX: Close old session before creating new one
-        await self._close_current_session()
+    def _next_backoff(self) -> float:
+        """
+        Stable connection (≥ STABLE_CONNECTION_S) শেষ হলে → retry/backoff reset, প্রায় সাথে সাথে
+        reconnect (24h rotation-এ candle close miss না হয়)। নাহলে decorrelated jitter:
+        wait = min(cap, uniform(base, last_wait × 3)) — connect-then-drop flapping-এও
+        bounded, আর একসাথে অনেক client-এর reconnect storm হয় না।
+        """
+        at = self._connected_at
+        if at is not None and time.monotonic() - at >= STABLE_CONNECTION_S:
+            self._retry = 1
+            self._backoff = float(BASE_RECONNECT)
+            return random.uniform(0, 1)
+        self._retry += 1
+        self._backoff = min(MAX_RECONNECT_WAIT, random.uniform(BASE_RECONNECT, self._backoff * 3))
+        return self._backoff
 
-        # ISSUE 3 FIX: New session each connect cycle
-        session = aiohttp.ClientSession()
-        self._current_session = session
+    async def _connect(self):
+        """ISSUE 3 FIX: Shared session, ws always closed in finally"""
+        url, n_streams = self._stream_url()
+        logger.info(f"🔌 Connecting WS ({n_streams} streams)...")
+
+        # ISSUE 3 FIX: আগের ws (heartbeat restart-এ থাকতে পারে) আগে close
+        await self._close_current_ws()
 
         try:
-            async with session.ws_connect(
+            async with self._get_session().ws_connect(
                 url,
                 heartbeat=PING_INTERVAL,
-                receive_timeout=45
+                receive_timeout=45,
+                compress=15,   # permessage-deflate offer — server decline করলে plain
             ) as ws:
                 logger.info("✅ WS CONNECTED")
+                self._ws = ws
                 self._connected = True
-                self._retry = 0
+                self._connected_at = time.monotonic()
 
                 async for msg in ws:
                     if self._stop.is_set():
                         break
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        await self._process(msg.data)
+                    # BINARY frame-ও সরাসরি parser-এ — orjson bytes নেয়, decode/copy লাগে না
+                    if msg.type == aiohttp.WSMsgType.TEXT or msg.type == aiohttp.WSMsgType.BINARY:
+                        self._enqueue(msg.data)
                         self._message_count += 1
                     elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                         logger.warning(f"⚠️ WS {msg.type}")
                         break
         finally:
-            # ISSUE 3 FIX: Always close session
+            # ISSUE 3 FIX: Always close ws (async with-ও close করে; cancel path-এ explicit)
             self._connected = False
-            await self._close_current_session()
-            logger.debug("WS _connect() session cleaned up")
+            await self._close_current_ws()
+            logger.debug("WS _connect() ws cleaned up")
+
+    def _stream_url(self) -> Tuple[str, int]:
+        """Combined-stream URL + stream count, TRADING_PAIRS না বদলালে cached"""
+        pairs = tuple(config.TRADING_PAIRS)
+        cached = self._streams_cache
+        if cached is not None and cached[0] == pairs:
+            return cached[1], cached[2]
+
+        raw_pairs = [s.replace('/', '').lower() for s in pairs]
+        klines = (
+            [(f"{p}@kline_15m", s, "15m") for p, s in zip(raw_pairs, pairs)]
+            + [(f"btcusdt@kline_{tf}", "BTC/USDT", tf) for tf in ("5m", "1h", "4h")]
+        )
+        streams = list(dict.fromkeys(
+            [name for name, _, _ in klines]
+            # Funding rate (markPrice) + top-10 depth — REST polling এর বদলে push।
+            # Filters সর্বোচ্চ 10 level পড়ে; 500ms-ই যথেষ্ট (100ms = 5× বেশি frame decode)
+            + [f"{p}@markPrice" for p in raw_pairs]
+            + [f"{p}@depth10@500ms" for p in raw_pairs]
+        ))
+        url = BINANCE_WS_URL + "/".join(streams)
+        self._symbol_map = {s.replace('/', '').upper(): s for s in pairs + ("BTC/USDT",)}
+        self._stream_map = {name: (symbol, tf) for name, symbol, tf in klines}
+        self._streams_cache = (pairs, url, len(streams))
+        return url, len(streams)
+
+    def _symbol_of(self, raw: str) -> str:
+        symbol = self._symbol_map.get(raw)
+        return symbol if symbol is not None else raw.replace("USDT", "/USDT")
 
     async def _heartbeat_monitor(self):
         await asyncio.sleep(60)
@@ -280,44 +463,79 @@ class WebSocketManager:
                 logger.warning(f"💀 WS dead ({stale:.0f}s) — forcing reconnect")
                 if self._telegram:
                     try:
-                        await self._telegram.send_message(
+                        await self._telegram.send_message_queued(
                             f"💀 WS dead {stale:.0f}s — reconnecting..."
                         )
                     except Exception:
                         pass
-                # ISSUE 3 FIX: Close session before restarting task
-                await self._close_current_session()
+                # ISSUE 3 FIX: Close dead ws before restarting task
+                await self._close_current_ws()
                 self._connected = False
                 if self._task and not self._task.done():
                     self._task.cancel()
                 self._task = asyncio.create_task(self._run(), name="ws_restart")
 
-    async def _process(self, raw: str):
+    def _enqueue(self, raw: Union[str, bytes]):
+        """Receiver side — decode করে event tuple queue-তে; কোনো await নেই"""
         try:
-            data = json.loads(raw)
-            payload = data.get("data", {})
-            k = payload.get("k", {})
-            if not k:
-                return
-            symbol = payload.get("s", "").replace("USDT", "/USDT")
-            tf = k.get("i")
-            is_closed = k.get("x", False)
-            candle = [
-                k.get("t"),
-                float(k.get("o", 0)),
-                float(k.get("h", 0)),
-                float(k.get("l", 0)),
-                float(k.get("c", 0)),
-                float(k.get("v", 0)),
-            ]
-            # ISSUE 17 FIX: pass is_closed for aggregation
-            self.feed.update_cache(symbol, tf, candle, is_closed=is_closed)
-            if is_closed and self.feed.on_candle_close:
-                candles = self.feed.get_ohlcv(symbol, tf)
-                if candles:
-                    await self.feed.on_candle_close(symbol, tf, candles)
-        except Exception as e:
-            logger.error(f"WS process error: {e}")
+            event = _decode_frame(raw)
+        except _FRAME_ERRORS as e:
+            logger.debug("WS malformed frame dropped: %s", e)
+            return
+        if event is None:
+            return
+        if self._events.qsize() >= WS_EVENT_QUEUE_MAXSIZE and not (event[0] == "kline" and event[4]):
+            # Consumer আটকে — funding/orderbook/forming-kline snapshot বাদ (পরের frame-এ নতুনটা আসে);
+            # closed kline (x=True) কখনো drop নয়, candle history-তে gap হত
+            self._events_dropped += 1
+            if self._events_dropped % 1000 == 1:
+                logger.warning(f"⚠️ WS event queue full — {self._events_dropped} snapshot events dropped")
+            return
+        self._events.put_nowait(event)
+
+    async def _consume(self):
+        """
+        Batch drain: একটা await-এ যা জমেছে (≤ WS_EVENT_BATCH_MAX) একসাথে।
+        Funding/orderbook snapshot-এ batch-এর মধ্যে শুধু latest per symbol apply হয়;
+        klines order মেনে সবগুলো (closed candle callback বাদ যায় না)।
+        """
+        q = self._events
+        while True:
+            batch = [await q.get()]
+            while len(batch) < WS_EVENT_BATCH_MAX and not q.empty():
+                batch.append(q.get_nowait())
+
+            latest: Dict[Tuple[str, str], object] = {}
+            for event in batch:
+                try:
+                    if event[0] == "kline":
+                        await self._apply_kline(event)
+                    else:
+                        latest[(event[1], event[0])] = event[2]
+                except Exception as e:
+                    logger.error(f"WS process error: {e}")
+
+            if latest and self.on_stream_update:
+                for (raw_symbol, kind), payload in latest.items():
+                    try:
+                        # markPriceUpdate → funding, depthUpdate (partial depth10) → orderbook
+                        self.on_stream_update(self._symbol_of(raw_symbol), kind, payload)
+                    except Exception as e:
+                        logger.error(f"WS process error: {e}")
+
+    async def _apply_kline(self, event: tuple):
+        _, stream, raw_symbol, tf, is_closed, candle = event
+        hit = self._stream_map.get(stream)
+        if hit is not None:
+            symbol, tf = hit
+        else:
+            symbol = self._symbol_of(raw_symbol)
+        # ISSUE 17 FIX: pass is_closed for aggregation
+        self.feed.update_cache(symbol, tf, candle, is_closed=is_closed)
+        if is_closed and self.feed.on_candle_close:
+            candles = self.feed.get_ohlcv(symbol, tf)
+            if len(candles):
+                await self.feed.on_candle_close(symbol, tf, candles)
 
     def is_connected(self) -> bool:
         return self._connected
@@ -331,6 +549,8 @@ class WebSocketManager:
             "btc_ready": self.feed._btc_ready,
             "last_message_ago": round(self.feed.seconds_since_last_message, 1),
             "data_fresh": self.feed.is_data_fresh,
-            "session_open": self._current_session is not None and not self._current_session.closed,
+            "session_open": self._session is not None and not self._session.closed,
             "cache_keys": len(self.feed._cache),
+            "event_queue": self._events.qsize(),
+            "events_dropped": self._events_dropped,
         }
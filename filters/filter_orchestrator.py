@@ -53,7 +53,7 @@ class FilterOrchestrator:
 
         tier2_min = tier2_threshold_override if tier2_threshold_override is not None else config.MIN_TIER2_SCORE
 
-        logger.info(f"🔍 FILTER: {symbol} | threshold={tier2_min:.0f}%")
+        logger.info("🔍 FILTER: %s | threshold=%.0f%%", symbol, tier2_min)
 
         result = {
             "passed": False,
@@ -73,14 +73,15 @@ class FilterOrchestrator:
         )
         result["tier1"] = tier1_results
 
-        for fn, fr in tier1_results.items():
-            status = "✅" if fr["passed"] else "❌"
-            logger.info(f"   {status} T1/{fn}: {fr['message']}")
+        # Per-filter lines — INFO বন্ধ থাকলে (backtest live-filter mode প্রতি bar) loop-ই skip
+        if logger.isEnabledFor(logging.INFO):
+            for fn, fr in tier1_results.items():
+                logger.info("   %s T1/%s: %s", "✅" if fr["passed"] else "❌", fn, fr["message"])
 
         if not tier1_passed:
             failed = [k for k, v in tier1_results.items() if not v["passed"]]
             result["reason"] = f"Tier1 failed: {', '.join(failed)}"
-            logger.info(f"❌ T1 FAIL: {', '.join(failed)}")
+            logger.info("❌ T1 FAIL: %s", ", ".join(failed))
             return result
 
         logger.info("✅ T1 PASS")
@@ -94,7 +95,7 @@ class FilterOrchestrator:
         result["tier2"] = tier2_results
         result["score"] = tier2_score
 
-        logger.info(f"   T2 score: {tier2_score:.1f}% (need {tier2_min:.0f}%)")
+        logger.info("   T2 score: %.1f%% (need %.0f%%)", tier2_score, tier2_min)
 
         # Use adaptive threshold (already applied inside tier2.evaluate_all now)
         tier2_ok = tier2_score >= tier2_min
@@ -104,10 +105,10 @@ class FilterOrchestrator:
                 f"{'(adaptive)' if tier2_threshold_override else ''}"
             )
             result["grade"] = "C"
-            logger.info(f"❌ T2 FAIL: {tier2_score:.1f}%")
+            logger.info("❌ T2 FAIL: %.1f%%", tier2_score)
             return result
 
-        logger.info(f"✅ T2 PASS: {tier2_score:.1f}%")
+        logger.info("✅ T2 PASS: %.1f%%", tier2_score)
         self.stats["tier2_passed"] += 1
 
         # ── TIER 3 ───────────────────────────────────────────────
@@ -117,7 +118,7 @@ class FilterOrchestrator:
         result["tier3"] = tier3_results
 
         if tier3_bonus > 0:
-            logger.info(f"   T3 bonus: +{tier3_bonus}")
+            logger.info("   T3 bonus: +%s", tier3_bonus)
 
         final_score = min(100, tier2_score + tier3_bonus)
         result["score"] = final_score
@@ -128,11 +129,11 @@ class FilterOrchestrator:
         if grade.can_trade:
             result["passed"] = True
             result["reason"] = f"Score: {final_score:.0f}% ({grade.value})"
-            logger.info(f"✅✅ APPROVED: {symbol} Grade={grade.value} Score={final_score:.0f}%")
+            logger.info("✅✅ APPROVED: %s Grade=%s Score=%.0f%%", symbol, grade.value, final_score)
             self.stats["signals_generated"] += 1
         else:
             result["reason"] = f"Grade {grade.value} below minimum"
-            logger.info(f"❌ GRADE TOO LOW: {grade.value}")
+            logger.info("❌ GRADE TOO LOW: %s", grade.value)
 
         return result
 
@@ -28,7 +28,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 
 import config
-from core.constants import MarketType, BTCRegime, SessionType
+from core.constants import MarketType, BTCRegime, SessionType, IST_TZ
 from analysis.technical import TechnicalAnalyzer
 from analysis.market_regime import BTCRegimeResult
 from analysis.sentiment import SentimentAnalyzer, MarketMood
@@ -195,8 +195,7 @@ class Tier1Filters:
             return True, "Insufficient data — AMD skip"
 
         try:
-            import pytz
-            now      = datetime.now(pytz.timezone("Asia/Kolkata"))
+            now      = datetime.now(IST_TZ)
             hour_ist = now.hour
         except Exception:
             hour_ist = None
@@ -356,8 +355,9 @@ class Tier1Filters:
             return False, f"Spread too wide: {spread_pct:.3f}%"
 
         try:
-            bid_depth = sum(float(b[1]) for b in bids[:5] if len(b) > 1)
-            ask_depth = sum(float(a[1]) for a in asks[:5] if len(a) > 1)
+            # Notional (price × qty) — raw base qty BTC/ETH-এ কখনো 10k হয় না
+            bid_depth = sum(float(b[0]) * float(b[1]) for b in bids[:5] if len(b) > 1)
+            ask_depth = sum(float(a[0]) * float(a[1]) for a in asks[:5] if len(a) > 1)
         except (TypeError, ValueError):
             bid_depth = ask_depth = 0
 
@@ -367,13 +367,15 @@ class Tier1Filters:
         return True, f"Spread {spread_pct:.3f}%, Depth ${bid_depth + ask_depth:,.0f}"
 
     def _check_session(self) -> Tuple[bool, str]:
-        import pytz
-        now  = datetime.now(pytz.timezone("Asia/Kolkata"))
+        now  = datetime.now(IST_TZ)
         hour = now.hour
 
-        for start, end, name in config.AVOID_TIMES:
-            if start <= hour < end:
-                return False, f"Avoid: {name} ({hour:02d}:00 IST)"
+        if config.is_avoid_hour(hour):
+            name = next(
+                (n for start, end, n in config.AVOID_TIMES if start <= hour < end),
+                "Avoid window",
+            )
+            return False, f"Avoid: {name} ({hour:02d}:00 IST)"
 
         if 7 <= hour < 11:
             return True, f"Asia session ({hour:02d}:00 IST)"
@@ -15,7 +15,7 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 
 import config
-from core.constants import MarketType
+from core.constants import MarketType, IST_TZ
 from analysis.technical import TechnicalAnalyzer
 from analysis.structure import StructureDetector
 from analysis.volume_profile import VolumeProfileAnalyzer
@@ -37,7 +37,6 @@ class Tier2Filters:
         self.avwap     = AnchoredVWAPAnalyzer()
         self.orderflow = OrderflowAnalyzer()
         self.amd       = AMDDetector()
-        self.weights   = config.TIER2_FILTERS
 
     def evaluate_all(
         self,
@@ -50,14 +49,16 @@ class Tier2Filters:
 
         results = {}
         total_score = 0
-        max_score = sum(self.weights.values())
+        # প্রতি call-এ live dict থেকে — /reload-এ weights বদলালে denominator-ও বদলায়
+        weights = config.TIER2_FILTERS
+        max_score = sum(weights.values())
 
         def add(name, fn, *args):
             nonlocal total_score
             p, s, m = fn(*args)
             results[name] = {
                 "passed": p, "score": s,
-                "weight": self.weights.get(name, 0), "message": m
+                "weight": weights.get(name, 0), "message": m
             }
             total_score += s
 
@@ -225,6 +226,19 @@ class Tier2Filters:
     # Existing filters (unchanged from v5.0)
     # ──────────────────────────────────────────────────────────────────
 
+    def _live_emas(
+        self, data: Dict, tf: str, closes: List[float], periods: Tuple[int, ...]
+    ) -> Tuple[float, ...]:
+        """
+        Engine cache-এর incremental EMA (data["ema"][tf]) — না থাকলে closes থেকে
+        একটাই fused pass (period > len হলে len পর্যন্ত clamp)
+        """
+        live = data.get("ema", {}).get(tf) or {}
+        vals = tuple(live.get(p) for p in periods)
+        if None not in vals:
+            return vals
+        return self.analyzer.calculate_emas(closes, tuple(min(p, len(closes)) for p in periods))
+
     def _check_mtf(self, data: Dict, direction: Optional[str]) -> Tuple[bool, int, str]:
         ohlcv_15m = data.get("ohlcv", {}).get("15m", [])
         ohlcv_1h  = data.get("ohlcv", {}).get("1h", [])
@@ -257,8 +271,7 @@ class Tier2Filters:
                             tf_dir = "NEUTRAL"
 
             if tf_dir == "NEUTRAL" and len(closes) >= 21:
-                ema9  = self.analyzer.calculate_ema(closes, 9)
-                ema21 = self.analyzer.calculate_ema(closes, 21)
+                ema9, ema21 = self._live_emas(data, tf_name, closes, (9, 21))
                 if ema9 > ema21 * 1.001:
                     tf_dir = "LONG"
                 elif ema9 < ema21 * 0.999:
@@ -266,7 +279,7 @@ class Tier2Filters:
 
             major_trend = "NEUTRAL"
             if len(closes) >= 50:
-                ema200 = self.analyzer.calculate_ema(closes, min(200, len(closes)))
+                ema200, = self._live_emas(data, tf_name, closes, (200,))
                 if current > ema200 * 1.005:
                     major_trend = "LONG"
                 elif current < ema200 * 0.995:
@@ -375,7 +388,8 @@ class Tier2Filters:
         ohlcv = data.get("ohlcv",{}).get("15m",[])
         if len(ohlcv) < 30: return False, 0, "Insufficient data"
         closes = [float(c[4]) for c in ohlcv]
-        rsi_series = [self.analyzer.calculate_rsi(closes[:i+1]) for i in range(15, len(closes))]
+        # একটাই O(n) Wilder sweep — আগে প্রতি prefix-এ calculate_rsi (O(n²))
+        rsi_series = self.analyzer.calculate_rsi_series(closes)[15:]
         if len(rsi_series) < 5: return False, 0, "Insufficient RSI"
         rc = closes[-10:]; rr = rsi_series[-10:]
         bull_div = rc[-1] < min(rc[:-1]) and rr[-1] > min(rr[:-1])
@@ -392,9 +406,7 @@ class Tier2Filters:
         ohlcv = data.get("ohlcv",{}).get("1h",[])
         if len(ohlcv) < 30: return False, 0, "Insufficient 1h data"
         closes = [float(c[4]) for c in ohlcv]
-        ema9   = self.analyzer.calculate_ema(closes, 9)
-        ema21  = self.analyzer.calculate_ema(closes, 21)
-        ema200 = self.analyzer.calculate_ema(closes, min(200, len(closes)))
+        ema9, ema21, ema200 = self._live_emas(data, "1h", closes, (9, 21, 200))
         bull = ema9 > ema21 > ema200; bear = ema9 < ema21 < ema200
         if direction == "LONG"  and bull: return True, 10, "Bullish EMA stack 9>21>200 ✅"
         if direction == "SHORT" and bear: return True, 10, "Bearish EMA stack 9<21<200 ✅"
@@ -407,9 +419,9 @@ class Tier2Filters:
         atr = self.analyzer.calculate_atr(ohlcv)
         price = float(ohlcv[-1][4])
         atr_pct = (atr / price * 100) if price > 0 else 0
-        if config.MIN_ATR_PCT <= atr_pct <= config.MAX_ATR_PCT:
+        if config.CFG.min_atr_pct <= atr_pct <= config.CFG.max_atr_pct:
             return True, 10, f"ATR {atr_pct:.2f}% in range"
-        if atr_pct < config.MIN_ATR_PCT: return False, 5, f"ATR too low: {atr_pct:.2f}%"
+        if atr_pct < config.CFG.min_atr_pct: return False, 5, f"ATR too low: {atr_pct:.2f}%"
         return False, 5, f"ATR too high: {atr_pct:.2f}%"
 
     def _check_support_resistance(self, data: Dict, direction: Optional[str]) -> Tuple[bool, int, str]:
@@ -452,8 +464,7 @@ class Tier2Filters:
 
         try:
             from datetime import datetime
-            import pytz
-            now      = datetime.now(pytz.timezone("Asia/Kolkata"))
+            now      = datetime.now(IST_TZ)
             hour_ist = now.hour
         except Exception:
             hour_ist = None
@@ -11,8 +11,11 @@ FIXES in this version:
 
 import os
 import sys
+import queue
+import atexit
 import asyncio
 import logging
+import logging.handlers
 import argparse
 from typing import Optional
 from datetime import datetime
@@ -27,15 +30,25 @@ load_dotenv()
 for handler in logging.root.handlers[:]:
     logging.root.removeHandler(handler)
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s.%(msecs)03d | %(name)s | %(levelname)s | %(message)s',
+# stdout/file write একটা listener thread-এ — event loop কখনো log I/O-তে block হয় না
+_log_formatter = logging.Formatter(
+    '%(asctime)s.%(msecs)03d | %(name)s | %(levelname)s | %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('bot.log')
-    ]
 )
+_log_sinks = [logging.StreamHandler(sys.stdout), logging.FileHandler('bot.log')]
+for _sink in _log_sinks:
+    _sink.setFormatter(_log_formatter)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_sinks, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# QueueHandler শুধু message বানায়; timestamp/level format sink-এ হয়
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.DEBUG, handlers=[_log_queue_handler])
 logging.getLogger('httpx').setLevel(logging.WARNING)
 logging.getLogger('ccxt').setLevel(logging.WARNING)
 logging.getLogger('aiohttp').setLevel(logging.WARNING)
@@ -108,16 +121,17 @@ async def debug_status():
         return {"error": "Engine not initialized"}
     return {
         "btc_data_ready": engine._btc_data_ready,
-        "btc_15m_candles": len(engine.btc_cache.get("15m", [])),
-        "btc_1h_candles": len(engine.btc_cache.get("1h", [])),
-        "btc_4h_candles": len(engine.btc_cache.get("4h", [])),
+        "btc_15m_candles": len(engine.cache.get_ohlcv_view("BTC/USDT", "15m")),
+        "btc_1h_candles": len(engine.cache.get_ohlcv_view("BTC/USDT", "1h")),
+        "btc_4h_candles": len(engine.cache.get_ohlcv_view("BTC/USDT", "4h")),
         "market_type": str(engine.market_type),
         "daily_signals": engine.daily_signals,
         "paper_trading": engine.paper_trading,
         "paper_pnl": engine._paper_pnl if engine.paper_trading else None,
         "adaptive_threshold": engine._adaptive_threshold,
         "ws_status": engine.ws_manager.get_status(),
-        "last_signal_time": {k: v.isoformat() for k, v in engine.last_signal_time.items()}
+        # engine.last_signal_time candle tick time — wall-clock ISO copy state থেকে
+        "last_signal_time": dict(engine.state.state.get("last_signal_time", {}))
     }
 
 
@@ -131,6 +145,8 @@ async def hot_reload_config():
         import importlib
         import config as cfg_module
         importlib.reload(cfg_module)
+        if engine:
+            engine._recompute_limits()
         logger.info("🔄 Config hot-reloaded")
         return {
             "status": "reloaded",
@@ -269,10 +285,10 @@ async def startup_event():
             logger.warning(f"Permission check failed (non-fatal): {e}")
 
         # Scheduler in background
-        asyncio.create_task(scheduler.start())
+        _spawn(scheduler.start())
 
         # BTC monitor
-        asyncio.create_task(monitor_btc_data())
+        _spawn(monitor_btc_data())
 
         logger.info("=" * 60)
         logger.info("✅ All systems running!")
@@ -284,17 +300,28 @@ async def startup_event():
         raise
 
 
+# Fire-and-forget task গুলোর strong reference — GC/exception loss এড়াতে
+_bg_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+    return task
+
+
 async def monitor_btc_data():
     """Periodically check and refresh BTC data"""
     while True:
         await asyncio.sleep(60)
         if engine:
             ready = engine._btc_data_ready
-            count = len(engine.btc_cache.get("15m", []))
+            count = len(engine.cache.get_ohlcv_view("BTC/USDT", "15m"))
             logger.info(f"📊 BTC: ready={ready}, candles={count}")
             if not ready and count < 30:
                 logger.info("🔄 Retrying BTC data fetch...")
-                asyncio.create_task(engine._force_fetch_btc_data())
+                _spawn(engine._force_fetch_btc_data())
 
 
 @app.on_event("shutdown")
@@ -312,6 +339,20 @@ async def shutdown_event():
 
 # ==================== CLI Modes ====================
 
+def _install_uvloop():
+    """
+    uvloop (libuv) installed থাকলে asyncio-র বদলে — WS/REST socket dispatch কম overhead।
+    Linux/macOS only; Windows-এ বা না থাকলে stock asyncio loop-ই থাকে।
+    Web mode-এ (Procfile/uvicorn.run) uvicorn-এর loop="auto" নিজেই uvloop নেয়।
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("⚡ uvloop event loop enabled")
+
+
 async def run_worker():
     """Worker mode — no HTTP server, background tasks only"""
     global engine, scheduler, orchestrator, telegram
@@ -445,6 +486,9 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.mode in ("worker", "backtest"):
+        _install_uvloop()
+
     if args.mode == "worker":
         asyncio.run(run_worker())
 
@@ -460,7 +504,8 @@ Examples:
             host="0.0.0.0",
             port=port,
             reload=False,
-            log_level="info"
+            log_level="info",
+            loop="auto",   # uvloop installed থাকলে সেটাই
         )
 
 
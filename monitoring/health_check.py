@@ -4,6 +4,7 @@ Monitors bot health and component status
 """
 
 import logging
+import time
 import psutil
 import platform
 from typing import Dict, Any, Optional
@@ -12,6 +13,9 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# /health liveness probe ঘন ঘন poll করে — এই সময়ের মধ্যে last result reuse
+HEALTH_TTL = 2.0
+
 
 class HealthChecker:
     """
@@ -25,11 +29,20 @@ class HealthChecker:
         self.last_check = datetime.now()
         self.consecutive_failures = 0
         self.status_history = []
+        # Static host info + Process handle একবারই
+        self._process = psutil.Process()
+        self._system_info = self._get_system_info()
+        # (monotonic ts, last health dict)
+        self._health_cache = (0.0, {})
         
     async def check(self) -> Dict[str, Any]:
         """
-        Perform comprehensive health check
+        Perform comprehensive health check (HEALTH_TTL সেকেন্ড memoized)
         """
+        ts, cached = self._health_cache
+        if cached and time.monotonic() - ts < HEALTH_TTL:
+            return cached
+
         self.last_check = datetime.now()
         
         health = {
@@ -37,12 +50,15 @@ class HealthChecker:
             "timestamp": self.last_check.isoformat(),
             "uptime": str(datetime.now() - self.start_time).split('.')[0],
             "components": {},
-            "system": self._get_system_info(),
+            "system": self._system_info,
             "warnings": [],
             "errors": []
         }
         
-        # Check engine
+        failures_before = self.consecutive_failures
+
+        # Check engine — get_status() একবারই; ws fields এখান থেকেই reuse
+        engine_status = None
         try:
             engine_status = self.engine.get_status()
             health["components"]["engine"] = "ok"
@@ -65,9 +81,12 @@ class HealthChecker:
         # Check WebSocket if available
         if hasattr(self.engine, 'ws_manager'):
             try:
-                ws_status = self.engine.ws_manager.get_status()
-                health["components"]["websocket"] = "ok" if ws_status.get("connected") else "warning"
-                if not ws_status.get("connected"):
+                if engine_status is not None:
+                    connected = engine_status.get("ws_connected")
+                else:
+                    connected = self.engine.ws_manager.get_status().get("connected")
+                health["components"]["websocket"] = "ok" if connected else "warning"
+                if not connected:
                     health["warnings"].append("WebSocket disconnected")
             except Exception as e:
                 health["components"]["websocket"] = "error"
@@ -89,11 +108,15 @@ class HealthChecker:
         if memory["percent"] > 80:
             health["warnings"].append(f"High memory usage: {memory['percent']}%")
         
-        # Determine overall status
-        if len(health["errors"]) > 0:
-            health["status"] = "degraded"
+        # Determine overall status — counter read, no component scan
+        # "consecutive": clean engine+scheduler check হলে streak reset
+        # (আগে কখনো reset হত না — 6টা failure-এর পর চিরকাল critical)
+        if failures_before == self.consecutive_failures:
+            self.consecutive_failures = 0
         if self.consecutive_failures > 5:
             health["status"] = "critical"
+        elif health["errors"]:
+            health["status"] = "degraded"
         
         # Store in history
         self.status_history.append({
@@ -106,7 +129,8 @@ class HealthChecker:
         # Keep history manageable
         if len(self.status_history) > 100:
             self.status_history = self.status_history[-100:]
-        
+
+        self._health_cache = (time.monotonic(), health)
         return health
     
     def _get_system_info(self) -> Dict[str, Any]:
@@ -116,19 +140,20 @@ class HealthChecker:
             "platform": platform.platform(),
             "cpu_count": psutil.cpu_count(),
             "memory_total": round(psutil.virtual_memory().total / (1024**3), 2),  # GB
-            "process_id": psutil.Process().pid
+            "process_id": self._process.pid
         }
     
     def _check_memory(self) -> Dict[str, Any]:
         """Check memory usage"""
-        process = psutil.Process()
+        process = self._process
         memory_info = process.memory_info()
         
         return {
             "rss_mb": round(memory_info.rss / (1024**2), 2),
             "vms_mb": round(memory_info.vms / (1024**2), 2),
             "percent": process.memory_percent(),
-            "cpu_percent": process.cpu_percent(interval=0.1)
+            # interval=None: last call থেকে non-blocking — আগে 0.1s event loop block করত
+            "cpu_percent": process.cpu_percent(interval=None)
         }
     
     def is_healthy(self) -> bool:
@@ -22,6 +22,11 @@ from notification.templates import MessageTemplates
 
 logger = logging.getLogger(__name__)
 
+# Queue batching: একবারে যত message জমে আছে (max 10) এক send-এ merge
+QUEUE_BATCH_MAX = 10
+TELEGRAM_MAX_LEN = 4096
+BATCH_SEPARATOR = "\n---\n"
+
 
 class TelegramNotifier:
     """
@@ -40,6 +45,8 @@ class TelegramNotifier:
         # Message queue
         self.message_queue = asyncio.Queue()
         self._worker_task = None
+        # Batch-এ merge করা গেল না এমন item — পরের round-এ প্রথমে যায়
+        self._carry = None
 
         # ✅ FIX BUG-25: Lazy initialization — __init__ এ crash না করে
         # Bot object পরে তৈরি হবে, এখন শুধু token validate করো
@@ -106,11 +113,38 @@ class TelegramNotifier:
                 pass
         logger.info("Telegram notifier stopped")
 
+    def _next_batch(self, first):
+        """
+        Queue-batching: প্রথম item-এর সাথে এখনই queue-তে থাকা compatible
+        message গুলো (same chat + parse_mode, no extra kwargs) এক text-এ জোড়া।
+        অপেক্ষা করে না — burst হলে merge, একা হলে সঙ্গে সঙ্গে send।
+        """
+        chat_id, text, parse_mode, kwargs = first
+        parts = [text]
+        size = len(text)
+        if not kwargs:
+            while len(parts) < QUEUE_BATCH_MAX and not self.message_queue.empty():
+                item = self.message_queue.get_nowait()
+                self.message_queue.task_done()
+                c, t, pm, kw = item
+                if (c, pm) != (chat_id, parse_mode) or kw \
+                        or size + len(BATCH_SEPARATOR) + len(t) > TELEGRAM_MAX_LEN:
+                    self._carry = item
+                    break
+                parts.append(t)
+                size += len(BATCH_SEPARATOR) + len(t)
+        return chat_id, BATCH_SEPARATOR.join(parts), parse_mode, kwargs
+
     async def _worker(self):
-        """Background worker to send queued messages"""
+        """Background worker to send queued messages (burst-এ merged batch)"""
         while True:
             try:
-                chat_id, text, parse_mode, kwargs = await self.message_queue.get()
+                if self._carry is not None:
+                    first, self._carry = self._carry, None
+                else:
+                    first = await self.message_queue.get()
+                    self.message_queue.task_done()
+                chat_id, text, parse_mode, kwargs = self._next_batch(first)
 
                 # Rate limiting
                 elapsed = (datetime.now() - self.last_message_time).total_seconds()
@@ -118,7 +152,6 @@ class TelegramNotifier:
                     await asyncio.sleep(self.min_interval - elapsed)
 
                 await self._send_raw(chat_id, text, parse_mode, **kwargs)
-                self.message_queue.task_done()
 
             except asyncio.CancelledError:
                 break
@@ -4,8 +4,8 @@ Pre-defined message templates for common notifications
 """
 
 from datetime import datetime
-import pytz
 import config  # 🔴 Important: config import must be here
+from core.constants import IST_TZ
 
 
 class MessageTemplates:
@@ -16,7 +16,7 @@ class MessageTemplates:
     @staticmethod
     def startup_message() -> str:
         """Bot startup message"""
-        now = datetime.now(pytz.timezone('Asia/Kolkata'))
+        now = datetime.now(IST_TZ)
         
         return f"""
 🚀 <b>ARUNABHA ALGO BOT v4.0</b> 🚀
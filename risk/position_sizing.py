@@ -148,7 +148,7 @@ class PositionSizer:
             risk_pct = kelly_f * 100  # Kelly fraction → percentage
             sizing_method = f"Kelly({kelly_f*100:.1f}%)"
         else:
-            risk_pct = custom_risk_pct if custom_risk_pct else config.RISK_PER_TRADE
+            risk_pct = custom_risk_pct if custom_risk_pct else config.CFG.risk_per_trade
             sizing_method = f"Fixed({risk_pct}%)"
 
         risk_amount = account_size * (risk_pct / 100)
@@ -212,7 +212,7 @@ class PositionSizer:
         }
 
     def _apply_atr_adjustment(self, position_usd: float, atr_pct: float) -> float:
-        if atr_pct > config.MAX_ATR_PCT:
+        if atr_pct > config.CFG.max_atr_pct:
             return 0
         if atr_pct > 2.5:
             return position_usd * 0.5
@@ -97,7 +97,7 @@ class RiskManager:
     ) -> Optional[Dict]:
         can_trade, reason = self.can_trade(symbol, market_type)
         if not can_trade:
-            logger.debug(f"Trade rejected: {reason}")
+            logger.debug("Trade rejected: %s", reason)
             return None
 
         position = self.position_sizer.calculate(
@@ -178,7 +178,7 @@ class RiskManager:
         # ─── ISSUE 16: Trailing Stop ──────────────────────────────────
         atr = trade.get("atr", 0)
         if atr > 0 and current_r >= 1.0:
-            trail_mult = config.TRAILING_STOP_ATR_MULT
+            trail_mult = config.CFG.trailing_stop_atr_mult
             trade["trailing_active"] = True
 
             if direction == TradeDirection.LONG:
@@ -187,7 +187,7 @@ class RiskManager:
                 if new_trail_sl > trade["trailing_sl"]:
                     trade["trailing_sl"] = new_trail_sl
                     trade["stop_loss"] = new_trail_sl
-                    logger.debug(f"Trailing SL moved to {new_trail_sl:.6f}")
+                    logger.debug("Trailing SL moved to %.6f", new_trail_sl)
             else:
                 trade["lowest_price"] = min(trade["lowest_price"], current_price)
                 new_trail_sl = trade["lowest_price"] + (atr * trail_mult)
@@ -196,7 +196,7 @@ class RiskManager:
                     trade["stop_loss"] = new_trail_sl
 
         # ─── ISSUE 2: Partial Exit at 1R ──────────────────────────────
-        if current_r >= config.PARTIAL_EXIT_AT_R and not trade["partial_exit_done"]:
+        if current_r >= config.CFG.partial_exit_at_r and not trade["partial_exit_done"]:
             trade["partial_exit_done"] = True
             # Actually reduce position size by 50%
             original_size = trade["position_usd"]
@@ -212,7 +212,7 @@ class RiskManager:
             logger.info(f"⚡ Partial exit {symbol}: {result['message']}")
 
         # ─── Break Even at 0.5R ───────────────────────────────────────
-        if current_r >= config.BREAK_EVEN_AT_R and not trade["be_triggered"]:
+        if current_r >= config.CFG.break_even_at_r and not trade["be_triggered"]:
             trade["be_triggered"] = True
             trade["stop_loss"] = trade["entry"]
             trade["trailing_sl"] = trade["entry"]
@@ -107,37 +107,37 @@ class SignalScorer:
         
         requirements = {
             SignalGrade.APLUS: {
-                "min_score": 90,
+                "min_score": SignalGrade.APLUS.min_score,
                 "min_rr": 2.5,
                 "structure_required": "STRONG",
                 "description": "Exceptional signal - must trade"
             },
             SignalGrade.A: {
-                "min_score": 80,
+                "min_score": SignalGrade.A.min_score,
                 "min_rr": 2.0,
                 "structure_required": "STRONG",
                 "description": "Strong signal - should trade"
             },
             SignalGrade.BPLUS: {
-                "min_score": 70,
+                "min_score": SignalGrade.BPLUS.min_score,
                 "min_rr": 1.8,
                 "structure_required": "MODERATE",
                 "description": "Good signal - consider trading"
             },
             SignalGrade.B: {
-                "min_score": 60,
+                "min_score": SignalGrade.B.min_score,
                 "min_rr": 1.5,
                 "structure_required": "MODERATE",
                 "description": "Decent signal - could trade"
             },
             SignalGrade.C: {
-                "min_score": 50,
+                "min_score": SignalGrade.C.min_score,
                 "min_rr": 1.2,
                 "structure_required": "WEAK",
                 "description": "Weak signal - avoid"
             },
             SignalGrade.D: {
-                "min_score": 0,
+                "min_score": SignalGrade.D.min_score,
                 "min_rr": 1.0,
                 "structure_required": "WEAK",
                 "description": "Poor signal - do not trade"
@@ -153,8 +153,8 @@ class SignalScorer:
         reqs = self.get_grade_requirements(grade)
         
         # Check score
-        if score < config.MIN_SIGNAL_SCORE:
-            return False, f"Score too low: {score} < {config.MIN_SIGNAL_SCORE}"
+        if score < config.CFG.min_signal_score:
+            return False, f"Score too low: {score} < {config.CFG.min_signal_score}"
         
         # Check RR
         if rr_ratio < reqs["min_rr"]:
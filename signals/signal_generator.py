@@ -73,7 +73,7 @@ class SignalGenerator:
                 ohlcv_15m, direction, current_price, market_type, levels
             )
             if not risk_params:
-                logger.debug(f"Risk params failed for {symbol}")
+                logger.debug("Risk params failed for %s", symbol)
                 return None
 
             # Score
@@ -87,7 +87,7 @@ class SignalGenerator:
             # Grade check
             grade = SignalGrade.from_score(score_result.score)
             if not grade.can_trade:
-                logger.debug(f"Grade {grade.value} too low for {symbol}")
+                logger.debug("Grade %s too low for %s", grade.value, symbol)
                 return None
 
             # Confidence
@@ -144,7 +144,7 @@ class SignalGenerator:
             # Validate
             errors = self.validator.validate(signal)
             if errors:
-                logger.debug(f"Signal validation failed {symbol}: {errors}")
+                logger.debug("Signal validation failed %s: %s", symbol, errors)
                 return None
 
             logger.info(
@@ -182,11 +182,10 @@ class SignalGenerator:
         if atr <= 0:
             return None
 
-        config_key = market_type.value if market_type.value in config.MARKET_CONFIGS else "trending"
-        market_config = config.MARKET_CONFIGS.get(config_key, config.MARKET_CONFIGS["trending"])
-        sl_mult = market_config.get("sl_mult", config.ATR_SL_MULT)
-        tp_mult = market_config.get("tp_mult", config.ATR_TP_MULT)
-        min_rr = market_config.get("min_rr", config.MIN_RR_RATIO)
+        market_config = config.MARKET_CONFIGS.get(market_type.value) or config.MARKET_CONFIGS["trending"]
+        sl_mult = market_config.sl_mult
+        tp_mult = market_config.tp_mult
+        min_rr = market_config.min_rr
 
         # Bounds
         min_sl_dist = atr * 0.5
@@ -112,14 +112,14 @@ class SignalValidator:
 
         # --- 8. RR ratio checks ---
         rr = signal.get("rr_ratio", 0)
-        if rr < config.MIN_RR_RATIO:
-            errors.append(f"RR too low: {rr:.2f} < {config.MIN_RR_RATIO} minimum")
+        if rr < config.CFG.min_rr_ratio:
+            errors.append(f"RR too low: {rr:.2f} < {config.CFG.min_rr_ratio} minimum")
         if rr > self.max_rr_ratio:
             errors.append(f"RR unrealistic: {rr:.2f} > {self.max_rr_ratio} maximum")
 
         # --- 9. Score check ---
-        if score < config.MIN_SIGNAL_SCORE:
-            errors.append(f"Score too low: {score:.1f} < {config.MIN_SIGNAL_SCORE} minimum")
+        if score < config.CFG.min_signal_score:
+            errors.append(f"Score too low: {score:.1f} < {config.CFG.min_signal_score} minimum")
 
         # --- 10. Grade D block ---
         if grade == "D":
@@ -160,8 +160,8 @@ class SignalValidator:
 
         if symbol in last_signals:
             elapsed = (datetime.now() - last_signals[symbol]).total_seconds() / 60
-            if elapsed < config.COOLDOWN_MINUTES:
-                return False, f"Cooldown: {elapsed:.1f}/{config.COOLDOWN_MINUTES} minutes"
+            if elapsed < config.CFG.cooldown_minutes:
+                return False, f"Cooldown: {elapsed:.1f}/{config.CFG.cooldown_minutes} minutes"
 
         return True, "OK"
 
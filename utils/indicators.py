@@ -115,38 +115,53 @@ def calculate_atr(ohlcv: List[List[float]], period: int = 14) -> float:
     """Wilder's ATR"""
     if len(ohlcv) < period + 1:
         return 0.0
-    trs = []
-    for i in range(1, len(ohlcv)):
-        h, l, pc = float(ohlcv[i][2]), float(ohlcv[i][3]), float(ohlcv[i-1][4])
-        trs.append(max(h - l, abs(h - pc), abs(l - pc)))
-    atr = sum(trs[:period]) / period
-    for tr in trs[period:]:
-        atr = (atr * (period - 1) + tr) / period
+    # Single pass — TR list materialize হয় না
+    atr = 0.0
+    pc = float(ohlcv[0][4])
+    for i, c in enumerate(ohlcv[1:]):
+        h, l = float(c[2]), float(c[3])
+        tr = max(h - l, abs(h - pc), abs(l - pc))
+        pc = float(c[4])
+        if i < period:
+            atr += tr
+            if i == period - 1:
+                atr /= period
+        else:
+            atr = (atr * (period - 1) + tr) / period
     return atr
 
 
 def calculate_adx(ohlcv: List[List[float]], period: int = 14) -> float:
-    """Wilder's ADX"""
+    """Wilder's ADX — one streaming pass, no highs/lows/closes/TR/DM temp lists"""
     if len(ohlcv) < period + 1:
         return 20.0
-    highs = [float(c[2]) for c in ohlcv]
-    lows  = [float(c[3]) for c in ohlcv]
-    closes = [float(c[4]) for c in ohlcv]
-    trs, pdms, mdms = [], [], []
-    for i in range(1, len(ohlcv)):
-        tr = max(highs[i]-lows[i], abs(highs[i]-closes[i-1]), abs(lows[i]-closes[i-1]))
-        up = highs[i] - highs[i-1]
-        dn = lows[i-1] - lows[i]
-        trs.append(tr)
-        pdms.append(up if up > dn and up > 0 else 0.0)
-        mdms.append(dn if dn > up and dn > 0 else 0.0)
-    atr = sum(trs[:period]) / period
-    pdm = sum(pdms[:period]) / period
-    mdm = sum(mdms[:period]) / period
-    for i in range(period, len(trs)):
-        atr = (atr * (period-1) + trs[i]) / period
-        pdm = (pdm * (period-1) + pdms[i]) / period
-        mdm = (mdm * (period-1) + mdms[i]) / period
+    atr = pdm = mdm = 0.0
+    prev_high = float(ohlcv[0][2])
+    prev_low = float(ohlcv[0][3])
+    prev_close = float(ohlcv[0][4])
+    for i, c in enumerate(ohlcv[1:]):
+        high = float(c[2])
+        low = float(c[3])
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        up = high - prev_high
+        dn = prev_low - low
+        pd_ = up if up > dn and up > 0 else 0.0
+        md_ = dn if dn > up and dn > 0 else 0.0
+        prev_high, prev_low, prev_close = high, low, float(c[4])
+
+        if i < period:
+            # Seed = প্রথম `period` value-র simple average
+            atr += tr
+            pdm += pd_
+            mdm += md_
+            if i == period - 1:
+                atr /= period
+                pdm /= period
+                mdm /= period
+        else:
+            atr = (atr * (period-1) + tr) / period
+            pdm = (pdm * (period-1) + pd_) / period
+            mdm = (mdm * (period-1) + md_) / period
     if atr == 0:
         return 20.0
     pdi = (pdm / atr) * 100